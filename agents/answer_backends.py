@@ -0,0 +1,384 @@
+"""
+Answer backends: Produce FAQ answer text for (context, product fields) prompts.
+Responsibility: Answer text only - FAQ pages are assembled by FAQPageAgent.
+
+An AnswerBackend answers a batch of prompts in one call (e.g. one request
+to a local model server). AnswerService sits in front of it:
+- prompts are deduplicated: questions sharing a context (all four Usage
+  questions read usage_instructions) and products whose fields are
+  identical for a context share one prompt
+- answers are cached in a bounded LRU, optionally backed by a SQLite file
+  so they survive across runs
+- misses are sent in batches of up to max_batch_size prompts, at most
+  max_concurrency batches at a time, each with a timeout; a call waits
+  for all of its batches against one deadline
+
+Prompts whose batch fails or times out get no answer; FAQPageAgent then
+falls back to its local answer table for them.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from models import Product
+
+
+# Product fields each question context's answer reads
+ANSWER_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "concentration": ("name", "concentration"),
+    "key_ingredients": ("key_ingredients",),
+    "skin_types": ("skin_types",),
+    "benefits": ("benefits",),
+    "usage_instructions": ("usage_instructions",),
+    "side_effects": ("side_effects",),
+    "price": ("price",),
+}
+
+# Answers kept in memory by an AnswerCache unless configured otherwise
+DEFAULT_ANSWER_CACHE_SIZE = 65536
+
+_ANSWER_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    answer TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class AnswerPrompt(NamedTuple):
+    """One answer request: a question context and the product fields it reads."""
+    context: str
+    fields: Tuple[Tuple[str, Any], ...]  # (field name, value) pairs; lists as tuples
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form sent to remote backends."""
+        return {"context": self.context, "fields": dict(self.fields)}
+
+
+def answer_prompt(context: str, product: Product) -> AnswerPrompt:
+    """
+    Build the prompt for one context of a product.
+
+    Raises:
+        KeyError: If the context has no entry in ANSWER_FIELDS
+    """
+    return AnswerPrompt(
+        context,
+        tuple(
+            (name, tuple(value) if value.__class__ is list else value)
+            for name, value in ((name, getattr(product, name)) for name in ANSWER_FIELDS[context])
+        ),
+    )
+
+
+class AnswerBackend:
+    """
+    Answers batches of prompts. Subclasses implement answer_batch.
+    """
+
+    # Identifies the backend's answers (model and prompt version) in cache
+    # keys and incremental fingerprints; change it when answers change
+    model = "base"
+
+    # Most prompts the backend accepts per call
+    max_batch_size = 64
+
+    def answer_batch(self, prompts: Sequence[AnswerPrompt], timeout: Optional[float] = None) -> List[str]:
+        """
+        Answer a batch of prompts in one call.
+
+        Args:
+            prompts: Distinct prompts
+            timeout: Seconds the call may take (the backend should give up
+                after it; AnswerService stops waiting either way)
+
+        Returns:
+            One answer per prompt, in order
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release connections."""
+
+
+class HTTPAnswerBackend(AnswerBackend):
+    """
+    Client of a local model server speaking JSON over HTTP.
+
+    Each batch is one POST of {"model": ..., "prompts": [{"context": ...,
+    "fields": {...}}, ...]}; the server replies {"answers": [...]} in
+    prompt order.
+    """
+
+    def __init__(self, url: str, model: str = "default", max_batch_size: int = 64):
+        """
+        Initialize client.
+
+        Args:
+            url: Endpoint answering prompt batches
+            model: Model name sent with each batch (also the cache identity)
+            max_batch_size: Most prompts per request
+
+        Raises:
+            ValueError: If max_batch_size is not positive
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self.url = url
+        self.model = model
+        self.max_batch_size = max_batch_size
+
+    def answer_batch(self, prompts: Sequence[AnswerPrompt], timeout: Optional[float] = None) -> List[str]:
+        """
+        Answer a batch of prompts with one request.
+
+        Raises:
+            ValueError: If the server returns a different number of answers
+            OSError: If the request fails or times out
+        """
+        body = json.dumps(
+            {"model": self.model, "prompts": [prompt.to_dict() for prompt in prompts]},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            answers = json.loads(response.read())["answers"]
+        if len(answers) != len(prompts):
+            raise ValueError(f"Answer server returned {len(answers)} answers for {len(prompts)} prompts")
+        return answers
+
+
+class AnswerCache:
+    """
+    Bounded LRU of answers by (model, prompt), with an optional SQLite tier
+    that keeps answers across runs. Not thread-safe; AnswerService locks it.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_ANSWER_CACHE_SIZE, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Answers kept in memory (least recently used are evicted)
+            path: SQLite file for the on-disk tier (default: memory only)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"Answer cache needs at least one entry, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, AnswerPrompt], str]" = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def get_many(self, model: str, prompts: Iterable[AnswerPrompt]) -> Dict[AnswerPrompt, str]:
+        """
+        Cached answers of the prompts that have one.
+
+        Args:
+            model: Backend model identity
+            prompts: Distinct prompts
+
+        Returns:
+            Dictionary of prompt -> answer, without the misses
+        """
+        entries = self._entries
+        found = {}
+        missing = []
+        for prompt in prompts:
+            answer = entries.get((model, prompt))
+            if answer is not None:
+                entries.move_to_end((model, prompt))
+                found[prompt] = answer
+            else:
+                missing.append(prompt)
+        self.hits += len(found)
+
+        if missing and self.path is not None:
+            connection = self._connect()
+            still_missing = []
+            for prompt in missing:
+                row = connection.execute("SELECT answer FROM answers WHERE key = ?", (self._disk_key(model, prompt),)).fetchone()
+                if row is None:
+                    still_missing.append(prompt)
+                    continue
+                found[prompt] = row[0]
+                self._remember(model, prompt, row[0])
+                self.disk_hits += 1
+            missing = still_missing
+        self.misses += len(missing)
+        return found
+
+    def put_many(self, model: str, answers: Dict[AnswerPrompt, str]) -> None:
+        """Store new answers in memory and, if enabled, on disk (one transaction)."""
+        for prompt, answer in answers.items():
+            self._remember(model, prompt, answer)
+        if answers and self.path is not None:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO answers (key, answer) VALUES (?, ?)",
+                    [(self._disk_key(model, prompt), answer) for prompt, answer in answers.items()],
+                )
+
+    def close(self) -> None:
+        """Close the disk tier. The memory tier stays usable."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _remember(self, model: str, prompt: AnswerPrompt, answer: str) -> None:
+        entries = self._entries
+        entries[(model, prompt)] = answer
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Worker processes may share the file; wait for their transactions
+            self._connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._connection.execute(_ANSWER_CACHE_SCHEMA)
+        return self._connection
+
+    @staticmethod
+    def _disk_key(model: str, prompt: AnswerPrompt) -> str:
+        data = json.dumps([model, prompt.context, prompt.fields], ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class AnswerService:
+    """
+    Deduplicating, caching, batching front end of an AnswerBackend.
+    Safe to call from several threads (e.g. page graph node workers).
+    """
+
+    def __init__(
+        self,
+        backend: AnswerBackend,
+        cache: Optional[AnswerCache] = None,
+        max_concurrency: int = 4,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            backend: Backend answering cache misses
+            cache: Answer cache (default: a memory-only AnswerCache)
+            max_concurrency: Backend calls in flight at a time
+            timeout: Seconds each backend call may take; a request for
+                several batches waits at most one timeout per round of
+                max_concurrency batches
+
+        Raises:
+            ValueError: If max_concurrency or timeout is not positive
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        self.backend = backend
+        self.cache = cache if cache is not None else AnswerCache()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.requested = 0
+        self.backend_calls = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def answers(self, prompts: Iterable[AnswerPrompt]) -> Dict[AnswerPrompt, str]:
+        """
+        Answer prompts, calling the backend only for distinct cache misses.
+
+        Args:
+            prompts: Prompts, duplicates allowed
+
+        Returns:
+            Dictionary of prompt -> answer; prompts whose backend call
+            failed or timed out are left out
+        """
+        model = self.backend.model
+        prompts = list(prompts)
+        with self._lock:
+            self.requested += len(prompts)
+            found = self.cache.get_many(model, dict.fromkeys(prompts))
+        missing = [prompt for prompt in dict.fromkeys(prompts) if prompt not in found]
+        if not missing:
+            return found
+
+        size = self.backend.max_batch_size
+        batches = [missing[start:start + size] for start in range(0, len(missing), size)]
+        with self._lock:
+            # Submitted under the lock so a concurrent executor swap cannot interleave
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_concurrency)
+            executor = self._executor
+            futures = [executor.submit(self.backend.answer_batch, batch, self.timeout) for batch in batches]
+
+        # One deadline for the whole request: a timeout per round of batches
+        rounds = -(-len(batches) // self.max_concurrency)
+        _, pending = wait(futures, timeout=self.timeout * rounds)
+        stuck = [future for future in pending if not future.cancel()]
+        if stuck:
+            # Calls still running past the deadline must not hold up later
+            # requests: leave them to finish on the old threads
+            with self._lock:
+                if self._executor is executor:
+                    executor.shutdown(wait=False)
+                    self._executor = None
+
+        answered = {}
+        failed = 0
+        for batch, future in zip(batches, futures):
+            if future in pending or future.exception() is not None:
+                # Timed out or failed; these prompts fall back to local answers
+                failed += len(batch)
+            else:
+                answered.update(zip(batch, future.result()))
+        with self._lock:
+            self.backend_calls += len(batches)
+            self.failed += failed
+            self.cache.put_many(model, answered)
+        found.update(answered)
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, cache and backend counters for reporting."""
+        cache = self.cache
+        return {
+            "requested": self.requested,
+            "hits": cache.hits,
+            "disk_hits": cache.disk_hits,
+            "misses": cache.misses,
+            "backend_calls": self.backend_calls,
+            "failed": self.failed,
+        }
+
+    def take_counts(self) -> Dict[str, int]:
+        """Return the counters and reset them (e.g. per worker chunk)."""
+        with self._lock:
+            counts = self.stats()
+            self.requested = self.backend_calls = self.failed = 0
+            self.cache.hits = self.cache.disk_hits = self.cache.misses = 0
+        return counts
+
+    def close(self) -> None:
+        """Stop the call threads and close the cache's disk tier and the backend."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.cache.close()
+        self.backend.close()
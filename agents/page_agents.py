@@ -3,7 +3,7 @@ Page Assembly Agents: Generate specific page types.
 Each agent assembles pages from logic blocks and templates.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 from models import (
     Product,
     Question,
@@ -22,6 +22,45 @@ from logic_blocks.blocks import (
     IngredientLogicBlock,
     PriceLogicBlock,
 )
+from agents.answer_backends import ANSWER_FIELDS, AnswerService, answer_prompt
+from logic_blocks import comparison
+from logic_blocks.comparison import ComparisonEngine
+
+
+class FAQAnswerTable(dict):
+    """
+    Context -> answer table for one product.
+    Each answer is formatted on first lookup and reused for every later
+    question with the same context.
+    """
+
+    __slots__ = ("product", "fallbacks")
+
+    # Answer formatters by question context (the product field a question asks about)
+    formatters = {
+        "concentration": lambda product: f"The concentration of {product.name} is {product.concentration}.",
+        "key_ingredients": lambda product: f"Key ingredients include: {', '.join(product.key_ingredients)}.",
+        "skin_types": lambda product: f"Suitable for {', '.join(product.skin_types)} skin types.",
+        "benefits": lambda product: f"Main benefits: {', '.join(product.benefits)}.",
+        "usage_instructions": lambda product: product.usage_instructions,
+        "side_effects": lambda product: f"Common experiences include: {', '.join(product.side_effects) if product.side_effects else 'No major side effects commonly reported.'}",
+        "price": lambda product: f"The price is {product.price}.",
+    }
+
+    def __init__(self, product: Product):
+        """
+        Initialize an empty table.
+
+        Args:
+            product: Product model the answers describe
+        """
+        super().__init__()
+        self.product = product
+        self.fallbacks = 0  # Contexts the answer service left unanswered
+
+    def __missing__(self, context: str) -> str:
+        answer = self[context] = self.formatters[context](self.product)
+        return answer
 
 
 class FAQPageAgent:
@@ -30,15 +69,43 @@ class FAQPageAgent:
     Generates at least 5 Q&A pairs.
     """
 
-    def __init__(self):
-        """Initialize FAQ agent."""
+    # Product fields read directly (answers are built from product data)
+    input_fields = (
+        "name",
+        "concentration",
+        "skin_types",
+        "key_ingredients",
+        "benefits",
+        "usage_instructions",
+        "side_effects",
+        "price",
+    )
+
+    # Helper code the page depends on (part of code version stamps)
+    code_dependencies = (FAQAnswerTable,)
+
+    def __init__(self, answer_service: Optional[AnswerService] = None):
+        """
+        Initialize FAQ agent.
+
+        Args:
+            answer_service: Backend answers for the contexts in ANSWER_FIELDS
+                (default: answers are formatted locally by FAQAnswerTable)
+        """
         self.min_faqs = 5
+        self.max_faqs = 15
+        self.answer_service = answer_service
+        if answer_service is not None:
+            # Answers now also depend on the backend
+            self.code_dependencies = FAQPageAgent.code_dependencies + (type(answer_service.backend),)
+            self.content_settings = (answer_service.backend.model,)
 
     def generate(
         self,
         product: Product,
         questions: List[Question],
         logic_blocks: Dict[str, ContentFragment],
+        answers: Optional[FAQAnswerTable] = None,
     ) -> FAQPage:
         """
         Generate FAQ page.
@@ -47,22 +114,111 @@ class FAQPageAgent:
             product: Product model
             questions: Generated questions
             logic_blocks: Content fragments from logic blocks
+            answers: The product's answer table from prefetch_answers
+                (default: resolved here, asking the answer service if any)
 
         Returns:
             FAQPage with Q&A items
         """
-        faq_items = []
-
-        # Generate FAQ items from questions
-        for question in questions[:15]:  # Use generated questions
-            answer = self._generate_answer(question, product, logic_blocks)
-            faq_items.append(
-                FAQItem(
-                    question=question.question,
-                    answer=answer,
-                    category=question.category,
-                )
+        if answers is None:
+            if self.answer_service is None:
+                answers = FAQAnswerTable(product)
+            else:
+                answers = self._answer_tables([product], [questions])[0]
+        return self._assemble(product, questions, answers)
+
+    def generate_batch(
+        self,
+        products: Sequence[Product],
+        questions: Sequence[List[Question]],
+        logic_blocks: Optional[Sequence[Dict[str, ContentFragment]]] = None,
+    ) -> List[FAQPage]:
+        """
+        Generate FAQ pages for many products in one pass. With an answer
+        service, the answers of all products are resolved together.
+
+        Args:
+            products: Product models
+            questions: Generated questions, one list per product
+            logic_blocks: Content fragments, one mapping per product (unused
+                by FAQ answers; accepted for symmetry with generate)
+
+        Returns:
+            FAQPage per product, in input order
+
+        Raises:
+            ValueError: If products and questions differ in length
+        """
+        if len(products) != len(questions):
+            raise ValueError(f"Got {len(products)} products but {len(questions)} question lists")
+        if self.answer_service is None:
+            return [
+                self._assemble(product, product_questions, FAQAnswerTable(product))
+                for product, product_questions in zip(products, questions)
+            ]
+        tables = self._answer_tables(products, questions)
+        return [
+            self._assemble(product, product_questions, answers)
+            for product, product_questions, answers in zip(products, questions, tables)
+        ]
+
+    def prefetch_answers(
+        self,
+        products: Sequence[Product],
+        questions: Sequence[List[Question]],
+    ) -> List[FAQAnswerTable]:
+        """
+        Resolve the backend answers of many products in batched calls.
+        Pass each table to generate: answers the backend failed to give
+        then fall back to local answers without asking it again.
+
+        Args:
+            products: Product models
+            questions: Generated questions, one list per product
+
+        Returns:
+            FAQAnswerTable per product, in input order (local tables
+            without an answer service)
+        """
+        if self.answer_service is None:
+            return [FAQAnswerTable(product) for product in products]
+        return self._answer_tables(products, questions)
+
+    def _answer_tables(
+        self,
+        products: Sequence[Product],
+        questions: Sequence[List[Question]],
+    ) -> List[FAQAnswerTable]:
+        """Answer tables pre-filled with the service's answers (one service call for all products)."""
+        tables = []
+        prompts = []
+        for product, product_questions in zip(products, questions):
+            tables.append(FAQAnswerTable(product))
+            contexts = dict.fromkeys(
+                question.context for question in product_questions[:self.max_faqs] if question.context in ANSWER_FIELDS
+            )
+            prompts.append([(context, answer_prompt(context, product)) for context in contexts])
+
+        answered = self.answer_service.answers(prompt for product_prompts in prompts for _, prompt in product_prompts)
+        for answers, product_prompts in zip(tables, prompts):
+            for context, prompt in product_prompts:
+                text = answered.get(prompt)
+                if text is not None:
+                    answers[context] = text
+                else:
+                    answers.fallbacks += 1
+        return tables
+
+    def _assemble(self, product: Product, questions: List[Question], answers: FAQAnswerTable) -> FAQPage:
+        """FAQ page from the first max_faqs questions and the product's answer table."""
+        faq_items = [
+            FAQItem(
+                question=question.question,
+                answer=self._generate_answer(question, product, answers),
+                category=question.category,
             )
+            for question in questions[:self.max_faqs]  # Use generated questions
+        ]
 
         # Ensure minimum number of FAQs
         if len(faq_items) < self.min_faqs:
@@ -73,6 +229,7 @@ class FAQPageAgent:
             product_name=product.name,
             total_questions=len(faq_items),
             faqs=faq_items,
+            fallback_answers=answers.fallbacks,
         )
 
         return faq_page
@@ -81,31 +238,21 @@ class FAQPageAgent:
         self,
         question: Question,
         product: Product,
-        logic_blocks: Dict[str, ContentFragment],
+        answers: FAQAnswerTable,
     ) -> str:
         """
-        Generate answer from question context and logic blocks.
+        Generate answer from question context.
 
         Args:
             question: Question object
             product: Product model
-            logic_blocks: Content fragments
+            answers: The product's answer table
 
         Returns:
             Generated answer string
         """
-        answers = {
-            "concentration": f"The concentration of {product.name} is {product.concentration}.",
-            "key_ingredients": f"Key ingredients include: {', '.join(product.key_ingredients)}.",
-            "skin_types": f"Suitable for {', '.join(product.skin_types)} skin types.",
-            "benefits": f"Main benefits: {', '.join(product.benefits)}.",
-            "usage_instructions": product.usage_instructions,
-            "side_effects": f"Common experiences include: {', '.join(product.side_effects) if product.side_effects else 'No major side effects commonly reported.'}",
-            "price": f"The price is {product.price}.",
-        }
-
         # Look for context field in question
-        if question.context in answers:
+        if question.context in FAQAnswerTable.formatters:
             return answers[question.context]
 
         # Default answer based on category
@@ -127,6 +274,9 @@ class ProductPageAgent:
     Combines all logic blocks into a comprehensive product page.
     """
 
+    # Product fields read directly (everything else comes from logic blocks)
+    input_fields = ("name", "concentration", "skin_types")
+
     def generate(
         self,
         product: Product,
@@ -209,13 +359,31 @@ class ProductPageAgent:
 class ComparisonPageAgent:
     """
     Assembles comparison pages between two products.
-    Compares GlowBoost with a fictional Product B.
+    Compares GlowBoost with a fictional Product B, or with a competitor
+    from the catalog (see logic_blocks.similarity).
     """
 
+    # Product fields read directly from product A (and from a catalog product B)
+    input_fields = (
+        "name",
+        "concentration",
+        "key_ingredients",
+        "benefits",
+        "price",
+        "skin_types",
+        "side_effects",
+        "usage_instructions",
+    )
+
+    # Helper code the page depends on (part of code version stamps)
+    code_dependencies = (comparison,)
+
     def __init__(self):
         """Initialize comparison agent."""
         # Create fictional Product B for comparison
         self.product_b = self._create_fictional_product()
+        # Catalog pairs share each product's precomputed half-row
+        self.engine = ComparisonEngine(max_rows=4096)
 
     def _create_fictional_product(self) -> Product:
         """
@@ -236,20 +404,26 @@ class ComparisonPageAgent:
         )
         return product_b
 
-    def generate(self, product_a: Product) -> ComparisonPage:
+    def generate(self, product_a: Product, product_b: Optional[Product] = None) -> ComparisonPage:
         """
         Generate comparison page.
 
         Args:
             product_a: Primary product (GlowBoost)
+            product_b: Competitor, e.g. the most similar catalog product
+                (default: the fictional Product B)
 
         Returns:
             ComparisonPage
         """
+        if product_b is not None:
+            return self.engine.page(product_a, product_b)
+        product_b = self.product_b
+
         comparison_page = ComparisonPage(
             page_type="comparison",
             product_a_name=product_a.name,
-            product_b_name=self.product_b.name,
+            product_b_name=product_b.name,
             comparison_items=[],
         )
 
@@ -258,7 +432,7 @@ class ComparisonPageAgent:
             ComparisonPageItem(
                 attribute="Vitamin C Concentration",
                 product_a=product_a.concentration or "10%",
-                product_b=self.product_b.concentration or "20%",
+                product_b=product_b.concentration or "20%",
             )
         )
 
@@ -267,7 +441,7 @@ class ComparisonPageAgent:
             ComparisonPageItem(
                 attribute="Key Ingredients",
                 product_a=", ".join(product_a.key_ingredients),
-                product_b=", ".join(self.product_b.key_ingredients),
+                product_b=", ".join(product_b.key_ingredients),
             )
         )
 
@@ -276,7 +450,7 @@ class ComparisonPageAgent:
             ComparisonPageItem(
                 attribute="Main Benefits",
                 product_a=", ".join(product_a.benefits),
-                product_b=", ".join(self.product_b.benefits),
+                product_b=", ".join(product_b.benefits),
             )
         )
 
@@ -285,7 +459,7 @@ class ComparisonPageAgent:
             ComparisonPageItem(
                 attribute="Price",
                 product_a=product_a.price,
-                product_b=self.product_b.price,
+                product_b=product_b.price,
             )
         )
 
@@ -294,7 +468,7 @@ class ComparisonPageAgent:
             ComparisonPageItem(
                 attribute="Suitable for Skin Types",
                 product_a=", ".join(product_a.skin_types),
-                product_b=", ".join(self.product_b.skin_types),
+                product_b=", ".join(product_b.skin_types),
             )
         )
 
@@ -312,7 +486,7 @@ class ComparisonPageAgent:
             ComparisonPageItem(
                 attribute="Potential Side Effects",
                 product_a=", ".join(product_a.side_effects) if product_a.side_effects else "Minimal",
-                product_b=", ".join(self.product_b.side_effects) if self.product_b.side_effects else "Minimal",
+                product_b=", ".join(product_b.side_effects) if product_b.side_effects else "Minimal",
             )
         )
 
@@ -5,18 +5,63 @@ Input: Raw product dictionary
 Output: Validated Product model
 """
 
-from typing import Dict, Any, List
-from models import Product
+import json
+from array import array
+from itertools import accumulate, chain, repeat
+from operator import add, itemgetter
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+from models import Product, ProductBatch, Vocabulary, PRODUCT_LIST_FIELDS
+
+
+# Canonical Product field -> accepted raw key aliases, in priority order.
+# Keys are matched case- and whitespace-insensitively.
+DEFAULT_FIELD_ALIASES: Dict[str, List[str]] = {
+    "name": ["name", "Product Name", "product_name"],
+    "concentration": ["concentration"],
+    "skin_types": ["skin_types", "Skin Type"],
+    "key_ingredients": ["key_ingredients", "Key Ingredients"],
+    "benefits": ["benefits"],
+    "usage_instructions": ["usage_instructions", "How to Use"],
+    "side_effects": ["side_effects", "Side Effects"],
+    "price": ["price"],
+}
+
+# Bounds on cached key layouts and remembered unknown raw keys
+_MAX_CACHED_LAYOUTS = 1024
+_MAX_UNKNOWN_KEYS = 10000
+
+
+def normalize_key(key: Any) -> str:
+    """Normalize a raw field name: lowercase with collapsed whitespace."""
+    return " ".join(str(key).split()).lower()
 
 
 class ProductParserAgent:
     """
     Parses raw product dictionary into validated Product model.
     Enforces schema, normalizes data, validates constraints.
+
+    Raw keys are resolved through a precompiled alias index, compiled
+    once per distinct record key layout. Keys that match no alias are
+    reported through unknown_keys, last_unknown_keys and
+    records_with_unknown_keys.
     """
 
-    def __init__(self):
-        """Initialize parser with validation rules."""
+    def __init__(
+        self,
+        field_aliases: Optional[Dict[str, List[str]]] = None,
+        vocabulary: Optional[Vocabulary] = None,
+    ):
+        """
+        Initialize parser with validation rules.
+
+        Args:
+            field_aliases: Canonical field -> raw key aliases
+                (default: DEFAULT_FIELD_ALIASES)
+            vocabulary: Shared vocabulary for list-field values
+                (default: a new vocabulary owned by this parser)
+        """
         self.required_fields = ["name"]
         self.optional_fields = [
             "concentration",
@@ -27,6 +72,56 @@ class ProductParserAgent:
             "side_effects",
             "price",
         ]
+        self.field_aliases = field_aliases or DEFAULT_FIELD_ALIASES
+        self.vocabulary = vocabulary or Vocabulary()
+        self._alias_index = self._compile_aliases(self.field_aliases)
+        # Compiled resolution plans per raw key layout
+        self._plans: Dict[Tuple[Any, ...], Tuple[Tuple[Tuple[Any, str], ...], List[str]]] = {}
+
+        # Unknown key reporting
+        self._unknown_keys = set()
+        self.last_unknown_keys: List[str] = []
+        self.records_with_unknown_keys = 0
+
+    @classmethod
+    def from_alias_file(cls, path: Union[str, Path]) -> "ProductParserAgent":
+        """
+        Create a parser with extra aliases loaded from a JSON file.
+
+        The file maps canonical field names to lists of aliases, e.g.
+        {"name": ["Item Title"], "price": ["MRP"]}. File aliases are
+        appended to the defaults, so the defaults keep priority.
+
+        Args:
+            path: Path to the alias JSON file
+
+        Returns:
+            Configured ProductParserAgent
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            extra = json.load(f)
+        return cls(field_aliases=merge_field_aliases(DEFAULT_FIELD_ALIASES, extra))
+
+    def _compile_aliases(self, field_aliases: Dict[str, List[str]]) -> Dict[str, Tuple[str, int]]:
+        """
+        Build the normalized alias -> (canonical field, priority) index.
+
+        Raises:
+            ValueError: If an alias targets an unknown field or two fields
+        """
+        known_fields = set(self.required_fields) | set(self.optional_fields)
+        index = {}
+        for canonical, aliases in field_aliases.items():
+            if canonical not in known_fields:
+                raise ValueError(f"Unknown product field in alias table: {canonical}")
+            for priority, alias in enumerate([canonical] + list(aliases)):
+                key = normalize_key(alias)
+                existing = index.get(key)
+                if existing is not None and existing[0] != canonical:
+                    raise ValueError(f"Alias '{alias}' maps to both {existing[0]} and {canonical}")
+                if existing is None or priority < existing[1]:
+                    index[key] = (canonical, priority)
+        return index
 
     def parse(self, raw_product: Dict[str, Any]) -> Product:
         """
@@ -41,70 +136,230 @@ class ProductParserAgent:
         Raises:
             ValueError: If required fields missing or invalid
         """
+        fields = self._resolve_fields(raw_product)
+
         # Validate required fields
-        self._validate_required_fields(raw_product)
+        self._validate_required_fields(fields)
 
-        # Extract and normalize data with flexible field name matching
+        get = fields.get
         product = Product(
-            name=self._get_field(raw_product, ["name", "Name", "Product Name", "product_name"]),
-            concentration=self._get_field(raw_product, ["concentration", "Concentration"]),
-            skin_types=self._normalize_list_field(raw_product, ["skin_types", "Skin Type", "skin type"]),
-            key_ingredients=self._normalize_list_field(raw_product, ["key_ingredients", "Key Ingredients"]),
-            benefits=self._normalize_list_field(raw_product, ["benefits", "Benefits"]),
-            usage_instructions=self._get_field(raw_product, ["usage_instructions", "How to Use", "how to use"]),
-            side_effects=self._normalize_list_field(raw_product, ["side_effects", "Side Effects"]),
-            price=self._get_field(raw_product, ["price", "Price"]),
+            name=self._normalize_string(get("name", "")),
+            concentration=self._normalize_string(get("concentration", "")),
+            skin_types=self._normalize_vocabulary_list(get("skin_types")),
+            key_ingredients=self._normalize_vocabulary_list(get("key_ingredients")),
+            benefits=self._normalize_vocabulary_list(get("benefits")),
+            usage_instructions=self._normalize_string(get("usage_instructions", "")),
+            side_effects=self._normalize_vocabulary_list(get("side_effects")),
+            price=self._normalize_string(get("price", "")),
         )
 
         return product
 
-    def _get_field(self, data: Dict[str, Any], possible_keys: List[str]) -> str:
+    def parse_batch(
+        self,
+        raw_products: Iterable[Dict[str, Any]],
+        errors: Optional[List[Tuple[int, str]]] = None,
+    ) -> ProductBatch:
         """
-        Get a field from dictionary using multiple possible key names.
+        Parse many raw products into a columnar ProductBatch.
+
+        Keys are resolved once per run of rows sharing a key layout, then
+        every field is extracted and normalized a whole column at a time.
+        Produces the same values as parse() row by row.
 
         Args:
-            data: Dictionary to search
-            possible_keys: List of possible key names
+            raw_products: Raw product dictionaries
+            errors: If given, invalid rows are skipped and recorded here
+                as (input index, message); otherwise they raise
 
         Returns:
-            Normalized string value or empty string
+            ProductBatch of the valid rows
+
+        Raises:
+            ValueError: If a row is invalid and no errors list was given
         """
-        for key in possible_keys:
-            if key in data:
-                return self._normalize_string(data[key])
-        return ""
+        columns: Dict[str, List[Any]] = {
+            "name": [],
+            "concentration": [],
+            "usage_instructions": [],
+            "price": [],
+        }
+        for list_field in PRODUCT_LIST_FIELDS:
+            columns[list_field] = []
+        source_indices = array("q")
+
+        # Group consecutive rows sharing a key layout, then pull each field
+        # out of a whole group at once
+        group: List[Dict[str, Any]] = []
+        group_plan = None
+        has_name = False
+        for index, raw_product in enumerate(raw_products):
+            plan = self._plan_for(raw_product)
+            if plan is not group_plan:
+                self._extract_columns(group, group_plan, columns)
+                group, group_plan = [], plan
+                has_name = any(canonical == "name" for _, canonical in plan[0])
+            if not has_name:
+                message = "Required field missing: product name"
+                if errors is None:
+                    raise ValueError(message)
+                errors.append((index, message))
+                continue
+            source_indices.append(index)
+            group.append(raw_product)
+        self._extract_columns(group, group_plan, columns)
+
+        batch = ProductBatch(
+            names=self._normalize_string_column(columns["name"]),
+            concentrations=self._normalize_string_column(columns["concentration"]),
+            usage_instructions=self._normalize_string_column(columns["usage_instructions"]),
+            prices=self._normalize_string_column(columns["price"]),
+            vocabulary=self.vocabulary,
+            source_indices=source_indices,
+        )
+        for list_field in PRODUCT_LIST_FIELDS:
+            values, offsets = self._normalize_list_column(columns[list_field])
+            batch.list_ids[list_field] = self.vocabulary.encode(values)
+            batch.list_offsets[list_field] = offsets
+
+        return batch
 
-    def _normalize_list_field(self, data: Dict[str, Any], possible_keys: List[str]) -> List[str]:
+    def product_names(self, raw_products: Iterable[Dict[str, Any]]) -> List[Optional[str]]:
         """
-        Get and normalize a list field using multiple possible key names.
+        Resolve only the product name of each raw record, as parse() would.
 
         Args:
-            data: Dictionary to search
-            possible_keys: List of possible key names
+            raw_products: Raw product dictionaries
 
         Returns:
-            Normalized list
+            Name per record, or None for records without a name field
         """
-        for key in possible_keys:
-            if key in data:
-                return self._normalize_list(data[key])
-        return []
+        names = []
+        for raw_product in raw_products:
+            layout = tuple(raw_product)
+            plan = self._plans.get(layout)
+            if plan is None:
+                plan = self._compile_plan(layout)
+            key = next((key for key, canonical in plan[0] if canonical == "name"), None)
+            names.append(None if key is None else self._normalize_string(raw_product[key]))
+        return names
+
+    def _extract_columns(self, rows: List[Dict[str, Any]], plan, columns: Dict[str, List[Any]]) -> None:
+        """Append the raw values of rows sharing one key plan to the columns."""
+        if not rows:
+            return
+        mapped = dict((canonical, key) for key, canonical in plan[0])
+        for field_name, column in columns.items():
+            key = mapped.get(field_name)
+            if key is None:
+                column.extend([None] * len(rows))
+            else:
+                column.extend(map(itemgetter(key), rows))
 
-    def _validate_required_fields(self, data: Dict[str, Any]) -> None:
+    def _normalize_string_column(self, column: List[Any]) -> List[str]:
+        """Normalize a whole column of scalar values (see _normalize_string)."""
+        if _all_strings(column):
+            return list(map(str.strip, column))
+        return [self._normalize_string(value) for value in column]
+
+    def _normalize_list_column(self, column: List[Any]) -> Tuple[List[str], array]:
+        """
+        Normalize a whole column of list values (see _normalize_list).
+
+        For an all-string column the comma split is a single join/split
+        over the column, and per-row lengths come from comma counts.
+
+        Returns:
+            (flat list of values, offsets array of length len(column) + 1)
+        """
+        offsets = array("q", [0])
+        if _all_strings(column):
+            # Empty strings contribute no values; others count(",") + 1
+            offsets.extend(accumulate(map(add, map(str.count, column, repeat(",")), map(bool, column))))
+            values = ",".join(filter(None, column)).split(",") if offsets[-1] else []
+            return list(map(str.strip, values)), offsets
+
+        rows = [self._normalize_list(value) for value in column]
+        offsets.extend(accumulate(map(len, rows)))
+        return list(chain.from_iterable(rows)), offsets
+
+    def _resolve_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map raw keys to canonical fields.
+        When several aliases of a field are present, the highest-priority
+        alias wins.
+
+        Records from one feed share the same key layout, so the key
+        resolution is compiled once per distinct layout into a plan of
+        (raw key, canonical field) pairs. A cached record costs one tuple
+        of its keys plus one lookup per resolved field.
+
+        Args:
+            data: Raw product dictionary
+
+        Returns:
+            Dictionary of canonical field -> raw value
+        """
+        fields, _ = self._plan_for(data)
+        return {canonical: data[key] for key, canonical in fields}
+
+    def _plan_for(self, data: Dict[str, Any]) -> Tuple[Tuple[Tuple[Any, str], ...], List[str]]:
+        """Look up (or compile) the key plan for a record and track unknown keys."""
+        layout = tuple(data)
+        plan = self._plans.get(layout)
+        if plan is None:
+            plan = self._compile_plan(layout)
+            if len(self._plans) < _MAX_CACHED_LAYOUTS:
+                self._plans[layout] = plan
+
+        unknown = plan[1]
+        self.last_unknown_keys = unknown
+        if unknown:
+            self.records_with_unknown_keys += 1
+        return plan
+
+    def _compile_plan(self, layout: Tuple[Any, ...]) -> Tuple[Tuple[Tuple[Any, str], ...], List[str]]:
+        """
+        Resolve one key layout against the alias index.
+
+        Args:
+            layout: Raw keys of a record, in order
+
+        Returns:
+            ((raw key, canonical field) pairs, unknown raw keys)
+        """
+        best: Dict[str, Tuple[int, Any]] = {}
+        unknown = []
+        for key in layout:
+            resolved = self._alias_index.get(normalize_key(key))
+            if resolved is None:
+                unknown.append(str(key))
+                continue
+            canonical, priority = resolved
+            if canonical not in best or priority < best[canonical][0]:
+                best[canonical] = (priority, key)
+
+        if len(self._unknown_keys) < _MAX_UNKNOWN_KEYS:
+            self._unknown_keys.update(unknown)
+        fields = tuple((key, canonical) for canonical, (_, key) in best.items())
+        return fields, sorted(unknown)
+
+    @property
+    def unknown_keys(self) -> List[str]:
+        """Distinct raw keys seen so far that match no alias."""
+        return sorted(self._unknown_keys)
+
+    def _validate_required_fields(self, fields: Dict[str, Any]) -> None:
         """
         Validate that required fields are present.
 
         Args:
-            data: Product data dictionary
+            fields: Resolved canonical field dictionary
 
         Raises:
             ValueError: If required fields missing
         """
-        # Check for product name field in various formats
-        has_name = any(
-            key in data for key in ["name", "Name", "Product Name", "product_name"]
-        )
-        if not has_name:
+        if "name" not in fields:
             raise ValueError("Required field missing: product name")
 
     def _normalize_string(self, value: Any) -> str:
@@ -113,6 +368,10 @@ class ProductParserAgent:
             return ""
         return str(value).strip()
 
+    def _normalize_vocabulary_list(self, value: Any) -> List[str]:
+        """Normalize a list value and intern its items in the vocabulary."""
+        return self.vocabulary.intern_all(self._normalize_list(value))
+
     def _normalize_list(self, primary: Any, secondary: Any = None) -> List[str]:
         """
         Normalize list values from primary or secondary source.
@@ -133,3 +392,25 @@ class ProductParserAgent:
             return [self._normalize_string(item) for item in source.split(",")]
 
         return []
+
+
+def _all_strings(values: List[Any]) -> bool:
+    """True if every value is exactly a str."""
+    return not values or set(map(type, values)) == {str}
+
+
+def merge_field_aliases(base: Dict[str, List[str]], extra: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Combine alias tables; aliases from `extra` are appended after `base`.
+
+    Args:
+        base: Existing alias table
+        extra: Additional aliases per canonical field
+
+    Returns:
+        New alias table
+    """
+    merged = {canonical: list(aliases) for canonical, aliases in base.items()}
+    for canonical, aliases in extra.items():
+        merged.setdefault(canonical, []).extend(aliases)
+    return merged
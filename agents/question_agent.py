@@ -5,16 +5,80 @@ Input: Product model
 Output: List of categorized questions
 """
 
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Tuple
 from models import Product, Question
 
 
+class QuestionTemplate:
+    """
+    One precompiled question: category, context field and the text around
+    the product-name slot, so rendering is a single concatenation (see
+    QuestionGenerationAgent.render).
+    """
+
+    __slots__ = ("category", "context", "prefix", "suffix")
+
+    def __init__(self, category: str, text: str, context: str):
+        """
+        Compile a template.
+
+        Args:
+            category: Question category
+            text: Question text with exactly one "{name}" slot
+            context: Product field the answer is built from
+
+        Raises:
+            ValueError: If text does not contain exactly one "{name}" slot
+        """
+        if text.count("{name}") != 1:
+            raise ValueError(f"Question template needs exactly one {{name}} slot: {text!r}")
+        self.category = category
+        self.context = context
+        self.prefix, self.suffix = text.split("{name}")
+
+
 class QuestionGenerationAgent:
     """
     Generates at least 15 user questions across 5 categories.
     Categories: Informational, Usage, Safety, Purchase, Comparison
     """
 
+    # Question set in output order: (category, text, context field)
+    templates: Tuple[QuestionTemplate, ...] = tuple(
+        QuestionTemplate(category, text, context)
+        for category, text, context in (
+            # Informational questions
+            ("Informational", "What is the concentration of {name}?", "concentration"),
+            ("Informational", "What are the key ingredients in {name}?", "key_ingredients"),
+            ("Informational", "What skin types is {name} suitable for?", "skin_types"),
+            ("Informational", "What are the main benefits of {name}?", "benefits"),
+            # Usage questions
+            ("Usage", "How do I use {name}?", "usage_instructions"),
+            ("Usage", "When should I apply {name} in my skincare routine?", "usage_instructions"),
+            ("Usage", "How many drops of {name} should I use per application?", "usage_instructions"),
+            ("Usage", "Can I use {name} both morning and night?", "usage_instructions"),
+            # Safety questions
+            ("Safety", "What are the side effects of {name}?", "side_effects"),
+            ("Safety", "Is {name} safe for sensitive skin?", "side_effects"),
+            ("Safety", "Can I use {name} with other active ingredients?", "side_effects"),
+            ("Safety", "Are there any contraindications or interactions with {name}?", "side_effects"),
+            # Purchase questions
+            ("Purchase", "What is the price of {name}?", "price"),
+            ("Purchase", "Is {name} value for money?", "price"),
+            ("Purchase", "Where can I purchase {name}?", "price"),
+            ("Purchase", "Does {name} offer a money-back guarantee?", "price"),
+            # Comparison questions
+            ("Comparison", "How does {name} compare to other vitamin C serums?", "benefits"),
+            ("Comparison", "Is {name} better than alternative products?", "concentration"),
+            ("Comparison", "What makes {name} unique in the market?", "key_ingredients"),
+        )
+    )
+
+    # Compiled form of the templates, rendered with positional arguments
+    _rows: Tuple[Tuple[str, str, str, str], ...] = tuple(
+        (template.category, template.prefix, template.suffix, template.context) for template in templates
+    )
+
     def __init__(self):
         """Initialize with question templates."""
         self.min_questions = 15
@@ -36,203 +100,58 @@ class QuestionGenerationAgent:
         Returns:
             List of Question objects
         """
-        questions: List[Question] = []
-
-        # Informational questions (3-4)
-        questions.extend(self._generate_informational_questions(product))
-
-        # Usage questions (3-4)
-        questions.extend(self._generate_usage_questions(product))
-
-        # Safety questions (3-4)
-        questions.extend(self._generate_safety_questions(product))
-
-        # Purchase questions (3-4)
-        questions.extend(self._generate_purchase_questions(product))
-
-        # Comparison questions (2-3)
-        questions.extend(self._generate_comparison_questions(product))
-
-        return questions
-
-    def _generate_informational_questions(self, product: Product) -> List[Question]:
-        """Generate informational questions about the product."""
-        questions = []
-
-        questions.append(
-            Question(
-                category="Informational",
-                question=f"What is the concentration of {product.name}?",
-                context="concentration",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Informational",
-                question=f"What are the key ingredients in {product.name}?",
-                context="key_ingredients",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Informational",
-                question=f"What skin types is {product.name} suitable for?",
-                context="skin_types",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Informational",
-                question=f"What are the main benefits of {product.name}?",
-                context="benefits",
-            )
-        )
-
-        return questions
-
-    def _generate_usage_questions(self, product: Product) -> List[Question]:
-        """Generate usage-related questions."""
-        questions = []
-
-        questions.append(
-            Question(
-                category="Usage",
-                question=f"How do I use {product.name}?",
-                context="usage_instructions",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Usage",
-                question=f"When should I apply {product.name} in my skincare routine?",
-                context="usage_instructions",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Usage",
-                question=f"How many drops of {product.name} should I use per application?",
-                context="usage_instructions",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Usage",
-                question=f"Can I use {product.name} both morning and night?",
-                context="usage_instructions",
-            )
-        )
-
-        return questions
-
-    def _generate_safety_questions(self, product: Product) -> List[Question]:
-        """Generate safety-related questions."""
-        questions = []
-
-        questions.append(
-            Question(
-                category="Safety",
-                question=f"What are the side effects of {product.name}?",
-                context="side_effects",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Safety",
-                question=f"Is {product.name} safe for sensitive skin?",
-                context="side_effects",
-            )
-        )
-
-        questions.append(
-            Question(
-                category="Safety",
-                question=f"Can I use {product.name} with other active ingredients?",
-                context="side_effects",
-            )
-        )
+        return self.render(product.name)
 
-        questions.append(
-            Question(
-                category="Safety",
-                question=f"Are there any contraindications or interactions with {product.name}?",
-                context="side_effects",
-            )
-        )
-
-        return questions
+    def render(self, product_name: str) -> List[Question]:
+        """
+        Render every question template for one product name. The only
+        render loop: generate, iter_questions and iter_batch all use it.
 
-    def _generate_purchase_questions(self, product: Product) -> List[Question]:
-        """Generate purchase-related questions."""
-        questions = []
+        Args:
+            product_name: Product display name
 
-        questions.append(
-            Question(
-                category="Purchase",
-                question=f"What is the price of {product.name}?",
-                context="price",
-            )
-        )
+        Returns:
+            List of Question objects, in template order
+        """
+        return [
+            Question(category, prefix + product_name + suffix, context)
+            for category, prefix, suffix, context in self._rows
+        ]
 
-        questions.append(
-            Question(
-                category="Purchase",
-                question=f"Is {product.name} value for money?",
-                context="price",
-            )
-        )
+    def iter_questions(self, product: Product) -> Iterator[Question]:
+        """
+        Iterate over a product's questions, in the same order as generate.
 
-        questions.append(
-            Question(
-                category="Purchase",
-                question=f"Where can I purchase {product.name}?",
-                context="price",
-            )
-        )
+        Args:
+            product: Validated product model
 
-        questions.append(
-            Question(
-                category="Purchase",
-                question=f"Does {product.name} offer a money-back guarantee?",
-                context="price",
-            )
-        )
+        Returns:
+            Iterator of Question objects
+        """
+        return iter(self.render(product.name))
 
-        return questions
+    def generate_batch(self, products: Iterable[Product]) -> List[List[Question]]:
+        """
+        Generate the questions of many products.
 
-    def _generate_comparison_questions(self, product: Product) -> List[Question]:
-        """Generate comparison-related questions."""
-        questions = []
+        Args:
+            products: Validated product models
 
-        questions.append(
-            Question(
-                category="Comparison",
-                question=f"How does {product.name} compare to other vitamin C serums?",
-                context="benefits",
-            )
-        )
+        Returns:
+            One question list per product, in input order
+        """
+        return list(self.iter_batch(products))
 
-        questions.append(
-            Question(
-                category="Comparison",
-                question=f"Is {product.name} better than alternative products?",
-                context="concentration",
-            )
-        )
+    def iter_batch(self, products: Iterable[Product]) -> Iterator[List[Question]]:
+        """
+        Lazily generate question lists, one product at a time.
 
-        questions.append(
-            Question(
-                category="Comparison",
-                question=f"What makes {product.name} unique in the market?",
-                context="key_ingredients",
-            )
-        )
+        Args:
+            products: Validated product models
 
-        return questions
+        Returns:
+            Iterator of question lists
+        """
+        render = self.render
+        for product in products:
+            yield render(product.name)
@@ -0,0 +1,118 @@
+"""
+Benchmark: FAQ answer generation through a model server.
+
+Starts a local stub answer server that formats answers like
+FAQAnswerTable after a fixed per-request latency, then builds FAQ pages:
+- one request per question (the round trip a naive backend pays)
+- one deduplicated request per product (FAQPageAgent.generate)
+- batched requests per window of products (FAQPageAgent.generate_batch)
+- again from a warm persistent answer cache (no requests at all)
+
+Pages are checked against the local answer table.
+
+Usage:
+    python -m benchmarks.bench_answers [--count N] [--latency-ms MS]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+from agents.answer_backends import AnswerCache, AnswerService, HTTPAnswerBackend, answer_prompt
+from agents.page_agents import FAQAnswerTable, FAQPageAgent
+from benchmarks.synthetic import synthetic_catalog
+from orchestrator.pipeline import OrchestratorAgent
+
+
+def stub_server(latency: float) -> ThreadingHTTPServer:
+    """Answer server on a free localhost port, serving from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            prompts = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["prompts"]
+            time.sleep(latency)
+            answers = [
+                FAQAnswerTable.formatters[prompt["context"]](SimpleNamespace(**prompt["fields"]))
+                for prompt in prompts
+            ]
+            body = json.dumps({"answers": answers}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Server time per request")
+    parser.add_argument("--window", type=int, default=256, help="Products per generate_batch call")
+    args = parser.parse_args(argv)
+
+    orchestrator = OrchestratorAgent(tempfile.mkdtemp())
+    products = [orchestrator.parser_agent.parse(record) for record in synthetic_catalog(args.count)]
+    questions = orchestrator.question_agent.generate_batch(products)
+    expected = FAQPageAgent().generate_batch(products, questions)
+
+    server = stub_server(args.latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}/answers"
+    cache_path = os.path.join(tempfile.mkdtemp(), "answers.sqlite")
+    backend = HTTPAnswerBackend(url)
+
+    def per_question():
+        for product, product_questions in zip(products, questions):
+            for question in product_questions[:15]:
+                if question.context in FAQAnswerTable.formatters:
+                    backend.answer_batch([answer_prompt(question.context, product)])
+
+    def per_product(agent):
+        return [agent.generate(product, product_questions, {}) for product, product_questions in zip(products, questions)]
+
+    def batched(agent):
+        pages = []
+        for start in range(0, len(products), args.window):
+            pages.extend(agent.generate_batch(products[start:start + args.window], questions[start:start + args.window]))
+        return pages
+
+    def timed(run, *run_args):
+        start = time.perf_counter()
+        result = run(*run_args)
+        return time.perf_counter() - start, result
+
+    timings = {}
+    services = {}
+    timings["request per question"], _ = timed(per_question)
+    for method, run, path in (
+        ("request per product", per_product, None),
+        ("batched per window", batched, cache_path),
+        ("warm persistent cache", batched, cache_path),
+    ):
+        service = services[method] = AnswerService(HTTPAnswerBackend(url), AnswerCache(path=path))
+        timings[method], pages = timed(run, FAQPageAgent(answer_service=service))
+        service.close()
+        assert pages == expected, method
+    server.shutdown()
+
+    baseline = timings["request per question"]
+    print(f"products: {args.count}, server latency: {args.latency_ms} ms per request")
+    print(f"{'method':<24} {'requests':>9} {'ms/product':>11} {'speedup':>8}")
+    for method, elapsed in timings.items():
+        requests = services[method].backend_calls if method in services else "-"
+        print(f"{method:<24} {requests:>9} {elapsed / args.count * 1e3:>11.3f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: reader-side lookup latency and throughput for page bundles.
+
+Builds the same pages as a flat directory, a JSONL bundle, a SQLite bundle
+and a memory-mapped page archive, then fetches all pages of randomly chosen
+products from each.
+
+Usage:
+    python -m benchmarks.bench_archive [--count N] [--lookups N]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_catalog
+from orchestrator.archive import PageArchiveReader
+from orchestrator.pipeline import OrchestratorAgent
+from orchestrator.stores import JsonlPageStoreReader, SqlitePageStoreReader
+from orchestrator.writers import PAGE_FILENAMES, make_writer
+
+
+class _FlatReader:
+    """Reads pages from the flat directory layout."""
+
+    def __init__(self, output_dir: Path):
+        self.writer = make_writer(output_dir, layout="flat")
+
+    def get_product(self, product_name: str):
+        pages = {}
+        for page_type in PAGE_FILENAMES:
+            with open(self.writer.page_path(product_name, page_type), "rb") as f:
+                pages[page_type] = f.read()
+        return pages
+
+    def close(self) -> None:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        orchestrator = OrchestratorAgent(output_dir=str(root / "build"), compact_json=True)
+        products = [(item.product_name, item.payloads) for item in orchestrator.stream_catalog(synthetic_catalog(args.count))]
+
+        readers = {}
+        open_ms = {}
+        for layout, reader_class in (
+            ("flat", _FlatReader),
+            ("jsonl", JsonlPageStoreReader),
+            ("sqlite", SqlitePageStoreReader),
+            ("archive", PageArchiveReader),
+        ):
+            writer = make_writer(root / layout, layout=layout)
+            for product_name, pages in products:
+                writer.write(product_name, pages)
+            writer.close()
+            start = time.perf_counter()
+            readers[layout] = reader_class(root / layout)
+            open_ms[layout] = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(args.seed)
+        names = [rng.choice(products)[0] for _ in range(args.lookups)]
+        expected = dict(products)
+
+        print(f"products: {args.count}, lookups: {args.lookups} (all pages of one product each)")
+        print(f"{'layout':<8} {'open ms':>8} {'p50 us':>8} {'p99 us':>8} {'lookups/s':>11} {'MB/s':>8}")
+        for layout, reader in readers.items():
+            assert {page_type: bytes(data) for page_type, data in reader.get_product(names[0]).items()} == expected[names[0]]
+
+            latencies = []
+            total_bytes = 0
+            clock = time.perf_counter_ns
+            start = time.perf_counter()
+            for product_name in names:
+                begin = clock()
+                pages = reader.get_product(product_name)
+                latencies.append(clock() - begin)
+                for data in pages.values():
+                    total_bytes += len(data)
+            elapsed = time.perf_counter() - start
+            del pages, data
+            reader.close()
+
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2] / 1000
+            p99 = latencies[int(len(latencies) * 0.99)] / 1000
+            print(f"{layout:<8} {open_ms[layout]:>8.2f} {p50:>8.1f} {p99:>8.1f} {args.lookups / elapsed:>11.0f} "
+                  f"{total_bytes / elapsed / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
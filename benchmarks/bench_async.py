@@ -0,0 +1,100 @@
+"""
+Benchmark: catalog throughput of the async orchestrator with I/O-bound agents.
+
+Runs a catalog through AsyncOrchestratorAgent with a fake enrichment
+service and a fake remote page store, each answering after a fixed
+latency. With every I/O stage limited to one request at a time each
+product pays both round trips in turn; with the default stage limits the
+round trips of many products overlap. The synchronous orchestrator (no
+I/O at all) is the CPU-bound floor. Pages are checked against it.
+
+Usage:
+    python -m benchmarks.bench_async [--count N] [--latency-ms MS]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Dict
+
+from benchmarks.synthetic import synthetic_catalog
+from orchestrator.async_pipeline import AsyncOrchestratorAgent, AsyncPageSink, AsyncProductAgent
+from orchestrator.pipeline import OrchestratorAgent
+
+
+class FakeEnrichmentService(AsyncProductAgent):
+    """Returns each product unchanged after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def enrich(self, product):
+        await asyncio.sleep(self.latency)
+        return product
+
+
+class FakePageStore(AsyncPageSink):
+    """Keeps every product's pages in memory after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.pages: Dict[str, Dict[str, bytes]] = {}
+
+    async def write(self, product_name, pages):
+        await asyncio.sleep(self.latency)
+        self.pages[product_name] = pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Round trip of each fake service")
+    args = parser.parse_args(argv)
+    records = list(synthetic_catalog(args.count))
+    latency = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        expected = {
+            item.product_name: item.payloads
+            for item in OrchestratorAgent(output_dir, output_layout="jsonl").stream_catalog(records)
+            if item.error is None
+        }
+
+    def run(**stage_limits) -> float:
+        store = FakePageStore(latency)
+        with tempfile.TemporaryDirectory() as output_dir:
+            orchestrator = AsyncOrchestratorAgent(
+                output_dir,
+                output_layout="jsonl",
+                enrichment_agents=[FakeEnrichmentService(latency)],
+                page_sinks=[store],
+                stage_limits=stage_limits,
+            )
+            start = time.perf_counter()
+            summary = orchestrator.execute_catalog(records)
+            elapsed = time.perf_counter() - start
+        assert summary.processed == len(expected) and store.pages == expected
+        return elapsed
+
+    def run_sync() -> float:
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            OrchestratorAgent(output_dir, output_layout="jsonl").execute_catalog(records)
+            return time.perf_counter() - start
+
+    timings = {
+        "sync, no I/O": run_sync(),
+        "async, 1 request/stage": run(enrich=1, publish=1),
+        "async, default limits": run(),
+    }
+
+    baseline = timings["async, 1 request/stage"]
+    print(f"products: {args.count}, service latency: {args.latency_ms} ms (enrich + publish)")
+    print(f"{'method':<24} {'seconds':>8} {'products/s':>11} {'speedup':>8}")
+    for method, elapsed in timings.items():
+        print(f"{method:<24} {elapsed:>8.3f} {args.count / elapsed:>11.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
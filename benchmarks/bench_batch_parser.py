@@ -0,0 +1,54 @@
+"""
+Benchmark: columnar ProductParserAgent.parse_batch vs looping parse().
+
+Usage:
+    python -m benchmarks.bench_batch_parser [--count N] [--extra-columns N]
+"""
+
+import argparse
+import time
+
+from agents.parser_agent import ProductParserAgent
+from benchmarks.synthetic import synthetic_catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--extra-columns", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    records = list(synthetic_catalog(args.count, extra_columns=args.extra_columns))
+
+    loop_best = batch_best = views_best = float("inf")
+    for _ in range(args.repeat):
+        agent = ProductParserAgent()
+        start = time.perf_counter()
+        for record in records:
+            agent.parse(record)
+        loop_best = min(loop_best, time.perf_counter() - start)
+
+        agent = ProductParserAgent()
+        start = time.perf_counter()
+        batch = agent.parse_batch(records)
+        batch_best = min(batch_best, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in batch:
+            pass
+        views_best = min(views_best, time.perf_counter() - start)
+
+    # Rows are consumed without being retained, as in the streaming pipeline
+    assert list(batch) == [ProductParserAgent().parse(record) for record in records]
+
+    print(f"records: {args.count} (+{args.extra_columns} extra columns)")
+    print(f"parse() loop:  {loop_best:.3f}s  ({loop_best / args.count * 1e6:.2f} us/product)")
+    print(f"parse_batch(): {batch_best:.3f}s  ({batch_best / args.count * 1e6:.2f} us/product)")
+    print(f"  + Product views: {views_best:.3f}s  ({views_best / args.count * 1e6:.2f} us/product)")
+    print(f"speedup:       {loop_best / batch_best:.2f}x columnar, "
+          f"{loop_best / (batch_best + views_best):.2f}x including views")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: per-pair cost of comparison grids.
+
+Builds a full comparison grid (every ordered pair) over one category of
+products, once preparing both sides of every pair from scratch and once
+through ComparisonEngine.matrix, which prepares each product's half-row
+once and shares it across all of its pairs.
+
+Usage:
+    python -m benchmarks.bench_comparison [--count N]
+"""
+
+import argparse
+import time
+from itertools import permutations
+
+from agents.parser_agent import ProductParserAgent
+from benchmarks.synthetic import synthetic_catalog
+from logic_blocks.comparison import ComparisonEngine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200, help="Products in the category")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    products = list(ProductParserAgent().parse_batch(list(synthetic_catalog(args.count))))
+    pairs = list(permutations(range(len(products)), 2))
+
+    def per_pair():
+        # A fresh engine per pair recomputes both half-rows every time
+        for index_a, index_b in pairs:
+            ComparisonEngine().page(products[index_a], products[index_b])
+
+    def matrix():
+        for _ in ComparisonEngine().matrix(products, pairs):
+            pass
+
+    assert list(ComparisonEngine().matrix(products, pairs[:50])) == [
+        ComparisonEngine().page(products[a], products[b]) for a, b in pairs[:50]
+    ]
+
+    def best(run) -> float:
+        result = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run()
+            result = min(result, time.perf_counter() - start)
+        return result
+
+    timings = {"recompute per pair": best(per_pair), "matrix": best(matrix)}
+    baseline = timings["recompute per pair"]
+    print(f"products: {len(products)}, pairs: {len(pairs)}")
+    print(f"{'method':<20} {'us/pair':>8} {'speedup':>8}")
+    for method, elapsed in timings.items():
+        print(f"{method:<20} {elapsed / len(pairs) * 1e6:>8.2f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
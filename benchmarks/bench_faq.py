@@ -0,0 +1,68 @@
+"""
+Benchmark: per-product FAQ page assembly time.
+
+Compares the answer table (each context formatted once per product) and
+the batch API against rebuilding every answer string per question, as
+FAQPageAgent did before.
+
+Usage:
+    python -m benchmarks.bench_faq [--count N]
+"""
+
+import argparse
+import time
+
+from agents.page_agents import FAQAnswerTable, FAQPageAgent
+from benchmarks.synthetic import synthetic_catalog
+from models import FAQItem, FAQPage
+from orchestrator.pipeline import OrchestratorAgent
+
+
+def _rebuild_per_question(agent: FAQPageAgent, product, questions, logic_blocks) -> FAQPage:
+    """FAQ assembly that formats the whole answer table for every question."""
+    formatters = FAQAnswerTable.formatters
+    faq_items = []
+    for question in questions[:agent.max_faqs]:
+        answers = {context: format_answer(product) for context, format_answer in formatters.items()}
+        faq_items.append(FAQItem(question=question.question, answer=answers[question.context], category=question.category))
+    return FAQPage(page_type="faq", product_name=product.name, total_questions=len(faq_items), faqs=faq_items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    orchestrator = OrchestratorAgent()
+    products = [orchestrator.parser_agent.parse(record) for record in synthetic_catalog(args.count)]
+    questions = [orchestrator.question_agent.generate(product) for product in products]
+    agent = orchestrator.faq_agent
+    for product, product_questions in zip(products, questions):
+        assert agent.generate(product, product_questions, {}) == _rebuild_per_question(agent, product, product_questions, {})
+
+    def best(run) -> float:
+        result = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run()
+            result = min(result, time.perf_counter() - start)
+        return result
+
+    timings = {
+        "rebuild per question": best(
+            lambda: [_rebuild_per_question(agent, p, q, {}) for p, q in zip(products, questions)]
+        ),
+        "answer table": best(lambda: [agent.generate(p, q, {}) for p, q in zip(products, questions)]),
+        "generate_batch": best(lambda: agent.generate_batch(products, questions)),
+    }
+
+    baseline = timings["rebuild per question"]
+    print(f"products: {args.count}, questions per page: {min(len(questions[0]), agent.max_faqs)}")
+    print(f"{'method':<22} {'us/product':>11} {'speedup':>8}")
+    for method, elapsed in timings.items():
+        print(f"{method:<22} {elapsed / args.count * 1e6:>11.2f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: resident memory per product for each model layout.
+
+Each layout (dataclass, slots, frozen) runs in its own interpreter because
+ACGS_MODEL_LAYOUT is read when models is imported.
+
+Usage:
+    python -m benchmarks.bench_model_memory [--count N] [--layouts dataclass,slots,frozen]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tracemalloc
+
+LAYOUTS = ("dataclass", "slots", "frozen")
+
+
+def measure(count: int) -> None:
+    """Measure the current layout and print 'products_bytes pages_bytes'."""
+    from agents.parser_agent import ProductParserAgent
+    from benchmarks.synthetic import synthetic_catalog
+    from orchestrator.pipeline import OrchestratorAgent
+
+    records = list(synthetic_catalog(count))
+    parser = ProductParserAgent()
+    orchestrator = OrchestratorAgent()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    products = [parser.parse(record) for record in records]
+    products_bytes = tracemalloc.get_traced_memory()[0] - before
+
+    before = tracemalloc.get_traced_memory()[0]
+    pages = [orchestrator.generate_pages(product) for product in products]
+    pages_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert len(pages) == count
+    print(products_bytes, pages_bytes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--layouts", default=",".join(LAYOUTS))
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        measure(args.count)
+        return
+
+    print(f"products: {args.count}")
+    print(f"{'layout':<10} {'Product':>14} {'+ pages':>14}")
+    for layout in args.layouts.split(","):
+        env = dict(os.environ, ACGS_MODEL_LAYOUT=layout)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_model_memory", "--child", "--count", str(args.count)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        products_bytes, pages_bytes = (int(value) for value in output.split())
+        print(f"{layout:<10} {products_bytes / args.count:>8.0f} B/row {pages_bytes / args.count:>8.0f} B/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: PageSerializer vs to_dict() + json.dumps for generated pages.
+
+Usage:
+    python -m benchmarks.bench_serialization [--count N]
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.synthetic import synthetic_catalog
+from orchestrator.pipeline import OrchestratorAgent
+from orchestrator.serialization import PageSerializer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    orchestrator = OrchestratorAgent()
+    pages = []
+    for record in synthetic_catalog(args.count):
+        pages.extend(orchestrator.generate_pages(orchestrator.parser_agent.parse(record)).values())
+
+    pretty = PageSerializer(indent=2)
+    compact = PageSerializer(indent=None)
+    for page in pages:
+        assert pretty.serialize(page) == json.dumps(page.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+
+    def best(encode) -> float:
+        result = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for page in pages:
+                encode(page)
+            result = min(result, time.perf_counter() - start)
+        return result
+
+    baseline = best(lambda page: json.dumps(page.to_dict(), indent=2, ensure_ascii=False).encode("utf-8"))
+    pretty_time = best(pretty.serialize)
+    compact_time = best(compact.serialize)
+    pretty_bytes = sum(len(pretty.serialize(page)) for page in pages)
+    compact_bytes = sum(len(compact.serialize(page)) for page in pages)
+
+    print(f"pages: {len(pages)}")
+    print(f"to_dict + json.dumps: {baseline:.3f}s  ({baseline / len(pages) * 1e6:.1f} us/page)")
+    print(f"PageSerializer pretty: {pretty_time:.3f}s  ({pretty_time / len(pages) * 1e6:.1f} us/page, "
+          f"{baseline / pretty_time:.2f}x)")
+    print(f"PageSerializer compact: {compact_time:.3f}s  ({compact_time / len(pages) * 1e6:.1f} us/page, "
+          f"{baseline / compact_time:.2f}x, {compact_bytes / pretty_bytes:.0%} of pretty size)")
+
+
+if __name__ == "__main__":
+    main()
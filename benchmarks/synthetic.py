@@ -0,0 +1,52 @@
+"""
+Synthetic catalog generator for benchmarks.
+Produces deterministic raw product records in the single-product input format.
+"""
+
+import random
+from typing import Dict, Any, Iterator
+
+SKIN_TYPES = ["Oily", "Combination", "Dry", "Normal", "Sensitive"]
+INGREDIENTS = [
+    "Vitamin C",
+    "Hyaluronic Acid",
+    "Niacinamide",
+    "Retinol",
+    "Ferulic Acid",
+    "Vitamin E",
+    "Salicylic Acid",
+    "Peptides",
+    "Ceramides",
+    "Zinc",
+]
+BENEFITS = ["Brightening", "Fades dark spots", "Hydration", "Anti-aging", "Radiance boost", "Pore care"]
+SIDE_EFFECTS = ["Mild tingling for sensitive skin", "Temporary redness", "Dryness"]
+
+
+def synthetic_catalog(count: int, seed: int = 0, extra_columns: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Generate raw product records.
+
+    Args:
+        count: Number of records
+        seed: Random seed (same seed, same catalog)
+        extra_columns: Unmapped vendor columns added to each record
+
+    Returns:
+        Iterator of raw product dictionaries
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        record = {
+            "Product Name": f"Synthetic Serum {index}",
+            "Concentration": f"{rng.randint(1, 20)}% Vitamin C",
+            "Skin Type": ", ".join(rng.sample(SKIN_TYPES, rng.randint(1, 3))),
+            "Key Ingredients": ", ".join(rng.sample(INGREDIENTS, rng.randint(2, 4))),
+            "Benefits": ", ".join(rng.sample(BENEFITS, rng.randint(1, 3))),
+            "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+            "Side Effects": rng.choice(SIDE_EFFECTS),
+            "Price": f"₹{rng.randint(199, 2999)}",
+        }
+        for column in range(extra_columns):
+            record[f"vendor_field_{column}"] = column
+        yield record
@@ -3,13 +3,28 @@ Logic Blocks: Reusable content transformation components.
 Each block transforms product data into structured content fragments.
 """
 
-from typing import Dict, Any, List
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from models import Product, ContentFragment
+from logic_blocks import pricing
+from logic_blocks.comparison import ComparisonEngine
+from logic_blocks.pricing import ParsedPrice, parse_price, price_range
 
 
 class BenefitsLogicBlock:
     """Transforms product benefits into structured content."""
 
+    # Product fields this block reads
+    input_fields = ("name", "benefits")
+
     @staticmethod
     def generate(product: Product) -> ContentFragment:
         """
@@ -38,6 +53,9 @@ class BenefitsLogicBlock:
 class UsageLogicBlock:
     """Transforms usage instructions into structured content."""
 
+    # Product fields this block reads
+    input_fields = ("name", "usage_instructions")
+
     @staticmethod
     def generate(product: Product) -> ContentFragment:
         """
@@ -72,6 +90,9 @@ class UsageLogicBlock:
 class SafetyLogicBlock:
     """Transforms safety information into structured content."""
 
+    # Product fields this block reads
+    input_fields = ("name", "side_effects")
+
     @staticmethod
     def generate(product: Product) -> ContentFragment:
         """
@@ -105,6 +126,9 @@ class SafetyLogicBlock:
 class IngredientLogicBlock:
     """Transforms ingredient information into structured content."""
 
+    # Product fields this block reads
+    input_fields = ("name", "key_ingredients", "concentration")
+
     @staticmethod
     def generate(product: Product) -> ContentFragment:
         """
@@ -137,29 +161,37 @@ class IngredientLogicBlock:
 class PriceLogicBlock:
     """Transforms price information into structured content."""
 
+    # Product fields this block reads
+    input_fields = ("name", "price")
+
+    # Helper code the fragment depends on (part of code version stamps)
+    code_dependencies = (pricing,)
+
     @staticmethod
-    def generate(product: Product) -> ContentFragment:
+    def generate(product: Product, price: Optional[ParsedPrice] = None) -> ContentFragment:
         """
         Generate price content fragment.
 
         Args:
             product: Product model
+            price: product.price already parsed (e.g. from a batch
+                PriceColumn); parsed here if omitted
 
         Returns:
             ContentFragment with price content
         """
-        # Extract numeric price for comparison
-        price_numeric = "".join(filter(str.isdigit, product.price.split()[0] if product.price else "0"))
+        if price is None:
+            price = parse_price(product.price)
+        value = price.value
+        price_numeric_val = int(value) if value.is_integer() else value
 
-        price_numeric_val = int(price_numeric) if price_numeric else 0
-        
         price_content = {
             "title": f"Pricing for {product.name}",
             "price": product.price,
             "price_numeric": price_numeric_val,
-            "currency": "INR" if "₹" in product.price else "USD",
+            "currency": price.currency,
             "value_proposition": "Premium quality at accessible pricing",
-            "price_range": "Mid-range premium" if price_numeric_val > 500 else "Affordable",
+            "price_range": price_range(value),
         }
 
         return ContentFragment(
@@ -172,6 +204,12 @@ class PriceLogicBlock:
 class ComparisonLogicBlock:
     """Generates comparison content between two products."""
 
+    # Product fields this block reads
+    input_fields = ("name", "concentration", "benefits", "price", "skin_types")
+
+    # Shared per-product half-rows (see logic_blocks.comparison)
+    engine = ComparisonEngine(max_rows=1024)
+
     @staticmethod
     def generate(product_a: Product, product_b: Product) -> ContentFragment:
         """
@@ -184,43 +222,248 @@ class ComparisonLogicBlock:
         Returns:
             ContentFragment with comparison content
         """
-        comparison_content = {
-            "title": f"{product_a.name} vs {product_b.name}",
-            "product_a": {
-                "name": product_a.name,
-                "concentration": product_a.concentration,
-                "benefits": product_a.benefits,
-                "price": product_a.price,
-                "skin_types": product_a.skin_types,
-            },
-            "product_b": {
-                "name": product_b.name,
-                "concentration": product_b.concentration,
-                "benefits": product_b.benefits,
-                "price": product_b.price,
-                "skin_types": product_b.skin_types,
-            },
-            "comparison_metrics": [
-                {
-                    "metric": "Concentration",
-                    "product_a": product_a.concentration or "N/A",
-                    "product_b": product_b.concentration or "N/A",
-                },
-                {
-                    "metric": "Price",
-                    "product_a": product_a.price,
-                    "product_b": product_b.price,
-                },
-                {
-                    "metric": "Suitable Skin Types",
-                    "product_a": ", ".join(product_a.skin_types),
-                    "product_b": ", ".join(product_b.skin_types),
-                },
-            ],
+        return ComparisonLogicBlock.engine.fragment(product_a, product_b)
+
+
+# Per-product logic blocks in generation order (block_name -> block)
+PRODUCT_LOGIC_BLOCKS = {
+    "benefits": BenefitsLogicBlock,
+    "usage": UsageLogicBlock,
+    "safety": SafetyLogicBlock,
+    "ingredient": IngredientLogicBlock,
+    "price": PriceLogicBlock,
+}
+
+
+class LazyLogicBlocks(Mapping):
+    """
+    Read-only block_name -> ContentFragment mapping for one product that
+    generates each fragment on first access and memoizes it.
+
+    Page agents receive it in place of an eager fragment dictionary, so
+    blocks a page never reads are never generated. Membership tests and
+    iteration only consult the declared block names.
+    """
+
+    def __init__(
+        self,
+        product: Product,
+        block_names: Optional[Iterable[str]] = None,
+        generate: Optional[Callable[[str], ContentFragment]] = None,
+    ):
+        """
+        Initialize mapping.
+
+        Args:
+            product: Product model the blocks are generated for
+            block_names: Available blocks (default: all PRODUCT_LOGIC_BLOCKS)
+            generate: Callable block_name -> ContentFragment (default: run
+                the block from PRODUCT_LOGIC_BLOCKS on product)
+        """
+        self.product = product
+        self.block_names = list(PRODUCT_LOGIC_BLOCKS if block_names is None else block_names)
+        self._generate = generate
+        self._fragments: Dict[str, ContentFragment] = {}
+
+    def __getitem__(self, block_name: str) -> ContentFragment:
+        fragment = self._fragments.get(block_name)
+        if fragment is None:
+            if block_name not in self.block_names:
+                raise KeyError(block_name)
+            if self._generate is not None:
+                fragment = self._generate(block_name)
+            else:
+                fragment = PRODUCT_LOGIC_BLOCKS[block_name].generate(self.product)
+            self._fragments[block_name] = fragment
+        return fragment
+
+    def __contains__(self, block_name: object) -> bool:
+        return block_name in self.block_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.block_names)
+
+    def __len__(self) -> int:
+        return len(self.block_names)
+
+    def generated(self) -> List[str]:
+        """Names of the blocks generated so far."""
+        return list(self._fragments)
+
+
+# Fragments kept in memory by a LogicBlockCache unless configured otherwise
+DEFAULT_BLOCK_CACHE_SIZE = 4096
+
+_BLOCK_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fragments (
+    key TEXT PRIMARY KEY,
+    fragment TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class LogicBlockCache:
+    """
+    Memoizes per-product logic block fragments across products.
+
+    Entries are keyed by the values of the fields the block reads (its
+    input_fields), so products whose fields are identical for a block share
+    one fragment. The in-memory tier is a bounded LRU; the optional on-disk
+    tier (a SQLite file) keeps fragments across runs and is keyed by a
+    digest that also covers the block's source code.
+
+    Cached fragments are shared between products and must not be mutated.
+    Safe to call from several threads (e.g. page graph node workers).
+    """
+
+    # Missed fragments buffered before they are written to the disk tier
+    disk_batch_size = 256
+
+    def __init__(self, max_entries: int = DEFAULT_BLOCK_CACHE_SIZE, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Fragments kept in memory (least recently used are evicted)
+            path: SQLite file for the on-disk tier (default: memory only)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"Logic block cache needs at least one entry, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Any, ...], ContentFragment]" = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[str, str]] = []
+        self._stamps: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        # attrgetter returns a tuple for two or more names, the bare value for one
+        self._getters = {
+            name: attrgetter(*block.input_fields) if len(block.input_fields) > 1
+            else (lambda product, getter=attrgetter(*block.input_fields): (getter(product),))
+            for name, block in PRODUCT_LOGIC_BLOCKS.items()
         }
 
-        return ContentFragment(
-            block_type="comparison",
-            content=comparison_content,
-            product_name=f"{product_a.name} and {product_b.name}",
-        )
+    def generate(self, block_name: str, product: Product, *inputs: Any) -> ContentFragment:
+        """
+        Cached equivalent of PRODUCT_LOGIC_BLOCKS[block_name].generate(product, *inputs).
+
+        Inputs must be derived from the block's input_fields (e.g. a parsed
+        price), so they do not take part in the key.
+
+        Args:
+            block_name: Per-product logic block name
+            product: Product model
+            inputs: Extra arguments passed to the block's generate
+
+        Returns:
+            ContentFragment
+        """
+        values = tuple([
+            tuple(value) if value.__class__ is list else value
+            for value in self._getters[block_name](product)
+        ])
+        key = (block_name, values)
+        entries = self._entries
+        with self._lock:
+            fragment = entries.get(key)
+            if fragment is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return fragment
+            disk_key = None
+            if self.path is not None:
+                disk_key = self._disk_key(block_name, values)
+                fragment = self._disk_get(disk_key)
+            if fragment is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+
+        # Generated outside the lock; concurrent misses on one key agree on the fragment
+        generated = fragment is None
+        if generated:
+            fragment = PRODUCT_LOGIC_BLOCKS[block_name].generate(product, *inputs)
+        with self._lock:
+            if generated and disk_key is not None:
+                self._disk_put(disk_key, fragment)
+            entries[key] = fragment
+            if len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        return fragment
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for reporting."""
+        with self._lock:
+            hits, disk_hits, misses, entries = self.hits, self.disk_hits, self.misses, len(self._entries)
+        lookups = hits + disk_hits + misses
+        return {
+            "entries": entries,
+            "hits": hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "hit_rate": round((hits + disk_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def take_counts(self) -> Dict[str, int]:
+        """Return the hit/miss counters and reset them (e.g. per worker chunk)."""
+        with self._lock:
+            counts = {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses}
+            self.hits = self.disk_hits = self.misses = 0
+        return counts
+
+    def flush(self) -> None:
+        """Write buffered fragments to the disk tier."""
+        with self._lock:
+            self._flush_pending()
+
+    def close(self) -> None:
+        """Flush and close the disk tier. The memory tier stays usable."""
+        with self._lock:
+            if self._connection is not None:
+                self._flush_pending()
+                self._connection.close()
+                self._connection = None
+
+    def _flush_pending(self) -> None:
+        # Callers hold self._lock
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO fragments (key, fragment) VALUES (?, ?)", pending)
+
+    def _disk_key(self, block_name: str, values: Tuple[Any, ...]) -> str:
+        stamp = self._stamps.get(block_name)
+        if stamp is None:
+            block = PRODUCT_LOGIC_BLOCKS[block_name]
+            source = "".join(
+                inspect.getsource(obj) for obj in (block,) + tuple(getattr(block, "code_dependencies", ()))
+            )
+            stamp = self._stamps[block_name] = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        data = json.dumps([block_name, stamp, values], ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _disk_get(self, disk_key: str) -> Optional[ContentFragment]:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Worker processes may share the file; wait for their transactions.
+            # Node worker threads share the connection under self._lock.
+            self._connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._connection.execute(_BLOCK_CACHE_SCHEMA)
+        row = self._connection.execute("SELECT fragment FROM fragments WHERE key = ?", (disk_key,)).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        return ContentFragment(block_type=data["block_type"], content=data["content"], product_name=data["product_name"])
+
+    def _disk_put(self, disk_key: str, fragment: ContentFragment) -> None:
+        data = {"block_type": fragment.block_type, "content": fragment.content, "product_name": fragment.product_name}
+        self._pending.append((disk_key, json.dumps(data, ensure_ascii=False)))
+        if len(self._pending) >= self.disk_batch_size:
+            self._flush_pending()
@@ -0,0 +1,213 @@
+"""
+Comparison engine: Builds product-vs-product comparisons from precomputed half-rows.
+Responsibility: Comparison content only - competitors are chosen by the caller
+(e.g. logic_blocks.similarity).
+
+A product's side of every comparison (joined ingredient, benefit,
+skin-type and side-effect strings, parsed price, block profile) depends
+only on that product, so it is computed once as a ComparisonHalfRow and
+shared by reference by every pair the product appears in. Assembling a
+pair is then one ComparisonPageItem per attribute plus a price check.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from models import ComparisonPage, ComparisonPageItem, ContentFragment, Product
+from logic_blocks.pricing import ParsedPrice, parse_price
+
+
+class ComparisonHalfRow:
+    """One product's precomputed side of a comparison."""
+
+    __slots__ = (
+        "product",
+        "name",
+        "concentration",
+        "key_ingredients",
+        "benefits",
+        "price",
+        "skin_types",
+        "usage_instructions",
+        "side_effects",
+        "parsed_price",
+        "profile",
+    )
+
+    def __init__(self, product: Product):
+        """
+        Precompute a product's comparison values.
+
+        Args:
+            product: Product model
+        """
+        self.product = product
+        self.name = product.name
+        self.concentration = product.concentration or "Not specified"
+        self.key_ingredients = ", ".join(product.key_ingredients)
+        self.benefits = ", ".join(product.benefits)
+        self.price = product.price
+        self.skin_types = ", ".join(product.skin_types)
+        self.usage_instructions = product.usage_instructions
+        self.side_effects = ", ".join(product.side_effects) if product.side_effects else "Minimal"
+        self.parsed_price: ParsedPrice = parse_price(product.price)
+        # Product summary used by comparison fragments (shared, do not mutate)
+        self.profile = {
+            "name": product.name,
+            "concentration": product.concentration,
+            "benefits": product.benefits,
+            "price": product.price,
+            "skin_types": product.skin_types,
+        }
+
+
+def value_for_money(row_a: ComparisonHalfRow, row_b: ComparisonHalfRow) -> Tuple[str, str]:
+    """Relative price positioning of two products."""
+    price_a = row_a.parsed_price
+    price_b = row_b.parsed_price
+    if price_a.currency != price_b.currency or price_a.value == price_b.value:
+        return "Comparable pricing", "Comparable pricing"
+    if price_a.value < price_b.value:
+        return "Lower-priced option", "Higher-priced option"
+    return "Higher-priced option", "Lower-priced option"
+
+
+class ComparisonEngine:
+    """
+    Comparison pages and fragments for arbitrary product pairs.
+
+    Half-rows are memoized by product name, so a product compared N times
+    is prepared once. A memoized row is reused only for the same or an
+    equal product, so changed data under the same name is recomputed.
+    """
+
+    def __init__(self, max_rows: Optional[int] = None):
+        """
+        Initialize engine.
+
+        Args:
+            max_rows: Half-rows kept (least recently used are dropped;
+                default: unbounded, for comparison matrices)
+
+        Raises:
+            ValueError: If max_rows is not positive
+        """
+        if max_rows is not None and max_rows < 1:
+            raise ValueError(f"Comparison engine needs at least one row, got {max_rows}")
+        self.max_rows = max_rows
+        self._rows: "OrderedDict[str, ComparisonHalfRow]" = OrderedDict()
+
+    def half_row(self, product: Product) -> ComparisonHalfRow:
+        """A product's half-row, computed on first use."""
+        rows = self._rows
+        row = rows.get(product.name)
+        if row is None or (row.product is not product and row.product != product):
+            row = rows[product.name] = ComparisonHalfRow(product)
+            if self.max_rows is not None and len(rows) > self.max_rows:
+                rows.popitem(last=False)
+        elif self.max_rows is not None:
+            rows.move_to_end(product.name)
+        return row
+
+    def items(self, product_a: Product, product_b: Product) -> List[ComparisonPageItem]:
+        """Comparison page items of one pair."""
+        return self._items(self.half_row(product_a), self.half_row(product_b))
+
+    @staticmethod
+    def _items(a: ComparisonHalfRow, b: ComparisonHalfRow) -> List[ComparisonPageItem]:
+        value_a, value_b = value_for_money(a, b)
+        return [
+            ComparisonPageItem("Vitamin C Concentration", a.concentration, b.concentration),
+            ComparisonPageItem("Key Ingredients", a.key_ingredients, b.key_ingredients),
+            ComparisonPageItem("Main Benefits", a.benefits, b.benefits),
+            ComparisonPageItem("Price", a.price, b.price),
+            ComparisonPageItem("Suitable for Skin Types", a.skin_types, b.skin_types),
+            ComparisonPageItem("Application Frequency", a.usage_instructions, b.usage_instructions),
+            ComparisonPageItem("Potential Side Effects", a.side_effects, b.side_effects),
+            ComparisonPageItem("Value for Money", value_a, value_b),
+        ]
+
+    def page(self, product_a: Product, product_b: Product) -> ComparisonPage:
+        """
+        Comparison page of one pair.
+
+        Args:
+            product_a: Primary product
+            product_b: Competitor
+
+        Returns:
+            ComparisonPage
+        """
+        a = self.half_row(product_a)
+        b = self.half_row(product_b)
+        return ComparisonPage(
+            page_type="comparison",
+            product_a_name=a.name,
+            product_b_name=b.name,
+            comparison_items=self._items(a, b),
+        )
+
+    def matrix(self, products: Sequence[Product], pairs: Iterable[Tuple[int, int]]) -> Iterator[ComparisonPage]:
+        """
+        Comparison pages for many pairs, each product prepared once.
+
+        Args:
+            products: Products the pairs index into
+            pairs: (index of product A, index of product B) pairs, e.g.
+                itertools.permutations(range(len(products)), 2) for a full grid
+
+        Returns:
+            Iterator of ComparisonPage, in pair order
+        """
+        rows: List[Optional[ComparisonHalfRow]] = [None] * len(products)
+        for index_a, index_b in pairs:
+            a = rows[index_a]
+            if a is None:
+                a = rows[index_a] = self.half_row(products[index_a])
+            b = rows[index_b]
+            if b is None:
+                b = rows[index_b] = self.half_row(products[index_b])
+            yield ComparisonPage(
+                page_type="comparison",
+                product_a_name=a.name,
+                product_b_name=b.name,
+                comparison_items=self._items(a, b),
+            )
+
+    def fragment(self, product_a: Product, product_b: Product) -> ContentFragment:
+        """
+        Comparison content fragment of one pair (see ComparisonLogicBlock).
+
+        Returns:
+            ContentFragment with comparison content
+        """
+        a = self.half_row(product_a)
+        b = self.half_row(product_b)
+        comparison_content = {
+            "title": f"{a.name} vs {b.name}",
+            "product_a": a.profile,
+            "product_b": b.profile,
+            "comparison_metrics": [
+                {
+                    "metric": "Concentration",
+                    "product_a": a.profile["concentration"] or "N/A",
+                    "product_b": b.profile["concentration"] or "N/A",
+                },
+                {
+                    "metric": "Price",
+                    "product_a": a.price,
+                    "product_b": b.price,
+                },
+                {
+                    "metric": "Suitable Skin Types",
+                    "product_a": a.skin_types,
+                    "product_b": b.skin_types,
+                },
+            ],
+        }
+
+        return ContentFragment(
+            block_type="comparison",
+            content=comparison_content,
+            product_name=f"{a.name} and {b.name}",
+        )
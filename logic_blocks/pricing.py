@@ -0,0 +1,130 @@
+"""
+Price engine: Normalizes raw price strings into numeric values and currencies.
+Responsibility: Price parsing only - content is built by PriceLogicBlock.
+
+Handles currency symbols and codes before or after the amount
+("₹699", "Rs. 699", "699 INR", "$24.99", "€1.299,00"), decimals, and
+thousands grouping in Western ("1,299,000") and Indian ("1,00,000") style.
+A catalog batch is parsed as one PriceColumn of typed arrays; repeated
+price strings are parsed once per column.
+"""
+
+import re
+from array import array
+from typing import Dict, List, NamedTuple, Sequence
+
+
+# Currency codes by ID; ID 0 is the default for prices without a currency marker
+CURRENCY_CODES = ("USD", "INR", "EUR", "GBP", "JPY")
+
+_CURRENCY_IDS = {code: currency_id for currency_id, code in enumerate(CURRENCY_CODES)}
+_CURRENCY_SYMBOLS = (("₹", "INR"), ("€", "EUR"), ("£", "GBP"), ("¥", "JPY"), ("$", "USD"))
+_CURRENCY_WORDS = re.compile(r"(?<![A-Z])(INR|RS|USD|EUR|GBP|JPY)(?![A-Z])")
+_AMOUNT = re.compile(r"\d(?:[\d,.]*\d)?")
+_GROUPED = re.compile(r"\d{1,3}(?:,\d{2,3})*,\d{3}")
+
+# Prices above this are "Mid-range premium", the rest "Affordable"
+PREMIUM_PRICE_THRESHOLD = 500
+PRICE_RANGES = ("Affordable", "Mid-range premium")
+
+
+class ParsedPrice(NamedTuple):
+    """Numeric value and ISO currency code of a price string."""
+    value: float
+    currency: str
+
+
+def parse_amount(text: str) -> float:
+    """
+    Parse the first amount in a price string.
+
+    The separator that occurs last is the decimal point when both "," and
+    "." appear. A lone "," is a thousands separator when it groups digits
+    in threes (or Indian-style twos before a final three), otherwise a
+    decimal comma.
+
+    Returns:
+        Amount, or 0.0 if the string has no digits
+    """
+    match = _AMOUNT.search(text)
+    if match is None:
+        return 0.0
+    amount = match.group()
+    if "," in amount and "." in amount:
+        if amount.rindex(",") > amount.rindex("."):
+            amount = amount.replace(".", "").replace(",", ".")
+        else:
+            amount = amount.replace(",", "")
+    elif "," in amount:
+        if _GROUPED.fullmatch(amount) or amount.count(",") > 1:
+            amount = amount.replace(",", "")
+        else:
+            amount = amount.replace(",", ".")
+    elif amount.count(".") > 1:
+        amount = amount.replace(".", "")
+    return float(amount)
+
+
+def parse_currency(text: str) -> str:
+    """
+    ISO code of the currency a price string names.
+
+    Returns:
+        Currency code (CURRENCY_CODES[0] if no symbol or code is present)
+    """
+    for symbol, code in _CURRENCY_SYMBOLS:
+        if symbol in text:
+            return code
+    match = _CURRENCY_WORDS.search(text.upper())
+    if match is not None:
+        word = match.group(1)
+        return "INR" if word == "RS" else word
+    return CURRENCY_CODES[0]
+
+
+def parse_price(text: str) -> ParsedPrice:
+    """Parse one price string (see PriceColumn for whole batches)."""
+    return ParsedPrice(parse_amount(text), parse_currency(text))
+
+
+def price_range(value: float, threshold: float = PREMIUM_PRICE_THRESHOLD) -> str:
+    """Price range label of one value."""
+    return PRICE_RANGES[value > threshold]
+
+
+class PriceColumn:
+    """
+    Parsed prices of a product batch, one typed array per attribute.
+
+    values holds each row's amount and currency_ids each row's index into
+    CURRENCY_CODES, aligned with ProductBatch.prices.
+    """
+
+    def __init__(self, prices: Sequence[str]):
+        """
+        Parse a column of price strings.
+
+        Args:
+            prices: Raw price strings, e.g. ProductBatch.prices
+        """
+        parsed: Dict[str, ParsedPrice] = {}
+        for text in prices:
+            if text not in parsed:
+                parsed[text] = parse_price(text)
+        rows = [parsed[text] for text in prices]
+        self.values = array("d", [row.value for row in rows])
+        self.currency_ids = array("B", [_CURRENCY_IDS[row.currency] for row in rows])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> ParsedPrice:
+        return ParsedPrice(self.values[row], CURRENCY_CODES[self.currency_ids[row]])
+
+    def currencies(self) -> List[str]:
+        """Currency code of every row."""
+        return [CURRENCY_CODES[currency_id] for currency_id in self.currency_ids]
+
+    def price_ranges(self, threshold: float = PREMIUM_PRICE_THRESHOLD) -> List[str]:
+        """Price range label of every row."""
+        return [PRICE_RANGES[value > threshold] for value in self.values]
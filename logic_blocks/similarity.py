@@ -0,0 +1,192 @@
+"""
+Similarity index: Finds the catalog products most similar to a product.
+Responsibility: Nearest-neighbour retrieval only - pages are built by ComparisonPageAgent.
+
+Products are compared by the Jaccard similarity of their ingredient,
+skin-type and benefit sets. Every (field, value) pair gets a vocabulary
+ID and each product is stored as its sorted, distinct IDs in one flat
+array with per-product offsets, so a product costs a few bytes per
+feature however large the catalog's vocabulary grows, and an exact
+similarity is one set intersection over the candidate's IDs.
+
+Retrieval is sub-linear through MinHash locality-sensitive hashing: each
+product's MinHash signature is cut into bands, and products sharing any
+band value land in the same bucket. A query ranks a bounded slice of its
+buckets by the number of bands shared and scores only the max_candidates
+most frequent products exactly, never the whole catalog.
+"""
+
+import heapq
+import random
+from array import array
+from collections import Counter
+from itertools import islice
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from models import Product, Vocabulary
+
+
+# Product list fields compared, and the separator between field and value in feature keys
+SIMILARITY_FIELDS = ("key_ingredients", "skin_types", "benefits")
+_FEATURE_SEPARATOR = "\0"
+
+# Mersenne prime modulus of the MinHash permutations
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+def jaccard(features_a: AbstractSet[int], features_b: Sequence[int]) -> float:
+    """Jaccard similarity of a feature ID set and a sequence of distinct feature IDs."""
+    shared = len(features_a.intersection(features_b))
+    union = len(features_a) + len(features_b) - shared
+    if not union:
+        return 0.0
+    return shared / union
+
+
+class SimilarityIndex:
+    """
+    MinHash LSH index over a catalog's products.
+    """
+
+    def __init__(self, num_hashes: int = 32, band_size: int = 4, max_candidates: int = 128, seed: int = 0):
+        """
+        Initialize an empty index.
+
+        Args:
+            num_hashes: MinHash signature length
+            band_size: Signature values per LSH band (smaller finds more
+                distant neighbours, larger gives smaller buckets)
+            max_candidates: Products scored exactly per query
+            seed: Seed of the MinHash permutations
+
+        Raises:
+            ValueError: If num_hashes is not a positive multiple of band_size
+        """
+        if band_size < 1 or num_hashes < band_size or num_hashes % band_size:
+            raise ValueError(f"num_hashes ({num_hashes}) must be a positive multiple of band_size ({band_size})")
+        self.band_size = band_size
+        self.max_candidates = max_candidates
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME)) for _ in range(num_hashes)
+        ]
+        self.vocabulary = Vocabulary()
+        self.products: List[Product] = []
+        # Sorted distinct feature IDs of product i: feature_ids[offsets[i]:offsets[i + 1]]
+        self._feature_ids = array("I")
+        self._feature_offsets = array("q", [0])
+        self._ids: Dict[str, int] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(num_hashes // band_size)]
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __contains__(self, product_name: str) -> bool:
+        return product_name in self._ids
+
+    def feature_ids(self, product: Product) -> List[int]:
+        """Sorted distinct vocabulary IDs of a product's (field, value) features."""
+        id_of = self.vocabulary.id_of
+        return sorted({
+            id_of(field_name + _FEATURE_SEPARATOR + value)
+            for field_name in SIMILARITY_FIELDS
+            for value in getattr(product, field_name)
+        })
+
+    def features(self, product_id: int) -> array:
+        """Sorted distinct feature IDs of an indexed product."""
+        offsets = self._feature_offsets
+        return self._feature_ids[offsets[product_id]:offsets[product_id + 1]]
+
+    def _signature(self, feature_ids: List[int]) -> List[int]:
+        if not feature_ids:
+            return []
+        prime = _MINHASH_PRIME
+        return [min((a * feature_id + b) % prime for feature_id in feature_ids) for a, b in self._permutations]
+
+    def _bands(self, signature: List[int]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        size = self.band_size
+        return ((band, tuple(signature[band * size:(band + 1) * size])) for band in range(len(self._buckets)))
+
+    def add(self, product: Product) -> int:
+        """
+        Index a product. A product re-added under the same name keeps its
+        first entry.
+
+        Returns:
+            Product ID within the index
+        """
+        product_id = self._ids.get(product.name)
+        if product_id is not None:
+            return product_id
+        feature_ids = self.feature_ids(product)
+        product_id = self._ids[product.name] = len(self.products)
+        self.products.append(product)
+        self._feature_ids.extend(feature_ids)
+        self._feature_offsets.append(len(self._feature_ids))
+        buckets = self._buckets
+        for band, key in self._bands(self._signature(feature_ids)):
+            buckets[band].setdefault(key, []).append(product_id)
+        return product_id
+
+    def add_all(self, products: Iterable[Product]) -> None:
+        """Index many products."""
+        for product in products:
+            self.add(product)
+
+    def nearest(self, product: Product, k: int = 5) -> List[Tuple[Product, float]]:
+        """
+        The k indexed products most similar to a product (itself excluded).
+
+        Args:
+            product: Product to find competitors for (indexed or not)
+            k: Number of neighbours
+
+        Returns:
+            (product, Jaccard similarity) pairs, most similar first; ties
+            go to the product indexed first. Fewer than k if the buckets
+            hold fewer candidates.
+        """
+        product_id = self._ids.get(product.name)
+        if product_id is not None:
+            feature_ids = self.features(product_id)
+        else:
+            ids = self.vocabulary.ids
+            keys = (
+                field_name + _FEATURE_SEPARATOR + value
+                for field_name in SIMILARITY_FIELDS
+                for value in getattr(product, field_name)
+            )
+            feature_ids = sorted({ids[key] for key in keys if key in ids})
+        query = set(feature_ids)
+
+        # Products sharing more bands are likelier to be similar: count band
+        # collisions over a bounded slice of each bucket, then score the
+        # most frequent candidates exactly
+        collisions = Counter()
+        probe = self.max_candidates
+        for band, key in self._bands(self._signature(feature_ids)):
+            collisions.update(islice(self._buckets[band].get(key, ()), probe))
+        collisions.pop(product_id, None)
+        candidates = [candidate for candidate, _ in collisions.most_common(self.max_candidates)]
+
+        features = self.features
+        best = heapq.nsmallest(
+            k,
+            ((-jaccard(query, features(candidate)), candidate) for candidate in candidates),
+        )
+        return [(self.products[candidate], -score) for score, candidate in best]
+
+    def nearest_one(self, product: Product) -> Optional[Product]:
+        """The most similar indexed product, or None if there is no candidate."""
+        neighbours = self.nearest(product, 1)
+        return neighbours[0][0] if neighbours else None
+
+    def neighbour_pairs(self, k: int = 5) -> Iterator[Tuple[int, int]]:
+        """
+        (product ID, neighbour ID) pairs of every indexed product's k nearest
+        neighbours, e.g. for ComparisonEngine.matrix(index.products, pairs).
+        """
+        for product_id, product in enumerate(self.products):
+            for neighbour, _ in self.nearest(product, k):
+                yield product_id, self._ids[neighbour.name]
@@ -1,15 +1,238 @@
 """
 Main entry point for the agentic content generation system.
-Executes the pipeline with sample product data.
+Executes the pipeline with sample product data, or over a catalog file.
+
+Usage:
+    python main.py                              # Sample product
+    python main.py --catalog products.jsonl     # Catalog mode (JSONL or CSV)
 """
 
+import argparse
+import json
+
+from agents.answer_backends import HTTPAnswerBackend
+from agents.parser_agent import DEFAULT_FIELD_ALIASES, merge_field_aliases
+from orchestrator.catalog import read_catalog
+from orchestrator.checkpoint import DEFAULT_CHECKPOINT_INTERVAL
+from orchestrator.dedup import DedupPageStoreReader
+from orchestrator.instrumentation import ConsoleReporter, Instrumentation
 from orchestrator.pipeline import OrchestratorAgent
+from orchestrator.writers import OUTPUT_LAYOUTS
+
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Agentic content generation pipeline")
+    parser.add_argument(
+        "--catalog",
+        help="Path to a JSONL or CSV product catalog; runs every product",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="output",
+        help="Directory for JSON outputs (default: output)",
+    )
+    parser.add_argument(
+        "--aliases",
+        help="JSON file of extra field aliases, e.g. {\"price\": [\"MRP\"]}",
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write JSON without indentation (default: indent=2)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Catalog mode: only regenerate pages whose inputs or code changed",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=DEFAULT_CHECKPOINT_INTERVAL,
+        help="Catalog mode: records between resume checkpoints, 0 to disable "
+        f"(default: {DEFAULT_CHECKPOINT_INTERVAL})",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Catalog mode: continue an interrupted run from its last checkpoint",
+    )
+    parser.add_argument(
+        "--metrics",
+        help="Write per-stage timing summary (JSON) to this path",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for catalog mode (default: 1)",
+    )
+    parser.add_argument(
+        "--node-workers",
+        type=int,
+        default=1,
+        help="Threads running independent page graph nodes of one product "
+        "concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--show-graph",
+        action="store_true",
+        help="Print the per-product page graph in Graphviz DOT format and exit",
+    )
+    parser.add_argument(
+        "--block-cache-size",
+        type=int,
+        default=0,
+        help="Memoize up to N logic block fragments across products with "
+        "identical block inputs (default: 0, disabled)",
+    )
+    parser.add_argument(
+        "--block-cache",
+        help="SQLite file that keeps memoized logic block fragments across runs",
+    )
+    parser.add_argument(
+        "--compare-catalog",
+        action="store_true",
+        help="Catalog mode: compare each product with its most similar catalog "
+        "product instead of the fictional Product B (reads the catalog twice)",
+    )
+    parser.add_argument(
+        "--answer-server",
+        help="Catalog mode: URL of a model server producing FAQ answer text "
+        "(default: answers are formatted locally)",
+    )
+    parser.add_argument(
+        "--answer-model",
+        default="default",
+        help="Model name sent to the answer server (default: default)",
+    )
+    parser.add_argument(
+        "--answer-cache",
+        help="SQLite file that keeps answer server responses across runs",
+    )
+    parser.add_argument(
+        "--answer-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait for each answer server call before falling back "
+        "to local answers (default: 30)",
+    )
+    parser.add_argument(
+        "--answer-concurrency",
+        type=int,
+        default=4,
+        help="Answer server calls in flight at a time (default: 4)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="Products per worker task in catalog mode (default: 64)",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=256,
+        help="Maximum records in flight in the streaming stages (default: 256)",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=sorted(OUTPUT_LAYOUTS),
+        default="flat",
+        help="Catalog output layout: one directory per product, nested "
+        "hash-prefix shard directories, a single JSONL/SQLite bundle, or a "
+        "memory-mapped page archive or a content-addressed bundle that "
+        "stores repeated answers and page templates once (default: flat)",
+    )
+    parser.add_argument(
+        "--background-writes",
+        action="store_true",
+        help="Catalog mode: write pages on a background I/O thread",
+    )
+    parser.add_argument(
+        "--write-in-parent",
+        action="store_true",
+        help="Stream pages back from workers and write them in the main process",
+    )
+    return parser.parse_args(argv)
 
-def main():
+
+def main(argv=None):
     """
     Main function: Execute the content generation pipeline.
     """
+    args = parse_args(argv)
+    instrumentation = Instrumentation() if args.metrics else None
+    field_aliases = None
+    if args.aliases:
+        with open(args.aliases, "r", encoding="utf-8") as f:
+            field_aliases = merge_field_aliases(DEFAULT_FIELD_ALIASES, json.load(f))
+
+    if args.catalog:
+        orchestrator = OrchestratorAgent(
+            output_dir=args.output_dir,
+            instrumentation=instrumentation,
+            incremental=args.incremental,
+            field_aliases=field_aliases,
+            compact_json=args.compact_json,
+            output_layout=args.layout,
+            background_writes=args.background_writes,
+            node_workers=args.node_workers,
+            block_cache_size=args.block_cache_size,
+            block_cache_path=args.block_cache,
+            answer_backend=HTTPAnswerBackend(args.answer_server, model=args.answer_model) if args.answer_server else None,
+            answer_cache_path=args.answer_cache,
+            answer_concurrency=args.answer_concurrency,
+            answer_timeout=args.answer_timeout,
+        )
+        if args.compare_catalog:
+            orchestrator.build_comparison_index(read_catalog(args.catalog))
+        summary = orchestrator.execute_catalog(
+            read_catalog(args.catalog),
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            write_in_workers=not args.write_in_parent,
+            window=args.window,
+            checkpoint_every=args.checkpoint_every,
+            resume=args.resume,
+        )
+        if summary.resumed_from:
+            print(f"Resumed from record {summary.resumed_from}")
+        print(
+            f"Catalog complete: {summary.processed} products processed, "
+            f"{summary.skipped} unchanged, {summary.failed} failed"
+        )
+        for error in summary.errors:
+            print(f"  - {error}")
+        if summary.block_cache:
+            counts = summary.block_cache
+            print(
+                f"Logic block cache: {counts['hits'] + counts['disk_hits']} hits "
+                f"({counts['disk_hits']} from disk), {counts['misses']} misses"
+            )
+        if summary.answers:
+            counts = summary.answers
+            print(
+                f"FAQ answers: {counts['requested']} requested, {counts['hits'] + counts['disk_hits']} cached "
+                f"({counts['disk_hits']} from disk), {counts['misses']} from {counts['backend_calls']} "
+                f"server calls, {counts['failed']} fell back to local answers"
+            )
+        if args.layout == "dedup" and summary.processed:
+            with DedupPageStoreReader(args.output_dir) as reader:
+                stats = reader.stats()
+            print(
+                f"Dedup bundle: {stats['pages']} pages, {stats['unique_templates']} templates, "
+                f"{stats['unique_answers']} unique of {stats['answers']} answers; "
+                f"{stats['page_bytes']} bytes stored in {stats['stored_bytes']} ({stats['dedup_ratio']}x)"
+            )
+            for page_type, counts in stats["by_page_type"].items():
+                print(f"  - {page_type}: {counts['page_bytes']} bytes in {counts['stored_bytes']} ({counts['dedup_ratio']}x)")
+        if summary.unknown_keys:
+            print(f"Unmapped input fields: {', '.join(summary.unknown_keys)}")
+        if instrumentation:
+            instrumentation.write_json(args.metrics)
+        return
 
     # Product data - ONLY SOURCE OF TRUTH
     raw_product_data = {
@@ -24,8 +247,20 @@ def main():
     }
 
     # Initialize and execute orchestrator
-    orchestrator = OrchestratorAgent(output_dir="output")
+    orchestrator = OrchestratorAgent(
+        output_dir=args.output_dir,
+        instrumentation=instrumentation,
+        reporter=ConsoleReporter(),
+        field_aliases=field_aliases,
+        compact_json=args.compact_json,
+        node_workers=args.node_workers,
+    )
+    if args.show_graph:
+        print(orchestrator.graph.to_dot())
+        return
     orchestrator.execute_pipeline(raw_product_data)
+    if instrumentation:
+        instrumentation.write_json(args.metrics)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,20 @@
 """
 Data models and type definitions for the agentic content generation system.
 Ensures type safety and clear contracts between agents.
+
+Compact layouts: every per-item model (Product, Question, ContentFragment,
+FAQItem, ProductPageField, ComparisonPageItem) also exists as a
+__slots__ variant (Slotted*) and a frozen, hashable, tuple-backed variant
+(Frozen*). Setting ACGS_MODEL_LAYOUT=slots or ACGS_MODEL_LAYOUT=frozen
+before import rebinds the public names to those variants.
 """
 
+import dataclasses
+import os
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional
 
 
 @dataclass
@@ -36,6 +46,133 @@ class Product:
         }
 
 
+# Product fields stored as lists
+PRODUCT_LIST_FIELDS = ("skin_types", "key_ingredients", "benefits", "side_effects")
+
+
+class Vocabulary:
+    """
+    Shared dictionary of repeated categorical values (skin types,
+    ingredients, benefits, side effects).
+
+    Each distinct string gets one canonical object and a dense integer ID,
+    so products reuse the same string objects and batches can store ID
+    arrays. The vocabulary grows with the number of distinct values.
+    """
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def id_of(self, value: str) -> int:
+        """ID of a value, assigning a new one if unseen."""
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return value_id
+
+    def intern(self, value: str) -> str:
+        """Canonical string object for a value."""
+        return self.strings[self.id_of(value)]
+
+    def intern_all(self, values: List[str]) -> List[str]:
+        """Canonical string objects for a list of values."""
+        strings = self.strings
+        return [strings[self.id_of(value)] for value in values]
+
+    def encode(self, values: List[str]) -> array:
+        """Encode values as an array of IDs."""
+        ids = self.ids
+        if all(value in ids for value in values):
+            return array("I", map(ids.__getitem__, values))
+        return array("I", map(self.id_of, values))
+
+    def decode(self, value_ids) -> List[str]:
+        """Decode IDs back to canonical strings."""
+        return list(map(self.strings.__getitem__, value_ids))
+
+    def bitset(self, values: List[str]) -> int:
+        """
+        Encode a set of values as an integer bitset over IDs.
+        Set overlap is then `a & b` and its size `bin(a & b).count("1")`.
+        """
+        bits = 0
+        for value in values:
+            bits |= 1 << self.id_of(value)
+        return bits
+
+
+@dataclass
+class ProductBatch:
+    """
+    Columnar (struct-of-arrays) batch of products.
+
+    Scalar fields are stored one list per field. Each list field is
+    stored as one flat array of vocabulary IDs plus an offsets array of
+    length len(batch) + 1: row i owns ids[offsets[i]:offsets[i + 1]].
+    """
+    names: List[str] = field(default_factory=list)
+    concentrations: List[str] = field(default_factory=list)
+    usage_instructions: List[str] = field(default_factory=list)
+    prices: List[str] = field(default_factory=list)
+    vocabulary: Vocabulary = field(default_factory=Vocabulary)
+    list_ids: Dict[str, array] = field(default_factory=dict)
+    list_offsets: Dict[str, array] = field(default_factory=dict)
+    source_indices: array = field(default_factory=lambda: array("q"))  # Input index of each row
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def value_ids(self, field_name: str, row: int) -> array:
+        """Vocabulary IDs of a list field for one row."""
+        offsets = self.list_offsets[field_name]
+        return self.list_ids[field_name][offsets[row]:offsets[row + 1]]
+
+    def values(self, field_name: str, row: int) -> List[str]:
+        """Values of a list field for one row."""
+        return self.vocabulary.decode(self.value_ids(field_name, row))
+
+    def product(self, row: int) -> Product:
+        """Materialize one row as a Product for the existing agents."""
+        return Product(
+            name=self.names[row],
+            concentration=self.concentrations[row],
+            skin_types=self.values("skin_types", row),
+            key_ingredients=self.values("key_ingredients", row),
+            benefits=self.values("benefits", row),
+            usage_instructions=self.usage_instructions[row],
+            side_effects=self.values("side_effects", row),
+            price=self.prices[row],
+        )
+
+    def __getitem__(self, row: int) -> Product:
+        return self.product(row)
+
+    def _rows(self, field_name: str) -> Iterator[List[str]]:
+        """Per-row decoded values of a list field, in row order."""
+        ids = self.list_ids[field_name]
+        offsets = self.list_offsets[field_name]
+        return map(self.vocabulary.decode, map(ids.__getitem__, map(slice, offsets, islice(offsets, 1, None))))
+
+    def __iter__(self) -> Iterator[Product]:
+        columns = zip(
+            self.names,
+            self.concentrations,
+            self._rows("skin_types"),
+            self._rows("key_ingredients"),
+            self._rows("benefits"),
+            self.usage_instructions,
+            self._rows("side_effects"),
+            self.prices,
+        )
+        for name, concentration, skin_types, key_ingredients, benefits, usage, side_effects, price in columns:
+            yield Product(name, concentration, skin_types, key_ingredients, benefits, usage, side_effects, price)
+
+
 @dataclass
 class Question:
     """
@@ -72,6 +209,9 @@ class FAQPage:
     product_name: str = ""
     total_questions: int = 0
     faqs: List[FAQItem] = field(default_factory=list)
+    # Answer contexts formatted locally because the answer backend failed
+    # (build metadata only: not serialized or compared)
+    fallback_answers: int = field(default=0, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -148,3 +288,104 @@ class ComparisonPage:
                 for item in self.comparison_items
             ],
         }
+
+
+# ---------------------------------------------------------------------------
+# Compact model layouts
+# ---------------------------------------------------------------------------
+
+def _frozen_post_init(self) -> None:
+    """Store list fields as tuples so frozen models are hashable."""
+    for name in self.__slots__:
+        value = getattr(self, name)
+        if isinstance(value, list):
+            object.__setattr__(self, name, tuple(value))
+
+
+def _slots_getstate(self):
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _slots_setstate(self, state) -> None:
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def compact_model(cls: type, frozen: bool = False) -> type:
+    """
+    Build a __slots__ variant of a model dataclass.
+
+    Instances have no per-instance __dict__. With frozen=True the variant
+    is immutable and hashable, and list fields are stored as tuples
+    (hashing still requires every field value to be hashable).
+
+    Args:
+        cls: Model dataclass
+        frozen: Build the frozen, tuple-backed variant
+
+    Returns:
+        New dataclass with the same fields, defaults and methods
+    """
+    namespace = {
+        name: value
+        for name, value in cls.__dict__.items()
+        if name not in ("__dict__", "__weakref__") and not name.startswith("__dataclass")
+    }
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    for model_field in dataclasses.fields(cls):
+        namespace[model_field.name] = field(
+            default=model_field.default,
+            default_factory=model_field.default_factory,
+        )
+    for name in ("__init__", "__repr__", "__eq__", "__hash__", "__setattr__", "__delattr__"):
+        namespace.pop(name, None)
+    if frozen:
+        namespace["__post_init__"] = _frozen_post_init
+
+    prefix = "Frozen" if frozen else "Slotted"
+    variant = dataclass(frozen=frozen)(type(prefix + cls.__name__, (), namespace))
+
+    # Rebuild the class with slots; the generated __init__ holds the defaults
+    slotted = dict(variant.__dict__)
+    for name in field_names + ("__dict__", "__weakref__"):
+        slotted.pop(name, None)
+    slotted["__slots__"] = field_names
+    slotted["__getstate__"] = _slots_getstate
+    slotted["__setstate__"] = _slots_setstate
+    slotted["__qualname__"] = prefix + cls.__name__
+    return type(variant)(variant.__name__, variant.__bases__, slotted)
+
+
+SlottedProduct = compact_model(Product)
+SlottedQuestion = compact_model(Question)
+SlottedContentFragment = compact_model(ContentFragment)
+SlottedFAQItem = compact_model(FAQItem)
+SlottedProductPageField = compact_model(ProductPageField)
+SlottedComparisonPageItem = compact_model(ComparisonPageItem)
+
+FrozenProduct = compact_model(Product, frozen=True)
+FrozenQuestion = compact_model(Question, frozen=True)
+FrozenContentFragment = compact_model(ContentFragment, frozen=True)
+FrozenFAQItem = compact_model(FAQItem, frozen=True)
+FrozenProductPageField = compact_model(ProductPageField, frozen=True)
+FrozenComparisonPageItem = compact_model(ComparisonPageItem, frozen=True)
+
+# Model layout selected for this process: dataclass (default), slots or frozen
+MODEL_LAYOUT = os.environ.get("ACGS_MODEL_LAYOUT", "dataclass")
+
+if MODEL_LAYOUT == "slots":
+    Product = SlottedProduct
+    Question = SlottedQuestion
+    ContentFragment = SlottedContentFragment
+    FAQItem = SlottedFAQItem
+    ProductPageField = SlottedProductPageField
+    ComparisonPageItem = SlottedComparisonPageItem
+elif MODEL_LAYOUT == "frozen":
+    Product = FrozenProduct
+    Question = FrozenQuestion
+    ContentFragment = FrozenContentFragment
+    FAQItem = FrozenFAQItem
+    ProductPageField = FrozenProductPageField
+    ComparisonPageItem = FrozenComparisonPageItem
+elif MODEL_LAYOUT != "dataclass":
+    raise ValueError(f"Unknown ACGS_MODEL_LAYOUT: {MODEL_LAYOUT}")
@@ -0,0 +1,361 @@
+"""
+Page archive: Read-optimized, memory-mapped bundle of encoded pages.
+Responsibility: Archive format and I/O only - pages arrive already encoded.
+
+Files in the output directory:
+- pages.dat: packed records, each the UTF-8 key "<product_name>\\0<page_type>"
+  immediately followed by the page's JSON bytes
+- pages.idx: header, then four columns sorted by product name hash:
+  name hashes (u64), record offsets (u64), key lengths (u32), page lengths (u32)
+- pages.idx.journal (while writing): (record offset, key length, page
+  length) of every record appended since pages.idx was last written
+
+The writer appends each batch's records and their journal entries, and
+sorts and writes pages.idx once, on close, so flushes (and catalog
+checkpoints) cost only the new records. A run that stops early leaves the
+journal behind; the next writer replays it.
+
+Readers mmap both files. A lookup is a binary search over the hash
+column (a product's pages are adjacent), a key comparison against
+pages.dat and a memoryview slice of the page bytes - nothing is parsed
+or copied.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+ARCHIVE_DATA_FILENAME = "pages.dat"
+ARCHIVE_INDEX_FILENAME = "pages.idx"
+ARCHIVE_JOURNAL_FILENAME = "pages.idx.journal"
+
+# Index header: magic, byte order flag (b"<" or b">"), padding, entry count
+_INDEX_MAGIC = b"ACGSIDX1"
+_INDEX_HEADER = struct.Struct("=8sc7xQ")
+_BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+# Journal entry: record offset, key length, page length
+_JOURNAL_ENTRY = struct.Struct("=QII")
+
+
+def archive_key(product_name: str, page_type: str) -> bytes:
+    """Encoded archive key of one page."""
+    return f"{product_name}\0{page_type}".encode("utf-8")
+
+
+def name_hash(product_name: bytes) -> int:
+    """
+    64-bit hash of an encoded product name, used to order and search the index.
+    Collisions only cost an extra key comparison.
+    """
+    return (zlib.crc32(product_name) << 32) | zlib.adler32(product_name)
+
+
+class PageArchiveWriter:
+    """
+    Builds a page archive.
+
+    Records are appended to pages.dat in buffered batches and journaled;
+    pages.idx is sorted and atomically replaced on close. Writing into an
+    existing archive keeps its pages, and a re-written page replaces the
+    old entry (the superseded bytes stay in pages.dat).
+    """
+
+    # One appender per archive; worker processes hand pages to the parent
+    process_safe = False
+
+    def __init__(self, output_dir: Union[str, Path], buffer_size: int = 1024):
+        """
+        Initialize writer. Files are opened on the first write.
+
+        Args:
+            output_dir: Directory holding the archive
+            buffer_size: Products buffered before a batch is appended
+        """
+        self.data_path = Path(output_dir) / ARCHIVE_DATA_FILENAME
+        self.index_path = Path(output_dir) / ARCHIVE_INDEX_FILENAME
+        self.journal_path = Path(output_dir) / ARCHIVE_JOURNAL_FILENAME
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[Tuple[str, Dict[str, bytes]]] = []
+        self._data = None
+        self._journal = None
+        self._offset = 0
+        self._journal_offset = 0
+        # key -> (record offset, key length, page length)
+        self._entries: Optional[Dict[bytes, Tuple[int, int, int]]] = None
+
+    def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Queue one product's pages for writing.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> encoded JSON page
+        """
+        self._buffer.append((product_name, pages))
+        if len(self._buffer) >= self.buffer_size:
+            self._append()
+
+    def flush(self) -> None:
+        """Append buffered pages and their journal entries (the index is written on close)."""
+        self._append()
+
+    def close(self) -> None:
+        """Flush, publish the sorted index and close the files."""
+        self._append()
+        if self._data is not None:
+            self._write_index()
+            self._data.close()
+            self._journal.close()
+            self._data = self._journal = None
+            self._entries = None
+            self.journal_path.unlink()
+
+    def committed_state(self) -> Dict[str, int]:
+        """Sizes of the flushed data file and journal, stored in catalog checkpoints."""
+        if self._data is not None:
+            return {"data_size": self._offset, "journal_size": self._journal_offset}
+        return {
+            "data_size": self.data_path.stat().st_size if self.data_path.exists() else 0,
+            "journal_size": self.journal_path.stat().st_size if self.journal_path.exists() else 0,
+        }
+
+    def restore(self, state: Optional[Dict[str, int]]) -> None:
+        """Truncate the data file and journal to a checkpoint, dropping the records written after it."""
+        if not state or self._data is not None or not self.data_path.exists():
+            return
+        with open(self.data_path, "r+b") as f:
+            f.truncate(state["data_size"])
+        if self.journal_path.exists():
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(state.get("journal_size", 0))
+
+    def _open(self) -> None:
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries = {}
+        if self.index_path.exists() and self.data_path.exists():
+            with PageArchiveReader(self.data_path.parent) as existing:
+                for key, entry in existing.entries():
+                    self._entries[key] = entry
+        if self.journal_path.exists():
+            self._replay_journal()
+        self._data = open(self.data_path, "ab")
+        self._offset = self._data.tell()
+        self._journal = open(self.journal_path, "ab")
+        self._journal_offset = self._journal.tell()
+
+    def _replay_journal(self) -> None:
+        """Add the entries journaled by an earlier writer that did not close."""
+        with open(self.journal_path, "r+b") as f:
+            journal = f.read()
+            # Drop a torn final entry
+            size = len(journal) - len(journal) % _JOURNAL_ENTRY.size
+            f.truncate(size)
+        if not size or not self.data_path.exists():
+            return
+        entries = self._entries
+        with open(self.data_path, "rb") as f:
+            data_size = os.fstat(f.fileno()).st_size
+            if not data_size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for offset, key_length, page_length in _JOURNAL_ENTRY.iter_unpack(memoryview(journal)[:size]):
+                    if offset + key_length + page_length <= data_size:
+                        entries[data[offset:offset + key_length]] = (offset, key_length, page_length)
+
+    def _append(self) -> None:
+        if not self._buffer:
+            return
+        if self._data is None:
+            self._open()
+
+        buffer, self._buffer = self._buffer, []
+        chunk = bytearray()
+        journal = bytearray()
+        entries = self._entries
+        pack = _JOURNAL_ENTRY.pack
+        for product_name, pages in buffer:
+            for page_type, data in pages.items():
+                key = archive_key(product_name, page_type)
+                entry = entries[key] = (self._offset + len(chunk), len(key), len(data))
+                journal += pack(*entry)
+                chunk += key
+                chunk += data
+        # Journal entries only ever point at flushed data
+        self._data.write(chunk)
+        self._data.flush()
+        self._offset += len(chunk)
+        self._journal.write(journal)
+        self._journal.flush()
+        self._journal_offset += len(journal)
+
+    def _write_index(self) -> None:
+        """Write the sorted index; the data it points at is already flushed."""
+        ordered = sorted(
+            (name_hash(key[:key.index(b"\0")]), key, entry) for key, entry in self._entries.items()
+        )
+        hashes = array("Q", (item[0] for item in ordered))
+        offsets = array("Q", (item[2][0] for item in ordered))
+        key_lengths = array("I", (item[2][1] for item in ordered))
+        page_lengths = array("I", (item[2][2] for item in ordered))
+
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _BYTE_ORDER, len(ordered)))
+            for column in (hashes, offsets, key_lengths, page_lengths):
+                column.tofile(f)
+        os.replace(tmp_path, self.index_path)
+
+
+class PageArchiveReader:
+    """
+    Zero-copy lookups in a page archive.
+
+    Returned memoryviews reference the mapped file; release them before
+    calling close().
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Map the archive.
+
+        Args:
+            path: Output directory holding pages.dat and pages.idx
+
+        Raises:
+            ValueError: If the index is not a page archive index for this platform
+        """
+        directory = Path(path)
+        with open(directory / ARCHIVE_INDEX_FILENAME, "rb") as f:
+            self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byte_order, count = _INDEX_HEADER.unpack_from(self._index_map)
+        if magic != _INDEX_MAGIC:
+            self._index_map.close()
+            raise ValueError(f"Not a page archive index: {directory / ARCHIVE_INDEX_FILENAME}")
+        if byte_order != _BYTE_ORDER:
+            self._index_map.close()
+            raise ValueError("Page archive was written on a platform with a different byte order")
+
+        self._count = count
+        with open(directory / ARCHIVE_DATA_FILENAME, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._data_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._data = memoryview(self._data_map) if self._data_map is not None else memoryview(b"")
+
+        index = memoryview(self._index_map)
+        start = _INDEX_HEADER.size
+        self._hashes = index[start:start + 8 * count].cast("Q")
+        start += 8 * count
+        self._offsets = index[start:start + 8 * count].cast("Q")
+        start += 8 * count
+        self._key_lengths = index[start:start + 4 * count].cast("I")
+        start += 4 * count
+        self._page_lengths = index[start:start + 4 * count].cast("I")
+
+    def __len__(self) -> int:
+        """Number of pages in the archive."""
+        return self._count
+
+    def _product_records(self, product_name: str) -> List[Tuple[int, int, int]]:
+        """(page type start, page start, page end) offsets of a product's pages."""
+        name = product_name.encode("utf-8")
+        prefix = name + b"\0"
+        prefix_length = len(prefix)
+        hashes = self._hashes
+        offsets = self._offsets
+        key_lengths = self._key_lengths
+        data = self._data
+        target = name_hash(name)
+        records = []
+        position = bisect_left(hashes, target)
+        while position < self._count and hashes[position] == target:
+            offset = offsets[position]
+            if data[offset:offset + prefix_length] == prefix:
+                page_start = offset + key_lengths[position]
+                records.append((offset + prefix_length, page_start, page_start + self._page_lengths[position]))
+            position += 1
+        return records
+
+    def get_page(self, product_name: str, page_type: str) -> memoryview:
+        """
+        Raw JSON bytes of one page.
+
+        Args:
+            product_name: Product display name
+            page_type: Page type, e.g. "faq"
+
+        Returns:
+            Read-only view into the mapped data file
+
+        Raises:
+            KeyError: If the page is not in the archive
+        """
+        data = self._data
+        page_type_bytes = page_type.encode("utf-8")
+        for type_start, page_start, page_end in self._product_records(product_name):
+            if data[type_start:page_start] == page_type_bytes:
+                return data[page_start:page_end]
+        raise KeyError((product_name, page_type))
+
+    def get_product(self, product_name: str) -> Dict[str, memoryview]:
+        """
+        Raw JSON bytes of all of a product's pages.
+
+        Returns:
+            Dictionary of page_type -> read-only view
+
+        Raises:
+            KeyError: If the product has no pages in the archive
+        """
+        data = self._data
+        pages = {
+            str(data[type_start:page_start], "utf-8"): data[page_start:page_end]
+            for type_start, page_start, page_end in self._product_records(product_name)
+        }
+        if not pages:
+            raise KeyError(product_name)
+        return pages
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        """True if (product_name, page_type) is in the archive."""
+        try:
+            self.get_page(*key)
+        except KeyError:
+            return False
+        return True
+
+    def entries(self) -> Iterator[Tuple[bytes, Tuple[int, int, int]]]:
+        """
+        All (key, (record offset, key length, page length)) index entries
+        whose record lies within the data file.
+        """
+        size = len(self._data)
+        for position in range(self._count):
+            offset = self._offsets[position]
+            key_length = self._key_lengths[position]
+            page_length = self._page_lengths[position]
+            if offset + key_length + page_length > size:
+                continue
+            key = bytes(self._data[offset:offset + key_length])
+            yield key, (offset, key_length, page_length)
+
+    def close(self) -> None:
+        """Unmap the archive."""
+        for view in (self._hashes, self._offsets, self._key_lengths, self._page_lengths, self._data):
+            view.release()
+        self._index_map.close()
+        if self._data_map is not None:
+            self._data_map.close()
+
+    def __enter__(self) -> "PageArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
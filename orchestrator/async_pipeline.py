@@ -0,0 +1,246 @@
+"""
+Async orchestrator: Runs the catalog pipeline on asyncio.
+Responsibility: Orchestration only - pages are still built by the regular
+OrchestratorAgent stages; I/O is done by pluggable async agents.
+
+Per product:
+- parse     <- columnar batch parser, a window at a time (CPU, executor),
+               then the window's incremental check and, for products with a
+               stale FAQ page, its FAQ answer prefetch if a backend is set
+- enrich    <- AsyncProductAgent.enrich for each enrichment agent, in order (I/O)
+- pages     <- page graph (CPU, executor); the incremental check runs again
+               for products an enrichment agent changed
+- publish   <- AsyncPageSink.write for every sink, concurrently (I/O)
+- write     <- the page writer, in catalog order
+
+CPU-bound stages run on a small thread pool so they never block the event
+loop, while the I/O stages of up to `window` products overlap. Each stage
+has its own concurrency limit (see DEFAULT_STAGE_LIMITS), e.g. to cap the
+requests in flight to an enrichment service. The awaited enrich and
+publish stages record wall time only: while they wait, the event loop's
+thread runs other products' work.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from orchestrator.pipeline import _UNRESOLVED, DEFAULT_STREAM_WINDOW, CatalogRunSummary, OrchestratorAgent, PipelineItem
+
+
+# Maximum products concurrently in each stage
+DEFAULT_STAGE_LIMITS = {"enrich": 64, "pages": 1, "publish": 64}
+
+
+class AsyncProductAgent:
+    """
+    Async agent that enriches a parsed product before its pages are built
+    (e.g. fetches extra data from a service). The base agent changes nothing.
+    """
+
+    async def enrich(self, product):
+        """
+        Enrich one product.
+
+        Args:
+            product: Parsed product model
+
+        Returns:
+            The product to build pages from (the same or a new model)
+        """
+        return product
+
+    async def close(self) -> None:
+        """Release connections once the catalog run is complete."""
+
+
+class AsyncPageSink:
+    """
+    Async agent that receives every product's encoded pages after they are
+    built (e.g. a remote store). Pages are still written by the page writer.
+    """
+
+    async def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Store one product's pages.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> encoded JSON page
+        """
+
+    async def close(self) -> None:
+        """Flush and release connections once the catalog run is complete."""
+
+
+class AsyncOrchestratorAgent(OrchestratorAgent):
+    """
+    OrchestratorAgent that runs catalogs on asyncio with async agents.
+    Produces the same pages as OrchestratorAgent for the same products.
+    """
+
+    def __init__(
+        self,
+        *args,
+        enrichment_agents: Sequence[AsyncProductAgent] = (),
+        page_sinks: Sequence[AsyncPageSink] = (),
+        stage_limits: Optional[Dict[str, int]] = None,
+        cpu_workers: int = 1,
+        **kwargs,
+    ):
+        """
+        Initialize orchestrator.
+
+        Args:
+            *args, **kwargs: OrchestratorAgent settings
+            enrichment_agents: Agents run on each parsed product, in order
+            page_sinks: Agents that receive each product's encoded pages
+            stage_limits: Per-stage concurrency overrides for
+                DEFAULT_STAGE_LIMITS ("enrich", "pages", "publish")
+            cpu_workers: Threads running the CPU-bound parse and page stages
+
+        Raises:
+            ValueError: If a stage is unknown or a limit is not positive
+        """
+        super().__init__(*args, **kwargs)
+        limits = dict(DEFAULT_STAGE_LIMITS)
+        for stage_name, limit in (stage_limits or {}).items():
+            if stage_name not in limits:
+                raise ValueError(f"Unknown async stage: {stage_name}")
+            if limit < 1:
+                raise ValueError(f"Stage {stage_name} needs a concurrency limit of at least 1, got {limit}")
+            limits[stage_name] = limit
+        if cpu_workers < 1:
+            raise ValueError(f"cpu_workers must be at least 1, got {cpu_workers}")
+        self.enrichment_agents = list(enrichment_agents)
+        self.page_sinks = list(page_sinks)
+        self.stage_limits = limits
+        self.cpu_workers = cpu_workers
+
+    def execute_catalog(
+        self,
+        raw_products: Iterable[Dict[str, Any]],
+        workers: int = 1,
+        chunk_size: int = 64,
+        write_in_workers: bool = True,
+        window: int = DEFAULT_STREAM_WINDOW,
+        checkpoint_every: int = 0,
+        resume: bool = False,
+    ) -> CatalogRunSummary:
+        """
+        Run execute_catalog_async on a new event loop.
+
+        Raises:
+            ValueError: If workers > 1 (async agents run in this process;
+                use cpu_workers instead)
+        """
+        if workers > 1:
+            raise ValueError("AsyncOrchestratorAgent runs in a single process; use cpu_workers instead of workers")
+        return asyncio.run(
+            self.execute_catalog_async(raw_products, window=window, checkpoint_every=checkpoint_every, resume=resume)
+        )
+
+    async def execute_catalog_async(
+        self,
+        raw_products: Iterable[Dict[str, Any]],
+        window: int = DEFAULT_STREAM_WINDOW,
+        checkpoint_every: int = 0,
+        resume: bool = False,
+    ) -> CatalogRunSummary:
+        """
+        Execute the pipeline for every product in a catalog.
+
+        Up to `window` products are in flight, each as its own task, and
+        finished products are written in catalog order, so checkpoints,
+        incremental manifests and invalid-record handling behave as in
+        OrchestratorAgent.execute_catalog. A product whose enrichment
+        fails is recorded as an error in the summary and skipped.
+
+        Args:
+            raw_products: Iterable of raw product dictionaries
+            window: Maximum products in flight
+            checkpoint_every: Records between checkpoints (0 disables checkpoints)
+            resume: Continue from the checkpoint in the output directory, if any
+
+        Returns:
+            CatalogRunSummary with processed/skipped/failed counts
+        """
+        loop = asyncio.get_running_loop()
+        raw_products = iter(raw_products)
+        summary = self._begin_catalog(raw_products, checkpoint_every, resume)
+        limits = {stage_name: asyncio.Semaphore(limit) for stage_name, limit in self.stage_limits.items()}
+        in_flight = deque()
+
+        with ThreadPoolExecutor(self.cpu_workers) as executor:
+            batches = self._parse_stage(self._read_stage(raw_products, window, summary.resumed_from))
+            if self.manifest is not None:
+                batches = self._incremental_stage(batches)
+            if self.answer_service is not None:
+                batches = self._answer_stage(batches)
+            while True:
+                batch = await loop.run_in_executor(executor, next, batches, None)
+                if batch is None:
+                    break
+                for item in batch:
+                    if len(in_flight) >= window:
+                        self.record_item(await in_flight.popleft(), summary)
+                    in_flight.append(loop.create_task(self._process_item(item, limits, executor)))
+
+            while in_flight:
+                self.record_item(await in_flight.popleft(), summary)
+
+        summary.add_unknown_keys(self.parser_agent.unknown_keys)
+        await asyncio.gather(*(agent.close() for agent in self.enrichment_agents + self.page_sinks))
+        self._finish_catalog(summary)
+        return summary
+
+    async def _process_item(
+        self,
+        item: PipelineItem,
+        limits: Dict[str, asyncio.Semaphore],
+        executor: ThreadPoolExecutor,
+    ) -> PipelineItem:
+        """Run one parsed item through the enrich, pages and publish stages."""
+        if item.error is not None:
+            return item
+        stage = self.instrumentation.stage
+
+        if self.enrichment_agents:
+            async with limits["enrich"]:
+                with stage("enrich", wall_only=True):
+                    product = item.product
+                    try:
+                        for agent in self.enrichment_agents:
+                            product = await agent.enrich(product)
+                    except Exception as error:
+                        item.error = f"Enrichment failed: {error!r}"
+                        item.price = None
+                        return item
+            if product.price != item.product.price:
+                # The batch's parsed price is stale; the price block parses it again
+                item.price = None
+            if product is not item.product:
+                # Prefetched questions, answers, competitor and stale pages
+                # may be out of date; they are rebuilt from the new product
+                item.questions = None
+                item.answers = None
+                item.competitor = _UNRESOLVED
+                item.page_types = None
+                item.fingerprints = None
+            item.product = product
+
+        async with limits["pages"]:
+            await asyncio.get_running_loop().run_in_executor(executor, self._build_item, item)
+
+        if self.page_sinks and item.payloads is not None:
+            async with limits["publish"]:
+                with stage("publish", wall_only=True):
+                    await asyncio.gather(*(sink.write(item.product_name, item.payloads) for sink in self.page_sinks))
+        return item
+
+    def _build_item(self, item: PipelineItem) -> None:
+        """Page graph of one item, after its incremental check if enrichment reset it (runs on the CPU executor)."""
+        if self.manifest is not None and item.fingerprints is None:
+            self.check_stale_pages(item)
+        self.build_payloads(item)
@@ -0,0 +1,118 @@
+"""
+Catalog readers: Stream raw product records from catalog files.
+Responsibility: File decoding only - parsing and validation stay in ProductParserAgent.
+Supported formats: JSON Lines (.jsonl) and CSV (.csv)
+"""
+
+import csv
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Any, Iterator, Union
+
+
+# Longest readable part of a product key (names can be arbitrarily long)
+MAX_SLUG_LENGTH = 64
+
+# Hex digits of the name digest appended to every product key
+KEY_DIGEST_LENGTH = 12
+
+
+def read_catalog(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Read raw product records from a catalog file.
+
+    The format is selected from the file extension.
+
+    Args:
+        path: Path to a .jsonl or .csv catalog
+
+    Returns:
+        Iterator of raw product dictionaries
+
+    Raises:
+        ValueError: If the catalog format is not supported
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return read_jsonl_catalog(path)
+    if suffix == ".csv":
+        return read_csv_catalog(path)
+    raise ValueError(f"Unsupported catalog format: {path.suffix}")
+
+
+class InvalidRecord(dict):
+    """
+    Placeholder for a catalog record that could not be decoded.
+    The orchestrator reports it as a failed record and moves on; it is an
+    empty dict, so other consumers see a record without fields.
+    """
+
+    def __init__(self, error: str):
+        super().__init__()
+        self.error = error
+
+
+def read_jsonl_catalog(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw product records from a JSON Lines file.
+    Blank lines are skipped. Lines that are not valid JSON objects are
+    yielded as InvalidRecord, so one bad line does not stop a catalog run.
+
+    Args:
+        path: Path to the .jsonl file
+
+    Returns:
+        Iterator of raw product dictionaries
+    """
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:  # Includes JSON and UTF-8 decode errors
+                yield InvalidRecord(f"Line {line_number}: invalid JSON ({error})")
+                continue
+            if not isinstance(record, dict):
+                yield InvalidRecord(f"Line {line_number}: expected a JSON object")
+                continue
+            yield record
+
+
+def read_csv_catalog(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw product records from a CSV file with a header row.
+    Header names are passed through unchanged so the parser can map them.
+
+    Args:
+        path: Path to the .csv file
+
+    Returns:
+        Iterator of raw product dictionaries
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            yield row
+
+
+def product_key(product_name: str) -> str:
+    """
+    Derive a filesystem-safe key from a product name.
+
+    The readable slug alone is lossy ("Serum A+" and "Serum A" share one,
+    non-Latin names have none), so a digest of the full name is appended:
+    different names get different keys.
+
+    Args:
+        product_name: Product display name
+
+    Returns:
+        Lowercase slug plus name digest, e.g. "glowboost-vitamin-c-serum-0aff4844b4ca"
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", product_name.lower())[:MAX_SLUG_LENGTH].strip("-") or "product"
+    digest = hashlib.blake2b(product_name.encode("utf-8"), digest_size=KEY_DIGEST_LENGTH // 2).hexdigest()
+    return f"{slug}-{digest}"
@@ -0,0 +1,100 @@
+"""
+Catalog checkpoints: Persist progress so long catalog runs can resume.
+Responsibility: Checkpoint bookkeeping only - the orchestrator decides when to commit.
+
+A checkpoint is taken after the page writer has flushed, so everything it
+covers is on disk. It stores:
+- the input offset: every record before it is written, skipped or failed,
+  so a resumed run skips exactly the records before it
+- the run counters and recorded errors so far
+- the page writer's committed state (e.g. bundle sizes), so a resumed run
+  can drop pages written after the checkpoint instead of duplicating them
+
+Completed products are identified by the offset alone, so checkpoint cost
+does not grow with the number of products.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+CHECKPOINT_FILENAME = ".checkpoint.json"
+
+# Input records between checkpoints
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+
+class CatalogCheckpoint:
+    """
+    Progress of one catalog run, stored in the output directory.
+    """
+
+    def __init__(self, output_dir: Union[str, Path]):
+        """
+        Initialize an empty checkpoint.
+
+        Args:
+            output_dir: Output directory of the catalog run
+        """
+        self.path = Path(output_dir) / CHECKPOINT_FILENAME
+        self.offset = 0
+        self.counts: Dict[str, int] = {"processed": 0, "skipped": 0, "failed": 0}
+        self.errors: List[str] = []
+        self.writer_state: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def load(cls, output_dir: Union[str, Path]) -> Optional["CatalogCheckpoint"]:
+        """
+        Load the checkpoint of an interrupted run.
+
+        Args:
+            output_dir: Output directory of the catalog run
+
+        Returns:
+            CatalogCheckpoint, or None if there is nothing to resume
+        """
+        checkpoint = cls(output_dir)
+        if not checkpoint.path.exists():
+            return None
+        with open(checkpoint.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        checkpoint.offset = data["offset"]
+        checkpoint.counts = data["counts"]
+        checkpoint.errors = data["errors"]
+        checkpoint.writer_state = data["writer_state"]
+        return checkpoint
+
+    def commit(self, offset: int, summary, writer_state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Persist progress. Call only after the page writer has flushed.
+
+        Args:
+            offset: Index of the first input record not yet finished
+            summary: CatalogRunSummary of the run so far
+            writer_state: Committed state reported by the page writer
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.offset = offset
+        self.counts = {"processed": summary.processed, "skipped": summary.skipped, "failed": summary.failed}
+        self.errors = list(summary.errors)
+        self.writer_state = writer_state
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "offset": self.offset,
+                    "counts": self.counts,
+                    "errors": self.errors,
+                    "writer_state": self.writer_state,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Remove the checkpoint after the run completed."""
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,417 @@
+"""
+Dedup page store: Content-addressed bundle of encoded pages.
+Responsibility: Packed output I/O only - pages arrive already encoded.
+
+Many pages differ only in the product name: every FAQ page asks the same
+questions about a different product, and variants of one product have
+near-identical pages. Many answers repeat too (all four Usage questions
+return the usage instructions, all four Purchase questions one price
+sentence). So each page is stored as:
+- a template: the page with every "answer" string emptied and the
+  product name replaced by a NUL byte (never present in encoded JSON)
+- the ordered list of its answers, each with the product name factored
+  out the same way
+
+Templates and answers are content-addressed blobs (unique by digest),
+stored once in <output_dir>/pages.dedup.sqlite; each page row holds only
+blob IDs: its template's and a packed array of its answers'.
+Reading a page reverses both steps byte for byte. Re-written pages
+replace their row; blobs no longer referenced stay in the bundle.
+"""
+
+import hashlib
+import re
+import sqlite3
+import struct
+from collections import OrderedDict
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+
+DEDUP_BUNDLE_FILENAME = "pages.dedup.sqlite"
+
+# Bytes per blob digest (the content address)
+DIGEST_SIZE = 16
+
+# Bytes per blob ID in a page's answer references (little-endian u32)
+REFERENCE_SIZE = 4
+
+# Blob IDs remembered by a writer by digest (cleared when full; the
+# database is consulted for digests not remembered)
+MAX_KNOWN_BLOBS = 1 << 20
+
+# An "answer" member with its string value; quotes inside JSON strings are
+# always escaped, so the pattern cannot match inside a string
+_ANSWER = re.compile(rb'("answer":\s*")((?:[^"\\]|\\.)*)"')
+_NAME_SLOT = b"\0"
+
+_DEDUP_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS blobs (
+        id INTEGER PRIMARY KEY,
+        digest BLOB NOT NULL UNIQUE,
+        kind TEXT NOT NULL,
+        data BLOB NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pages (
+        product_name TEXT NOT NULL,
+        page_type TEXT NOT NULL,
+        template INTEGER NOT NULL,
+        answers BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        PRIMARY KEY (product_name, page_type)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def encoded_name(product_name: str) -> bytes:
+    """A product name as it appears inside encoded JSON strings."""
+    return encode_basestring(product_name)[1:-1].encode("utf-8")
+
+
+def split_page(data: bytes, name: bytes) -> Tuple[bytes, List[bytes]]:
+    """
+    Factor an encoded page into its template and answers.
+
+    Args:
+        data: Encoded JSON page
+        name: The product name as encoded in the page (see encoded_name)
+
+    Returns:
+        (template, answers); answers are the encoded string contents, in order
+
+    Raises:
+        ValueError: If the page contains a NUL byte (not valid encoded JSON)
+    """
+    if _NAME_SLOT in data:
+        raise ValueError("Encoded page contains a NUL byte")
+    answers = []
+
+    def empty(match) -> bytes:
+        answers.append(match.group(2))
+        return match.group(1) + b'"'
+
+    template = _ANSWER.sub(empty, data)
+    if name:
+        template = template.replace(name, _NAME_SLOT)
+        answers = [answer.replace(name, _NAME_SLOT) for answer in answers]
+    return template, answers
+
+
+def join_page(template: bytes, answers: List[bytes], name: bytes) -> bytes:
+    """
+    Rebuild an encoded page from split_page output.
+
+    Raises:
+        ValueError: If the template has a different number of answer slots
+    """
+    if name:
+        template = template.replace(_NAME_SLOT, name)
+        answers = [answer.replace(_NAME_SLOT, name) for answer in answers]
+    remaining = iter(answers)
+    slots = 0
+
+    def fill(match) -> bytes:
+        nonlocal slots
+        slots += 1
+        return match.group(1) + next(remaining, b"") + b'"'
+
+    page = _ANSWER.sub(fill, template)
+    if slots != len(answers):
+        raise ValueError(f"Page template has {slots} answer slots for {len(answers)} answers")
+    return page
+
+
+def _ratio(page_bytes: int, stored_bytes: int) -> float:
+    return round(page_bytes / stored_bytes, 2) if stored_bytes else 0.0
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def _pack_ids(blob_ids: List[int]) -> bytes:
+    return struct.pack(f"<{len(blob_ids)}I", *blob_ids)
+
+
+def _unpack_ids(data: bytes) -> Tuple[int, ...]:
+    return struct.unpack(f"<{len(data) // REFERENCE_SIZE}I", data)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path))
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    for statement in _DEDUP_SCHEMA:
+        connection.execute(statement)
+    return connection
+
+
+class DedupPageStore:
+    """
+    Writes pages to a content-addressed bundle, one transaction per
+    buffered batch. Only templates and answers not stored yet are written.
+    """
+
+    # SQLite serializes writers; worker processes hand pages to the parent
+    process_safe = False
+
+    def __init__(self, output_dir: Union[str, Path], buffer_size: int = 1024):
+        """
+        Initialize store. The database is opened on the first write.
+
+        Args:
+            output_dir: Directory holding the bundle
+            buffer_size: Products buffered before a batch is committed
+        """
+        self.path = Path(output_dir) / DEDUP_BUNDLE_FILENAME
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[Tuple[str, Dict[str, bytes]]] = []
+        self._connection: Optional[sqlite3.Connection] = None
+        self._ids: Dict[bytes, int] = {}
+
+    def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Queue one product's pages for writing.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> encoded JSON page
+        """
+        self._buffer.append((product_name, pages))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all buffered pages and their new blobs in one transaction."""
+        if not self._buffer:
+            return
+        if self._connection is None:
+            self._connection = _connect(self.path)
+
+        buffer, self._buffer = self._buffer, []
+        rows = []
+        blob_id = self._blob_id
+        try:
+            with self._connection:
+                for product_name, pages in buffer:
+                    name = encoded_name(product_name)
+                    for page_type, data in pages.items():
+                        template, answers = split_page(data, name)
+                        rows.append((
+                            product_name,
+                            page_type,
+                            blob_id("template", template),
+                            _pack_ids([blob_id("answer", answer) for answer in answers]),
+                            len(data),
+                        ))
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO pages (product_name, page_type, template, answers, size) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except BaseException:
+            # Blobs inserted by the rolled-back transaction are gone
+            self._ids.clear()
+            raise
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        if self._connection is not None:
+            # Leave a single self-contained file; read-only openers of a WAL
+            # database would otherwise create -wal/-shm files next to it
+            self._connection.execute("PRAGMA journal_mode=DELETE")
+            self._connection.close()
+            self._connection = None
+
+    def committed_state(self) -> None:
+        """Rows are upserted per committed transaction, so no resume point is needed."""
+        return None
+
+    def restore(self, state: None) -> None:
+        """Nothing to discard: re-written rows replace their previous version."""
+
+    def _blob_id(self, kind: str, data: bytes) -> int:
+        """ID of a blob, inserting it unless it is already stored (call inside the flush transaction)."""
+        digest = _digest(data)
+        blob_id = self._ids.get(digest)
+        if blob_id is None:
+            row = self._connection.execute("SELECT id FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                blob_id = row[0]
+            else:
+                blob_id = self._connection.execute(
+                    "INSERT INTO blobs (digest, kind, data) VALUES (?, ?, ?)", (digest, kind, data)
+                ).lastrowid
+            if len(self._ids) >= MAX_KNOWN_BLOBS:
+                self._ids.clear()
+            self._ids[digest] = blob_id
+        return blob_id
+
+
+class DedupPageStoreReader:
+    """
+    Keyed lookups in a dedup bundle.
+    """
+
+    # Blobs kept decoded in memory (templates are shared by most pages)
+    max_cached_blobs = 4096
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open the database read-only.
+
+        Args:
+            path: Bundle path (pages.dedup.sqlite) or the directory holding it
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / DEDUP_BUNDLE_FILENAME
+        self.path = path
+        self._connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        self._blobs: "OrderedDict[int, bytes]" = OrderedDict()
+
+    def product_names(self) -> Iterator[str]:
+        """Names of all stored products."""
+        rows = self._connection.execute("SELECT DISTINCT product_name FROM pages ORDER BY product_name")
+        return (row[0] for row in rows)
+
+    def __contains__(self, product_name: str) -> bool:
+        row = self._connection.execute("SELECT 1 FROM pages WHERE product_name = ? LIMIT 1", (product_name,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(DISTINCT product_name) FROM pages").fetchone()[0]
+
+    def get_page(self, product_name: str, page_type: str) -> bytes:
+        """
+        Fetch one encoded page.
+
+        Raises:
+            KeyError: If the page is not in the bundle
+        """
+        row = self._connection.execute(
+            "SELECT template, answers FROM pages WHERE product_name = ? AND page_type = ?",
+            (product_name, page_type),
+        ).fetchone()
+        if row is None:
+            raise KeyError((product_name, page_type))
+        return self._join(product_name, row[0], row[1])
+
+    def get_product(self, product_name: str) -> Dict[str, bytes]:
+        """
+        Fetch all encoded pages of a product.
+
+        Returns:
+            Dictionary of page_type -> encoded JSON page
+
+        Raises:
+            KeyError: If the product is not in the bundle
+        """
+        rows = self._connection.execute(
+            "SELECT page_type, template, answers FROM pages WHERE product_name = ?",
+            (product_name,),
+        ).fetchall()
+        if not rows:
+            raise KeyError(product_name)
+        return {page_type: self._join(product_name, template, answers) for page_type, template, answers in rows}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Dedup counters of the bundle, overall and per page type.
+
+        page_bytes is what the pages take stored whole; stored_bytes is
+        what the bundle stores for them: references plus every distinct
+        template and answer they use (blobs shared by several page types
+        count for each type; the overall figure counts every blob once).
+
+        Returns:
+            Dictionary with pages, answers, unique_answers,
+            unique_templates, page_bytes, stored_bytes, dedup_ratio and
+            by_page_type (the same counters per page type)
+        """
+        blob_sizes = dict(self._connection.execute("SELECT id, LENGTH(data) FROM blobs"))
+        by_page_type: Dict[str, Dict[str, Any]] = {}
+        used: Dict[str, Tuple[Set[int], Set[int]]] = {}
+        for page_type, template, answers, size in self._connection.execute(
+            "SELECT page_type, template, answers, size FROM pages"
+        ):
+            counts = by_page_type.get(page_type)
+            if counts is None:
+                counts = by_page_type[page_type] = {"pages": 0, "answers": 0, "page_bytes": 0, "reference_bytes": 0}
+                used[page_type] = (set(), set())
+            templates, answer_ids = used[page_type]
+            counts["pages"] += 1
+            counts["answers"] += len(answers) // REFERENCE_SIZE
+            counts["page_bytes"] += size
+            counts["reference_bytes"] += REFERENCE_SIZE + len(answers)
+            templates.add(template)
+            answer_ids.update(_unpack_ids(answers))
+
+        for page_type, counts in by_page_type.items():
+            templates, answer_ids = used[page_type]
+            counts["unique_answers"] = len(answer_ids)
+            counts["unique_templates"] = len(templates)
+            counts["stored_bytes"] = counts.pop("reference_bytes") + sum(
+                blob_sizes[blob_id] for blob_id in templates | answer_ids
+            )
+            counts["dedup_ratio"] = _ratio(counts["page_bytes"], counts["stored_bytes"])
+
+        kinds = dict(self._connection.execute("SELECT kind, COUNT(*) FROM blobs GROUP BY kind"))
+        page_bytes = sum(counts["page_bytes"] for counts in by_page_type.values())
+        stored_bytes = sum(blob_sizes.values()) + sum(
+            REFERENCE_SIZE * (counts["pages"] + counts["answers"]) for counts in by_page_type.values()
+        )
+        return {
+            "pages": sum(counts["pages"] for counts in by_page_type.values()),
+            "answers": sum(counts["answers"] for counts in by_page_type.values()),
+            "unique_answers": kinds.get("answer", 0),
+            "unique_templates": kinds.get("template", 0),
+            "page_bytes": page_bytes,
+            "stored_bytes": stored_bytes,
+            "dedup_ratio": _ratio(page_bytes, stored_bytes),
+            "by_page_type": by_page_type,
+        }
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "DedupPageStoreReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _join(self, product_name: str, template: int, answers: bytes) -> bytes:
+        answer_ids = _unpack_ids(answers)
+        blobs = self._get_blobs((template,) + answer_ids)
+        return join_page(blobs[template], [blobs[blob_id] for blob_id in answer_ids], encoded_name(product_name))
+
+    def _get_blobs(self, blob_ids: Tuple[int, ...]) -> Dict[int, bytes]:
+        cache = self._blobs
+        found = {}
+        missing = []
+        for blob_id in dict.fromkeys(blob_ids):
+            data = cache.get(blob_id)
+            if data is None:
+                missing.append(blob_id)
+            else:
+                cache.move_to_end(blob_id)
+                found[blob_id] = data
+        if missing:
+            rows = self._connection.execute(
+                f"SELECT id, data FROM blobs WHERE id IN ({', '.join('?' * len(missing))})",
+                missing,
+            ).fetchall()
+            for blob_id, data in rows:
+                found[blob_id] = cache[blob_id] = bytes(data)
+            while len(cache) > self.max_cached_blobs:
+                cache.popitem(last=False)
+            if len(rows) < len(missing):
+                raise KeyError(f"Dedup bundle is missing {len(missing) - len(rows)} referenced blobs")
+        return found
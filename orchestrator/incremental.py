@@ -0,0 +1,231 @@
+"""
+Incremental builds: Skip products whose inputs and code have not changed.
+Responsibility: Fingerprinting and manifest bookkeeping only.
+
+Each page type gets a fingerprint built from:
+- the product fields its page agent and required logic blocks read
+- a code stamp of those blocks, the page agent, the page model and the
+  template definition
+- the agent's content_settings, if it declares any (e.g. the model of an
+  FAQ answer backend)
+- the output settings (layout and JSON indentation), so pages are rewritten
+  when the format they are stored in changes
+
+A local manifest stores the last fingerprints written per product, so a
+re-run only regenerates pages whose fingerprint changed. Checkpoints append
+the newly recorded products to a journal instead of rewriting the manifest;
+the full manifest is written once at the end of a run.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Union
+
+from models import Product, FAQPage, ProductPage, ComparisonPage
+from agents.question_agent import QuestionGenerationAgent
+from logic_blocks.blocks import PRODUCT_LOGIC_BLOCKS
+from templates.template_engine import TemplateDefinition, TemplateEngineAgent
+
+
+# Manifest file name inside the output directory
+MANIFEST_FILENAME = ".build_manifest.json"
+
+# Page model class for each page type
+PAGE_MODELS = {
+    "faq": FAQPage,
+    "product": ProductPage,
+    "comparison": ComparisonPage,
+}
+
+
+def _digest(*parts: str) -> str:
+    """Stable hex digest of string parts."""
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def code_stamp(*objects: Any) -> str:
+    """
+    Version stamp for code objects, derived from their source.
+
+    Args:
+        objects: Classes or functions
+
+    Returns:
+        Hex digest that changes whenever any of the sources change
+    """
+    return _digest(*(inspect.getsource(obj) for obj in objects))
+
+
+def template_stamp(template: TemplateDefinition) -> str:
+    """Version stamp for a template definition's declared structure."""
+    return _digest(
+        template.name,
+        template.page_type,
+        json.dumps([(f.name, f.required, f.data_type) for f in template.required_fields]),
+        json.dumps(template.required_logic_blocks),
+        json.dumps(template.sections, sort_keys=True),
+    )
+
+
+class PageDependencies:
+    """
+    Resolves page fingerprints from template and agent declarations.
+    """
+
+    def __init__(
+        self,
+        template_engine: TemplateEngineAgent,
+        page_agents: Dict[str, Any],
+        output_settings: Sequence[str] = (),
+    ):
+        """
+        Build per-page dependency sets.
+
+        Args:
+            template_engine: Source of required_logic_blocks per page type
+            page_agents: page_type -> page agent (declares input_fields)
+            output_settings: How pages are stored (e.g. layout and JSON
+                indentation); part of every page's stamp
+        """
+        self.page_fields: Dict[str, List[str]] = {}
+        self.page_stamps: Dict[str, str] = {}
+
+        for page_type, agent in page_agents.items():
+            template = template_engine.get_template(page_type)
+            blocks = [
+                PRODUCT_LOGIC_BLOCKS[name]
+                for name in template.required_logic_blocks
+                if name in PRODUCT_LOGIC_BLOCKS
+            ]
+            code = [type(agent), PAGE_MODELS[page_type]] + blocks
+            code.extend(getattr(agent, "code_dependencies", ()))
+            fields = set(agent.input_fields)
+            for block in blocks:
+                fields.update(block.input_fields)
+                code.extend(getattr(block, "code_dependencies", ()))
+            if page_type == "faq":
+                code.append(QuestionGenerationAgent)
+
+            self.page_fields[page_type] = sorted(fields)
+            # Runtime settings the content depends on, e.g. an answer backend's model
+            settings = getattr(agent, "content_settings", ())
+            self.page_stamps[page_type] = _digest(
+                code_stamp(*code), template_stamp(template), *settings, "output", *output_settings
+            )
+
+    def fingerprints(
+        self,
+        product: Product,
+        page_types: Optional[Iterable[str]] = None,
+        related: Optional[Dict[str, Product]] = None,
+    ) -> Dict[str, str]:
+        """
+        Compute page fingerprints for a product.
+
+        Args:
+            product: Parsed product model
+            page_types: Page types to fingerprint (default: all)
+            related: page_type -> other product the page is built from
+                (e.g. a comparison competitor); its fields are included
+
+        Returns:
+            Dictionary of page_type -> fingerprint
+        """
+        data = product.to_dict()
+        result = {}
+        for page_type in page_types or self.page_fields:
+            values = {name: data[name] for name in self.page_fields[page_type]}
+            parts = [self.page_stamps[page_type], json.dumps(values, sort_keys=True, ensure_ascii=False)]
+            other = related.get(page_type) if related else None
+            if other is not None:
+                other_data = other.to_dict()
+                other_values = {name: other_data[name] for name in self.page_fields[page_type]}
+                parts.append(json.dumps(other_values, sort_keys=True, ensure_ascii=False))
+            result[page_type] = _digest(*parts)
+        return result
+
+
+class BuildManifest:
+    """
+    Local record of the page fingerprints last written for each product.
+    Stored as JSON and replaced atomically on save. Between saves, append()
+    adds the products recorded since the last call to a journal of JSON
+    lines next to it, which is merged when the manifest is loaded.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Load the manifest and its journal if they exist.
+
+        Args:
+            path: Manifest file path
+        """
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.products: Dict[str, Dict[str, str]] = {}
+        # Products recorded since the last save or append
+        self._unsaved: Dict[str, Dict[str, str]] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.products = json.load(f).get("products", {})
+        if self.journal_path.exists():
+            self._replay_journal()
+
+    def stale_pages(self, key: str, fingerprints: Dict[str, str]) -> List[str]:
+        """
+        Find pages whose fingerprint differs from the manifest.
+
+        Args:
+            key: Product key
+            fingerprints: Current page_type -> fingerprint
+
+        Returns:
+            Page types that must be regenerated
+        """
+        previous = self.products.get(key, {})
+        return [page_type for page_type, digest in fingerprints.items() if previous.get(page_type) != digest]
+
+    def record(self, key: str, fingerprints: Dict[str, str]) -> None:
+        """Record fingerprints for pages that were written."""
+        self.products.setdefault(key, {}).update(fingerprints)
+        self._unsaved.setdefault(key, {}).update(fingerprints)
+
+    def append(self) -> None:
+        """Append the products recorded since the last save or append to the journal."""
+        if not self._unsaved:
+            return
+        unsaved, self._unsaved = self._unsaved, {}
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps([key, fingerprints], sort_keys=True) + "\n" for key, fingerprints in unsaved.items()))
+
+    def save(self) -> None:
+        """Write the manifest atomically and drop the journal it now includes."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"products": self.products}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._unsaved = {}
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def _replay_journal(self) -> None:
+        """Merge the journal of a run that did not save, dropping a torn final line."""
+        with open(self.journal_path, "r+b") as f:
+            size = 0
+            for line in f:
+                try:
+                    key, fingerprints = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self.products.setdefault(key, {}).update(fingerprints)
+                size += len(line)
+            f.truncate(size)
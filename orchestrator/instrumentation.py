@@ -0,0 +1,306 @@
+"""
+Instrumentation: Per-stage timing, counters and run reporting.
+Responsibility: Observability only - never changes pipeline behavior.
+
+Instrumentation records wall time, CPU time and call counts per stage and
+keeps a log-bucketed latency histogram for p50/p95/p99. Stages may be
+timed from several threads (e.g. page graph node workers). Reporters turn
+pipeline progress into human-readable output; the default is silent.
+"""
+
+import json
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Union
+
+
+# Histogram resolution: each bucket is ~19% wider than the previous one
+_BUCKETS_PER_DOUBLING = 4
+_MIN_LATENCY = 1e-7  # 0.1 microseconds
+
+# Guards stage creation and every recorded sample (held for a few dict updates)
+_RECORD_LOCK = threading.Lock()
+
+
+class LatencyHistogram:
+    """
+    Bounded-memory latency histogram with log-spaced buckets.
+    Histograms from different processes can be merged.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds <= _MIN_LATENCY:
+            return 0
+        return int(math.log2(seconds / _MIN_LATENCY) * _BUCKETS_PER_DOUBLING) + 1
+
+    @staticmethod
+    def _upper_bound(bucket: int) -> float:
+        if bucket == 0:
+            return _MIN_LATENCY
+        return _MIN_LATENCY * 2 ** (bucket / _BUCKETS_PER_DOUBLING)
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample."""
+        bucket = self._bucket(seconds)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            percent: Percentile in the range 0-100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100.0)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self._upper_bound(bucket), self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples into this one."""
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+
+class StageStats:
+    """Accumulated timings for one stage."""
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.latency = LatencyHistogram()
+
+    def record(self, wall: float, cpu: float) -> None:
+        """Record one stage invocation (thread-safe)."""
+        with _RECORD_LOCK:
+            self.calls += 1
+            self.wall_seconds += wall
+            self.cpu_seconds += cpu
+            self.latency.record(wall)
+
+    def merge(self, other: "StageStats") -> None:
+        """Add another StageStats into this one."""
+        self.calls += other.calls
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        self.latency.merge(other.latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize as a JSON-serializable dictionary (latencies in ms)."""
+        return {
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "mean_ms": round(self.wall_seconds * 1000 / self.calls, 4) if self.calls else 0.0,
+            "p50_ms": round(self.latency.percentile(50) * 1000, 4),
+            "p95_ms": round(self.latency.percentile(95) * 1000, 4),
+            "p99_ms": round(self.latency.percentile(99) * 1000, 4),
+            "max_ms": round(self.latency.max * 1000, 4),
+        }
+
+
+class _StageTimer:
+    """
+    Context manager timing one stage invocation. Time between pause() and
+    resume() (e.g. nested work timed as its own stage) is not counted.
+    """
+
+    __slots__ = ("stats", "wall_start", "cpu_start", "wall_paused", "cpu_paused")
+
+    def __init__(self, stats: StageStats):
+        self.stats = stats
+
+    def __enter__(self) -> "_StageTimer":
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        return self
+
+    def pause(self) -> None:
+        """Stop counting time until resume() (call on the timing thread)."""
+        self.wall_paused = time.perf_counter()
+        self.cpu_paused = time.thread_time()
+
+    def resume(self) -> None:
+        """Count time again, excluding the paused interval."""
+        self.wall_start += time.perf_counter() - self.wall_paused
+        self.cpu_start += time.thread_time() - self.cpu_paused
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stats.record(
+            time.perf_counter() - self.wall_start,
+            time.thread_time() - self.cpu_start,
+        )
+
+
+class _WallTimer(_StageTimer):
+    """
+    Stage timer that records wall time only, for stages that await: the
+    thread's CPU time while suspended belongs to other coroutines.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_WallTimer":
+        self.wall_start = time.perf_counter()
+        return self
+
+    def pause(self) -> None:
+        """Stop counting time until resume()."""
+        self.wall_paused = time.perf_counter()
+
+    def resume(self) -> None:
+        """Count time again, excluding the paused interval."""
+        self.wall_start += time.perf_counter() - self.wall_paused
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stats.record(time.perf_counter() - self.wall_start, 0.0)
+
+
+class _NullTimer:
+    """No-op stage timer."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def pause(self) -> None:
+        return None
+
+    def resume(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Instrumentation:
+    """
+    Records wall time, CPU time and call counts per pipeline stage.
+
+    Usage:
+        with instrumentation.stage("parse"):
+            product = parser.parse(raw)
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {}
+
+    def stage(self, name: str, wall_only: bool = False):
+        """
+        Return a context manager that times one invocation of a stage.
+
+        Args:
+            name: Stage name
+            wall_only: Record no CPU time (for stages that await inside an
+                event loop, whose thread runs other coroutines meanwhile)
+        """
+        stats = self.stages.get(name)
+        if stats is None:
+            with _RECORD_LOCK:
+                stats = self.stages.setdefault(name, StageStats())
+        return _WallTimer(stats) if wall_only else _StageTimer(stats)
+
+    def merge(self, other: "Instrumentation") -> None:
+        """Merge another instrumentation's stages (e.g. from a worker process)."""
+        for name, other_stats in other.stages.items():
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.merge(other_stats)
+
+    def reset(self) -> None:
+        """Discard all recorded stages."""
+        self.stages = {}
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build a machine-readable summary of the run.
+
+        Returns:
+            Dictionary with per-stage calls, totals and latency percentiles
+        """
+        return {"stages": {name: stats.to_dict() for name, stats in self.stages.items()}}
+
+    def write_json(self, path: Union[str, Path]) -> None:
+        """Write the summary to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+class NullInstrumentation(Instrumentation):
+    """Instrumentation that records nothing (default)."""
+
+    enabled = False
+
+    def stage(self, name: str, wall_only: bool = False):
+        return _NULL_TIMER
+
+
+class Reporter:
+    """
+    Receives pipeline progress events.
+    The base reporter is silent.
+    """
+
+    def pipeline_started(self) -> None:
+        """Pipeline execution started."""
+
+    def step_started(self, step: int, agent: str, description: str) -> None:
+        """A numbered pipeline step started."""
+
+    def step_completed(self, message: str, details: Iterable[str] = ()) -> None:
+        """The current step completed."""
+
+    def pipeline_completed(self, output_dir: Optional[Path] = None) -> None:
+        """Pipeline execution completed."""
+
+
+class ConsoleReporter(Reporter):
+    """Prints pipeline progress banners to stdout."""
+
+    def pipeline_started(self) -> None:
+        print("=" * 80)
+        print("ORCHESTRATOR: Starting Content Generation Pipeline")
+        print("=" * 80)
+
+    def step_started(self, step: int, agent: str, description: str) -> None:
+        print(f"\n[STEP {step}] {agent}: {description}")
+
+    def step_completed(self, message: str, details: Iterable[str] = ()) -> None:
+        print(f"[OK] {message}")
+        for detail in details:
+            print(f"  {detail}")
+
+    def pipeline_completed(self, output_dir: Optional[Path] = None) -> None:
+        print("\n" + "=" * 80)
+        print("ORCHESTRATOR: Pipeline Complete")
+        print(f"Outputs saved to: {output_dir}")
+        print("=" * 80)
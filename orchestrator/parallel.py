@@ -0,0 +1,207 @@
+"""
+Parallel catalog execution: Shards a catalog across worker processes.
+Responsibility: Work distribution only - every product still runs through
+the regular OrchestratorAgent stages inside a worker.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from orchestrator.instrumentation import Instrumentation
+
+
+# Per-process orchestrator, built once by the pool initializer
+_worker_orchestrator = None
+
+
+def _init_worker(config: Dict[str, Any], instrumented: bool) -> None:
+    """Initialize the long-lived agents for this worker process."""
+    global _worker_orchestrator
+    from orchestrator.pipeline import OrchestratorAgent
+
+    _worker_orchestrator = OrchestratorAgent(
+        instrumentation=Instrumentation() if instrumented else None,
+        **config,
+    )
+
+
+def _process_chunk(
+    start_index: int,
+    raw_products: List[Dict[str, Any]],
+    write_in_workers: bool,
+    rejected: Dict[int, str],
+) -> Tuple[
+    int,
+    List[str],
+    List[Tuple[str, Optional[Dict[str, bytes]], Optional[Dict[str, str]]]],
+    Optional[Instrumentation],
+    List[str],
+    Dict[str, int],
+    Dict[str, int],
+]:
+    """
+    Run a chunk of raw records through the pipeline in a worker.
+
+    Args:
+        start_index: Catalog index of the first record in the chunk
+        raw_products: Raw product dictionaries
+        write_in_workers: Write outputs here instead of returning pages
+        rejected: Catalog index -> error of records whose product key the
+            parent could not claim; they fail without being written
+
+    Returns:
+        (skipped count, error messages, built products as
+        (product_name, pages or None if already written, fingerprints),
+        stage timings recorded for this chunk or None, unknown raw keys
+        seen by this worker so far, logic block cache counts and FAQ answer
+        service counts for this chunk)
+    """
+    skipped = 0
+    errors = []
+    built = []
+
+    items = _worker_orchestrator.stream_catalog(raw_products, window=len(raw_products), start_index=start_index)
+    for item in items:
+        error = item.error
+        if error is None:
+            error = rejected.get(item.index)
+        if error is not None:
+            errors.append(f"Record {item.index}: {error}")
+        elif item.skipped:
+            skipped += 1
+        elif write_in_workers:
+            _worker_orchestrator.save_product_pages(item.product_name, item.payloads)
+            built.append((item.product_name, None, item.fingerprints))
+        else:
+            built.append((item.product_name, item.payloads, item.fingerprints))
+    if write_in_workers:
+        # The parent records these products as built once the chunk returns
+        _worker_orchestrator.writer.flush()
+
+    block_cache_counts = {}
+    if _worker_orchestrator.block_cache is not None:
+        _worker_orchestrator.block_cache.flush()
+        block_cache_counts = _worker_orchestrator.block_cache.take_counts()
+
+    answer_counts = {}
+    if _worker_orchestrator.answer_service is not None:
+        answer_counts = _worker_orchestrator.answer_service.take_counts()
+
+    timings = None
+    instrumentation = _worker_orchestrator.instrumentation
+    if instrumentation.enabled:
+        timings = Instrumentation()
+        timings.merge(instrumentation)
+        instrumentation.reset()
+
+    return (
+        skipped,
+        errors,
+        built,
+        timings,
+        _worker_orchestrator.parser_agent.unknown_keys,
+        block_cache_counts,
+        answer_counts,
+    )
+
+
+def _chunks(
+    raw_products: Iterable[Dict[str, Any]],
+    chunk_size: int,
+    start_index: int = 0,
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """Split the catalog into (start_index, records) chunks."""
+    iterator = iter(raw_products)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start_index, chunk
+        start_index += len(chunk)
+
+
+def _claim_chunk(orchestrator, start_index: int, raw_products: List[Dict[str, Any]]) -> Dict[int, str]:
+    """
+    Claim the product keys of a chunk's records in the parent, in catalog
+    order, before any worker writes their pages.
+
+    Returns:
+        Catalog index -> error message of records whose key is taken
+    """
+    rejected = {}
+    for offset, product_name in enumerate(orchestrator.parser_agent.product_names(raw_products)):
+        if product_name is not None:
+            error = orchestrator.claim_product_key(product_name)
+            if error is not None:
+                rejected[start_index + offset] = error
+    return rejected
+
+
+def execute_catalog_parallel(
+    orchestrator,
+    raw_products: Iterable[Dict[str, Any]],
+    summary,
+    workers: int,
+    chunk_size: int = 64,
+    write_in_workers: bool = True,
+    start_index: int = 0,
+):
+    """
+    Execute a catalog across a pool of worker processes.
+
+    Records are sharded into chunks and at most two chunks per worker are
+    in flight, so the catalog is never fully materialized. Results are
+    gathered in catalog order. When write_in_workers is False the pages
+    are streamed back and written by the calling orchestrator. Worker
+    stage timings are merged into the orchestrator's instrumentation,
+    incremental fingerprints are recorded in the orchestrator's manifest
+    and progress is reported for checkpointing after each chunk. Product
+    keys are claimed here before a chunk is dispatched, so a record whose
+    key another product already holds fails (as in the serial path)
+    before any worker writes its pages.
+
+    Args:
+        orchestrator: Parent OrchestratorAgent (output settings and parent-side writes)
+        raw_products: Iterable of raw product dictionaries
+        summary: CatalogRunSummary to update in place
+        workers: Number of worker processes
+        chunk_size: Products per worker task
+        write_in_workers: Write outputs from the workers
+        start_index: Catalog index of the first record
+    """
+    max_in_flight = workers * 2
+    in_flight = deque()
+
+    def collect(future, end_index: int) -> None:
+        skipped, errors, built, timings, unknown_keys, block_cache_counts, answer_counts = future.result()
+        summary.add_unknown_keys(unknown_keys)
+        summary.add_block_cache_counts(block_cache_counts)
+        summary.add_answer_counts(answer_counts)
+        if timings is not None:
+            orchestrator.instrumentation.merge(timings)
+        summary.skipped += skipped
+        for error in errors:
+            summary.record_error(error)
+        for product_name, pages, fingerprints in built:
+            if pages is not None:
+                orchestrator.save_product_pages(product_name, pages)
+            orchestrator.record_built(product_name, fingerprints)
+            summary.processed += 1
+        orchestrator.record_progress(end_index, summary)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(orchestrator.worker_config, orchestrator.instrumentation.enabled),
+    ) as executor:
+        for chunk_start, chunk in _chunks(raw_products, chunk_size, start_index):
+            if len(in_flight) >= max_in_flight:
+                collect(*in_flight.popleft())
+            rejected = _claim_chunk(orchestrator, chunk_start, chunk)
+            future = executor.submit(_process_chunk, chunk_start, chunk, write_in_workers, rejected)
+            in_flight.append((future, chunk_start + len(chunk)))
+
+        while in_flight:
+            collect(*in_flight.popleft())
@@ -4,21 +4,114 @@ Responsibility: Orchestration only - no business logic.
 Manages execution order and passes outputs between agents.
 """
 
-import json
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from pathlib import Path
 
 from agents.parser_agent import ProductParserAgent
 from agents.question_agent import QuestionGenerationAgent
+from agents.answer_backends import AnswerBackend, AnswerCache, AnswerService
 from agents.page_agents import FAQPageAgent, ProductPageAgent, ComparisonPageAgent
-from logic_blocks.blocks import (
-    BenefitsLogicBlock,
-    UsageLogicBlock,
-    SafetyLogicBlock,
-    IngredientLogicBlock,
-    PriceLogicBlock,
-)
+from logic_blocks.blocks import DEFAULT_BLOCK_CACHE_SIZE, PRODUCT_LOGIC_BLOCKS, LogicBlockCache
+from logic_blocks.pricing import PriceColumn
+from logic_blocks.similarity import SimilarityIndex
 from templates.template_engine import TemplateEngineAgent
+from orchestrator.catalog import InvalidRecord, product_key
+from orchestrator.checkpoint import CatalogCheckpoint
+from orchestrator.instrumentation import Instrumentation, NullInstrumentation, Reporter
+from orchestrator.incremental import MANIFEST_FILENAME, BuildManifest, PageDependencies
+from orchestrator.scheduler import PageGraph
+from orchestrator.serialization import PageSerializer
+from orchestrator.writers import DEFAULT_WRITE_BUFFER, PACKED_LAYOUTS, PAGE_FILENAMES, make_writer
+
+
+# Records pulled through the streaming stages at a time
+DEFAULT_STREAM_WINDOW = 256
+
+# Error messages kept in a run summary (failures beyond this are only counted)
+MAX_SUMMARY_ERRORS = 1000
+
+# PipelineItem.competitor until the incremental check has looked it up
+_UNRESOLVED = object()
+
+
+@dataclass
+class CatalogRunSummary:
+    """Outcome of a catalog run."""
+    processed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+    unknown_keys: List[str] = field(default_factory=list)
+    resumed_from: int = 0  # Input offset a resumed run continued from
+    block_cache: Dict[str, int] = field(default_factory=dict)  # Logic block cache hit/miss counts
+    answers: Dict[str, int] = field(default_factory=dict)  # FAQ answer service counts
+
+    def add_unknown_keys(self, keys: Iterable[str]) -> None:
+        """Merge raw keys the parser could not map to a product field."""
+        self.unknown_keys = sorted(set(self.unknown_keys).union(keys))
+
+    def add_block_cache_counts(self, counts: Dict[str, int]) -> None:
+        """Add logic block cache counters (e.g. from a worker process)."""
+        for name, count in counts.items():
+            self.block_cache[name] = self.block_cache.get(name, 0) + count
+
+    def add_answer_counts(self, counts: Dict[str, int]) -> None:
+        """Add FAQ answer service counters (e.g. from a worker process)."""
+        for name, count in counts.items():
+            self.answers[name] = self.answers.get(name, 0) + count
+
+    def record_error(self, message: str) -> None:
+        """Count a failed record, keeping a bounded number of messages."""
+        self.failed += 1
+        if len(self.errors) < MAX_SUMMARY_ERRORS:
+            self.errors.append(message)
+
+
+class PipelineItem:
+    """
+    Unit of work flowing through the streaming stages.
+    Each stage fills in its output and releases inputs it no longer needs.
+    """
+
+    __slots__ = (
+        "index",
+        "raw",
+        "product",
+        "page_types",
+        "fingerprints",
+        "price",
+        "questions",
+        "answers",
+        "competitor",
+        "payloads",
+        "error",
+    )
+
+    def __init__(self, index: int, raw: Dict[str, Any]):
+        self.index = index
+        self.raw = raw
+        self.product = None
+        self.page_types = None  # None means every page type
+        self.fingerprints = None
+        self.price = None  # ParsedPrice from the batch's PriceColumn
+        self.questions = None  # Generated with the batch when FAQ answers are prefetched
+        self.answers = None  # Prefetched FAQAnswerTable
+        self.competitor = _UNRESOLVED  # Comparison competitor (or None), looked up once
+        self.payloads = None
+        self.error = None
+
+    @property
+    def product_name(self) -> str:
+        """Name of the parsed product."""
+        return self.product.name
+
+    @property
+    def skipped(self) -> bool:
+        """True if incremental mode found nothing to regenerate."""
+        return self.page_types is not None and not self.page_types
 
 
 class OrchestratorAgent:
@@ -28,24 +121,141 @@ class OrchestratorAgent:
     Contains no business logic.
     """
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(
+        self,
+        output_dir: str = "output",
+        instrumentation: Optional[Instrumentation] = None,
+        reporter: Optional[Reporter] = None,
+        incremental: bool = False,
+        field_aliases: Optional[Dict[str, List[str]]] = None,
+        compact_json: bool = False,
+        output_layout: str = "flat",
+        write_buffer: int = DEFAULT_WRITE_BUFFER,
+        background_writes: bool = False,
+        node_workers: int = 1,
+        block_cache_size: int = 0,
+        block_cache_path: Optional[str] = None,
+        comparison_index: Optional[SimilarityIndex] = None,
+        answer_backend: Optional[AnswerBackend] = None,
+        answer_cache_path: Optional[str] = None,
+        answer_concurrency: int = 4,
+        answer_timeout: float = 30.0,
+    ):
         """
         Initialize orchestrator.
 
         Args:
             output_dir: Directory for JSON outputs
+            instrumentation: Per-stage timing recorder (default: records nothing)
+            reporter: Progress reporter (default: silent)
+            incremental: Skip catalog pages whose inputs and code are unchanged
+                since the last run (tracked in a manifest in output_dir)
+            field_aliases: Parser alias table (default: DEFAULT_FIELD_ALIASES)
+            compact_json: Write JSON without indentation (default: indent=2;
+                always compact for packed layouts)
+            output_layout: Catalog page layout: "flat", "sharded", or a packed
+                "jsonl"/"sqlite"/"archive" bundle (see orchestrator.writers)
+            write_buffer: Catalog products buffered before a batch is written
+            background_writes: Write catalog pages on a background I/O thread
+            node_workers: Threads for running independent page graph nodes
+                concurrently (1 runs them in order on the calling thread)
+            block_cache_size: Logic block fragments memoized across products
+                (0 disables the cache unless block_cache_path is set)
+            block_cache_path: SQLite file that keeps memoized fragments
+                across runs
+            comparison_index: Catalog similarity index; comparison pages are
+                built against each product's most similar indexed product
+                instead of the fictional Product B
+            answer_backend: Backend producing FAQ answer text (default: the
+                FAQ agent's local answer table); catalog runs resolve each
+                window's answers in batched calls
+            answer_cache_path: SQLite file that keeps backend answers across runs
+            answer_concurrency: Backend calls in flight at a time
+            answer_timeout: Seconds to wait for each backend call before
+                falling back to local answers
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.instrumentation = instrumentation or NullInstrumentation()
+        self.reporter = reporter or Reporter()
+        compact_json = compact_json or output_layout in PACKED_LAYOUTS
+        self.serializer = PageSerializer(indent=None if compact_json else 2)
+        self.writer = make_writer(
+            self.output_dir,
+            layout=output_layout,
+            buffer_size=write_buffer,
+            background=background_writes,
+        )
+
+        # Settings needed to rebuild this orchestrator in a worker process
+        self.worker_config = {
+            "output_dir": str(self.output_dir),
+            "incremental": incremental,
+            "field_aliases": field_aliases,
+            "compact_json": compact_json,
+            "output_layout": output_layout,
+            "write_buffer": write_buffer,
+            "background_writes": background_writes,
+            "node_workers": node_workers,
+            "block_cache_size": block_cache_size,
+            "block_cache_path": block_cache_path,
+            "comparison_index": comparison_index,
+            "answer_backend": answer_backend,
+            "answer_cache_path": answer_cache_path,
+            "answer_concurrency": answer_concurrency,
+            "answer_timeout": answer_timeout,
+        }
 
         # Initialize all agents
-        self.parser_agent = ProductParserAgent()
+        self.parser_agent = ProductParserAgent(field_aliases=field_aliases)
         self.question_agent = QuestionGenerationAgent()
         self.template_engine = TemplateEngineAgent()
-        self.faq_agent = FAQPageAgent()
+        self.answer_service = None
+        if answer_backend is not None:
+            self.answer_service = AnswerService(
+                answer_backend,
+                AnswerCache(path=answer_cache_path),
+                max_concurrency=answer_concurrency,
+                timeout=answer_timeout,
+            )
+        self.faq_agent = FAQPageAgent(answer_service=self.answer_service)
         self.product_page_agent = ProductPageAgent()
         self.comparison_agent = ComparisonPageAgent()
 
+        self.comparison_index = comparison_index
+
+        # Fragments shared by products whose block input fields are identical
+        self.block_cache = None
+        if block_cache_size > 0 or block_cache_path is not None:
+            self.block_cache = LogicBlockCache(block_cache_size or DEFAULT_BLOCK_CACHE_SIZE, block_cache_path)
+
+        # Per-product work: logic blocks -> pages -> payloads -> writer
+        self.graph = PageGraph(self)
+        self.node_executor = ThreadPoolExecutor(node_workers) if node_workers > 1 else None
+
+        # Catalog checkpoint state (set up by execute_catalog)
+        self.checkpoint = None
+        self._checkpoint_every = 0
+
+        # Product key -> name of every product recorded in the current catalog run
+        self._product_keys: Dict[str, str] = {}
+
+        # Incremental build state
+        self.manifest = None
+        self.page_dependencies = None
+        if incremental:
+            self.manifest = BuildManifest(self.output_dir / MANIFEST_FILENAME)
+            self.page_dependencies = PageDependencies(
+                self.template_engine,
+                {
+                    "faq": self.faq_agent,
+                    "product": self.product_page_agent,
+                    "comparison": self.comparison_agent,
+                },
+                # A layout or JSON format change rewrites every page
+                output_settings=(output_layout, "compact" if compact_json else "indent=2"),
+            )
+
     def execute_pipeline(self, raw_product: Dict[str, Any]) -> None:
         """
         Execute the complete pipeline.
@@ -60,82 +270,497 @@ class OrchestratorAgent:
         Args:
             raw_product: Raw product dictionary
         """
-        print("=" * 80)
-        print("ORCHESTRATOR: Starting Content Generation Pipeline")
-        print("=" * 80)
+        reporter = self.reporter
+        reporter.pipeline_started()
 
         # Step 1: Parse product
-        print("\n[STEP 1] ProductParserAgent: Parsing and validating product data...")
-        product = self.parser_agent.parse(raw_product)
-        print(f"[OK] Product parsed: {product.name}")
+        reporter.step_started(1, "ProductParserAgent", "Parsing and validating product data...")
+        product = self._parse(raw_product)
+        reporter.step_completed(f"Product parsed: {product.name}")
 
         # Step 2: Generate questions
-        print("\n[STEP 2] QuestionGenerationAgent: Generating questions...")
-        questions = self.question_agent.generate(product)
-        print(f"[OK] Generated {len(questions)} questions across {self.question_agent.categories}")
-        for q in questions[:3]:
-            print(f"  - [{q.category}] {q.question}")
-        print(f"  ... and {len(questions) - 3} more questions")
+        reporter.step_started(2, "QuestionGenerationAgent", "Generating questions...")
+        questions = self._generate_questions(product)
+        reporter.step_completed(
+            f"Generated {len(questions)} questions across {self.question_agent.categories}",
+            [f"- [{q.category}] {q.question}" for q in questions[:3]]
+            + [f"... and {len(questions) - 3} more questions"],
+        )
 
         # Step 3: Generate logic blocks
-        print("\n[STEP 3] Logic Blocks: Generating content fragments...")
+        reporter.step_started(3, "Logic Blocks", "Generating content fragments...")
         logic_blocks = self._generate_logic_blocks(product)
-        print(f"[OK] Generated {len(logic_blocks)} logic blocks")
-        for block_name in logic_blocks.keys():
-            print(f"  - {block_name}")
+        reporter.step_completed(
+            f"Generated {len(logic_blocks)} logic blocks",
+            [f"- {block_name}" for block_name in logic_blocks.keys()],
+        )
 
         # Step 4: Generate FAQ page
-        print("\n[STEP 4] FAQPageAgent: Assembling FAQ page...")
-        faq_page = self.faq_agent.generate(product, questions, logic_blocks)
-        self._save_output("faq.json", faq_page.to_dict())
-        print(f"[OK] FAQ page generated with {faq_page.total_questions} Q&A pairs")
+        reporter.step_started(4, "FAQPageAgent", "Assembling FAQ page...")
+        with self.instrumentation.stage("page.faq"):
+            faq_page = self.faq_agent.generate(product, questions, logic_blocks)
+        self._save_output("faq.json", self._serialize(faq_page))
+        reporter.step_completed(f"FAQ page generated with {faq_page.total_questions} Q&A pairs")
 
         # Step 5: Generate product page
-        print("\n[STEP 5] ProductPageAgent: Assembling product page...")
-        product_page = self.product_page_agent.generate(product, logic_blocks)
-        self._save_output("product_page.json", product_page.to_dict())
-        print(f"[OK] Product page generated with {len(product_page.sections)} sections")
+        reporter.step_started(5, "ProductPageAgent", "Assembling product page...")
+        with self.instrumentation.stage("page.product"):
+            product_page = self.product_page_agent.generate(product, logic_blocks)
+        self._save_output("product_page.json", self._serialize(product_page))
+        reporter.step_completed(f"Product page generated with {len(product_page.sections)} sections")
 
         # Step 6: Generate comparison page
-        print("\n[STEP 6] ComparisonPageAgent: Assembling comparison page...")
-        comparison_page = self.comparison_agent.generate(product)
-        self._save_output("comparison_page.json", comparison_page.to_dict())
-        print(f"[OK] Comparison page generated ({product.name} vs {comparison_page.product_b_name})")
+        reporter.step_started(6, "ComparisonPageAgent", "Assembling comparison page...")
+        with self.instrumentation.stage("page.comparison"):
+            comparison_page = self.comparison_agent.generate(product)
+        self._save_output("comparison_page.json", self._serialize(comparison_page))
+        reporter.step_completed(f"Comparison page generated ({product.name} vs {comparison_page.product_b_name})")
+
+        reporter.pipeline_completed(self.output_dir)
+
+    def execute_catalog(
+        self,
+        raw_products: Iterable[Dict[str, Any]],
+        workers: int = 1,
+        chunk_size: int = 64,
+        write_in_workers: bool = True,
+        window: int = DEFAULT_STREAM_WINDOW,
+        checkpoint_every: int = 0,
+        resume: bool = False,
+    ) -> CatalogRunSummary:
+        """
+        Execute the pipeline for every product in a catalog.
+
+        All products run through the same long-lived agents, so templates
+        and fixtures are initialized once per invocation. Records are
+        streamed through the stages (see stream_catalog), so memory stays
+        bounded by the in-flight window. Each product's pages are written
+        through the page writer: to the product's own subdirectory of the
+        output directory (flat or sharded), or into a packed bundle.
+        Invalid records are recorded in the summary and skipped. In
+        incremental mode only stale pages are regenerated and the manifest
+        is saved at the end.
+
+        With checkpoint_every > 0 the writer is flushed and a checkpoint
+        (input offset, counters, writer state) is saved in the
+        output directory every that many records. resume=True continues
+        an interrupted run from its last checkpoint: records before the
+        offset are not re-processed and output written after the
+        checkpoint is discarded (see CatalogCheckpoint). The checkpoint is
+        removed once the run completes.
+
+        Args:
+            raw_products: Iterable of raw product dictionaries
+            workers: Number of worker processes (1 runs in-process)
+            chunk_size: Products per worker task when workers > 1
+            write_in_workers: If True workers write their own outputs,
+                otherwise pages are streamed back and written here
+                (always the case for single-file bundles)
+            window: Maximum records in flight in the streaming stages
+            checkpoint_every: Records between checkpoints (0 disables checkpoints)
+            resume: Continue from the checkpoint in the output directory, if any
+
+        Returns:
+            CatalogRunSummary with processed/skipped/failed counts
+
+        Raises:
+            ValueError: If the catalog is shorter than the checkpoint offset
+        """
+        raw_products = iter(raw_products)
+        summary = self._begin_catalog(raw_products, checkpoint_every, resume)
+        start_index = summary.resumed_from
+
+        if workers > 1:
+            from orchestrator.parallel import execute_catalog_parallel
+
+            if not self.writer.process_safe:
+                write_in_workers = False
+            execute_catalog_parallel(
+                self,
+                raw_products,
+                summary,
+                workers=workers,
+                chunk_size=chunk_size,
+                write_in_workers=write_in_workers,
+                start_index=start_index,
+            )
+        else:
+            for item in self.stream_catalog(raw_products, window=window, start_index=start_index):
+                self.record_item(item, summary)
+            summary.add_unknown_keys(self.parser_agent.unknown_keys)
+
+        self._finish_catalog(summary)
+        return summary
+
+    def _begin_catalog(self, raw_products: Iterator[Dict[str, Any]], checkpoint_every: int, resume: bool) -> CatalogRunSummary:
+        """Set up checkpointing (resuming if requested) and return the run's summary."""
+        summary = CatalogRunSummary()
+        self._product_keys = {}
+        self.checkpoint = CatalogCheckpoint.load(self.output_dir) if resume else None
+        if self.checkpoint is not None:
+            self._resume_from_checkpoint(raw_products, summary)
+        elif checkpoint_every > 0:
+            self.checkpoint = CatalogCheckpoint(self.output_dir)
+            self.checkpoint.commit(0, summary, self.writer.committed_state())
+        self._checkpoint_every = checkpoint_every if self.checkpoint is not None else 0
+        return summary
+
+    def _finish_catalog(self, summary: CatalogRunSummary) -> None:
+        """Close the block cache and writer, then save the manifest and drop the checkpoint."""
+        if self.block_cache is not None:
+            self.block_cache.close()
+            summary.add_block_cache_counts(self.block_cache.take_counts())
+        if self.answer_service is not None:
+            self.answer_service.close()
+            summary.add_answer_counts(self.answer_service.take_counts())
+
+        # Pages must be on disk before the manifest claims them
+        self.writer.close()
+        if self.manifest is not None:
+            self.manifest.save()
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+            self.checkpoint = None
+
+    def _resume_from_checkpoint(self, raw_products: Iterator[Dict[str, Any]], summary: CatalogRunSummary) -> None:
+        """Restore counters and output state, and skip records already finished."""
+        checkpoint = self.checkpoint
+        self.writer.restore(checkpoint.writer_state)
+        consumed = sum(1 for _ in islice(raw_products, checkpoint.offset))
+        if consumed < checkpoint.offset:
+            raise ValueError(
+                f"Catalog has {consumed} records but the checkpoint resumes at record {checkpoint.offset}"
+            )
+        summary.processed = checkpoint.counts["processed"]
+        summary.skipped = checkpoint.counts["skipped"]
+        summary.failed = checkpoint.counts["failed"]
+        summary.errors = list(checkpoint.errors)
+        summary.resumed_from = checkpoint.offset
+
+    def record_progress(self, offset: int, summary: CatalogRunSummary) -> None:
+        """
+        Note that every record before `offset` is finished, and commit a
+        checkpoint when the interval has elapsed.
+        """
+        if self._checkpoint_every and offset - self.checkpoint.offset >= self._checkpoint_every:
+            self.writer.flush()
+            self.checkpoint.commit(offset, summary, self.writer.committed_state())
+            if self.manifest is not None:
+                # Journaled after the commit: a crash in between only loses
+                # entries (their pages are rebuilt), never claims unresumed ones
+                self.manifest.append()
+
+    def record_item(self, item: PipelineItem, summary: CatalogRunSummary) -> None:
+        """Write a finished item's pages (or record its error or skip) in catalog order."""
+        error = item.error
+        if error is None:
+            error = self.claim_product_key(item.product_name)
+        if error is not None:
+            summary.record_error(f"Record {item.index}: {error}")
+        elif item.skipped:
+            summary.skipped += 1
+        else:
+            self.save_product_pages(item.product_name, item.payloads)
+            self.record_built(item.product_name, item.fingerprints)
+            summary.processed += 1
+        self.record_progress(item.index + 1, summary)
+
+    def claim_product_key(self, product_name: str) -> Optional[str]:
+        """
+        Reserve a product's key (output directory, manifest and checkpoint
+        entry) for this catalog run.
+
+        Returns:
+            None, or an error message if a product with a different name
+            already holds the key (its pages must not be overwritten)
+        """
+        key = product_key(product_name)
+        holder = self._product_keys.setdefault(key, product_name)
+        if holder != product_name:
+            return f"Product key {key!r} of {product_name!r} is already used by {holder!r}"
+        return None
+
+    def record_built(self, product_name: str, fingerprints: Optional[Dict[str, str]]) -> None:
+        """Record written pages in the incremental manifest, if enabled."""
+        if self.manifest is not None and fingerprints:
+            self.manifest.record(product_key(product_name), fingerprints)
+
+    def stream_catalog(
+        self,
+        raw_products: Iterable[Dict[str, Any]],
+        window: int = DEFAULT_STREAM_WINDOW,
+        start_index: int = 0,
+    ) -> Iterator[PipelineItem]:
+        """
+        Lazily run a catalog through chained generator stages.
+
+        Stage chain: parse -> (incremental check) -> (FAQ answer prefetch)
+        -> page graph (questions, logic blocks, pages and payloads, see
+        PageGraph). At most `window`
+        records are in flight across the whole chain, and each stage drops
+        intermediate results once the next stage has used them, so memory
+        stays flat regardless of catalog size.
+
+        Args:
+            raw_products: Iterable of raw product dictionaries
+            window: Maximum number of records in flight
+            start_index: Catalog index of the first record
+
+        Returns:
+            Iterator of PipelineItem with payloads set, or error set for
+            invalid records
+        """
+        batches = self._read_stage(raw_products, window, start_index)
+        batches = self._parse_stage(batches)
+        if self.manifest is not None:
+            batches = self._incremental_stage(batches)
+        if self.answer_service is not None:
+            batches = self._answer_stage(batches)
+        batches = self._graph_stage(batches)
+
+        for batch in batches:
+            yield from batch
+
+    def _read_stage(
+        self,
+        raw_products: Iterable[Dict[str, Any]],
+        window: int,
+        start_index: int,
+    ) -> Iterator[List[PipelineItem]]:
+        """Pull raw records from the source, at most `window` at a time."""
+        iterator = iter(raw_products)
+        index = start_index
+        while True:
+            batch = [PipelineItem(index + offset, raw) for offset, raw in enumerate(islice(iterator, window))]
+            if not batch:
+                return
+            index += len(batch)
+            yield batch
+
+    def _parse_stage(self, batches: Iterator[List[PipelineItem]]) -> Iterator[List[PipelineItem]]:
+        """
+        Parse and validate raw records a window at a time through the
+        columnar batch parser (timed as stage "parse_batch"), then parse
+        the batch's price column once (stage "parse_prices"). Records the
+        catalog reader could not decode (InvalidRecord) fail with its error.
+        """
+        for batch in batches:
+            errors = []
+            valid = batch
+            if any(item.raw.__class__ is InvalidRecord for item in batch):
+                for item in batch:
+                    if item.raw.__class__ is InvalidRecord:
+                        item.error = item.raw.error
+                valid = [item for item in batch if item.error is None]
+            with self.instrumentation.stage("parse_batch"):
+                product_batch = self.parser_agent.parse_batch([item.raw for item in valid], errors)
+            with self.instrumentation.stage("parse_prices"):
+                prices = PriceColumn(product_batch.prices)
+            for row, (position, product) in enumerate(zip(product_batch.source_indices, product_batch)):
+                valid[position].product = product
+                valid[position].price = prices[row]
+            for position, message in errors:
+                valid[position].error = message
+            for item in batch:
+                item.raw = None
+            yield batch
 
-        print("\n" + "=" * 80)
-        print("ORCHESTRATOR: Pipeline Complete")
-        print(f"Outputs saved to: {self.output_dir}")
-        print("=" * 80)
+    def _incremental_stage(self, batches: Iterator[List[PipelineItem]]) -> Iterator[List[PipelineItem]]:
+        """Restrict each product to the pages whose fingerprint changed."""
+        for batch in batches:
+            for item in batch:
+                if item.error is None:
+                    self.check_stale_pages(item)
+            yield batch
 
-    def _generate_logic_blocks(self, product) -> Dict[str, Any]:
+    def _answer_stage(self, batches: Iterator[List[PipelineItem]]) -> Iterator[List[PipelineItem]]:
         """
-        Generate all logic blocks.
+        Generate the questions of every product in the batch that needs an
+        FAQ page and resolve all of their answers together (stage
+        "faq_answers"), so the answer backend sees a few batched calls per
+        window instead of one per product. Each product's answer table goes
+        to its FAQ page, so answers the backend failed to give are not
+        asked for again.
+        """
+        for batch in batches:
+            items = [
+                item
+                for item in batch
+                if item.error is None and (item.page_types is None or "faq" in item.page_types)
+            ]
+            if items:
+                products = [item.product for item in items]
+                with self.instrumentation.stage("questions"):
+                    questions = self.question_agent.generate_batch(products)
+                with self.instrumentation.stage("faq_answers"):
+                    tables = self.faq_agent.prefetch_answers(products, questions)
+                for item, product_questions, answers in zip(items, questions, tables):
+                    item.questions = product_questions
+                    item.answers = answers
+            yield batch
+
+    def _graph_stage(self, batches: Iterator[List[PipelineItem]]) -> Iterator[List[PipelineItem]]:
+        """
+        Run the page graph nodes each product's requested pages need and
+        keep only the encoded payloads.
+        """
+        for batch in batches:
+            for item in batch:
+                self.build_payloads(item)
+            yield batch
+
+    def check_stale_pages(self, item: PipelineItem) -> None:
+        """Set a parsed item's page types to the pages whose fingerprint changed (incremental mode)."""
+        with self.instrumentation.stage("fingerprint"):
+            competitor = item.competitor = self.comparison_competitor(item.product)
+            fingerprints = self.page_dependencies.fingerprints(
+                item.product,
+                related={"comparison": competitor} if competitor is not None else None,
+            )
+            stale = self.manifest.stale_pages(product_key(item.product.name), fingerprints)
+        item.page_types = stale
+        item.fingerprints = {page_type: fingerprints[page_type] for page_type in stale}
+
+    def build_payloads(self, item: PipelineItem) -> None:
+        """Run the page graph for a parsed item's requested pages and keep the encoded payloads."""
+        if item.error is None and not item.skipped:
+            graph = self.graph
+            targets = graph.page_targets(item.page_types, "payload")
+            results = {"price": item.price}
+            if item.questions is not None:
+                results["questions"] = item.questions
+            if item.answers is not None:
+                results["faq_answers"] = item.answers
+            if item.competitor is not _UNRESOLVED:
+                results["competitor"] = item.competitor
+            results = graph.run(targets, item.product, results, executor=self.node_executor)
+            item.payloads = {target[len("payload."):]: results[target] for target in targets}
+            faq_page = results.get("page.faq")
+            if faq_page is not None and faq_page.fallback_answers and item.fingerprints:
+                # Written, but not recorded as built: the next incremental run
+                # asks the answer backend again instead of keeping local answers
+                item.fingerprints.pop("faq", None)
+        item.price = None
+        item.questions = None
+        item.answers = None
+        item.competitor = _UNRESOLVED
+
+    def save_product_pages(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Save one product's pages to its own output subdirectory.
+        Writes are buffered; call writer.flush() to force them to disk.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> encoded JSON page
+        """
+        with self.instrumentation.stage("save_output"):
+            self.writer.write(product_name, pages)
+
+    def generate_pages(self, product, page_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Generate pages for a parsed product.
+
+        Only the page graph nodes the requested pages depend on are run
+        (e.g. the comparison page needs no per-product logic blocks).
 
         Args:
             product: Parsed product model
+            page_types: Page types to generate (default: all)
+
+        Returns:
+            Dictionary of page_type -> page model
+        """
+        targets = self.graph.page_targets(page_types)
+        results = self.graph.run(targets, product, executor=self.node_executor)
+        return {target[len("page."):]: results[target] for target in targets}
+
+    def build_comparison_index(self, raw_products: Iterable[Dict[str, Any]]) -> SimilarityIndex:
+        """
+        Index a catalog for competitor comparisons and use it for this
+        orchestrator's comparison pages. Invalid records are ignored here
+        (they are reported by the catalog run itself).
+
+        Args:
+            raw_products: Iterable of raw product dictionaries (one pass)
+
+        Returns:
+            The SimilarityIndex, also stored as self.comparison_index
+        """
+        index = SimilarityIndex()
+        iterator = iter(raw_products)
+        with self.instrumentation.stage("comparison_index"):
+            while True:
+                raw_batch = list(islice(iterator, DEFAULT_STREAM_WINDOW))
+                if not raw_batch:
+                    break
+                index.add_all(self.parser_agent.parse_batch(raw_batch, []))
+        self.comparison_index = index
+        self.worker_config["comparison_index"] = index
+        return index
+
+    def comparison_competitor(self, product):
+        """Most similar catalog product to compare against, or None for the fictional Product B."""
+        if self.comparison_index is None:
+            return None
+        return self.comparison_index.nearest_one(product)
+
+    def _parse(self, raw_product: Dict[str, Any]):
+        """Parse a raw record (timed as stage "parse")."""
+        with self.instrumentation.stage("parse"):
+            return self.parser_agent.parse(raw_product)
+
+    def _generate_questions(self, product):
+        """Generate questions (timed as stage "questions")."""
+        with self.instrumentation.stage("questions"):
+            return self.question_agent.generate(product)
+
+    def _serialize(self, page) -> bytes:
+        """Encode a page model as JSON bytes (timed as stage "serialize")."""
+        with self.instrumentation.stage("serialize"):
+            return self.serializer.serialize(page)
+
+    def _generate_logic_blocks(self, product, block_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Generate logic blocks.
+        Each block is timed as stage "logic_block.<name>".
+
+        Args:
+            product: Parsed product model
+            block_names: Blocks to generate (default: all)
 
         Returns:
             Dictionary of block_name -> ContentFragment
         """
         logic_blocks = {}
+        stage = self.instrumentation.stage
 
         # Generate each logic block
-        logic_blocks["benefits"] = BenefitsLogicBlock.generate(product)
-        logic_blocks["usage"] = UsageLogicBlock.generate(product)
-        logic_blocks["safety"] = SafetyLogicBlock.generate(product)
-        logic_blocks["ingredient"] = IngredientLogicBlock.generate(product)
-        logic_blocks["price"] = PriceLogicBlock.generate(product)
+        for block_name in block_names if block_names is not None else PRODUCT_LOGIC_BLOCKS:
+            with stage("logic_block." + block_name):
+                logic_blocks[block_name] = self._generate_logic_block(block_name, product)
 
         return logic_blocks
 
-    def _save_output(self, filename: str, data: Dict[str, Any]) -> None:
+    def _generate_logic_block(self, block_name: str, product, *inputs):
+        """
+        Generate one logic block fragment, through the block cache if enabled.
+        Inputs (e.g. a parsed price) are passed to the block after the product.
+        """
+        if self.block_cache is not None:
+            return self.block_cache.generate(block_name, product, *inputs)
+        return PRODUCT_LOGIC_BLOCKS[block_name].generate(product, *inputs)
+
+    def _save_output(self, filename: str, data: bytes, directory: Optional[Path] = None) -> None:
         """
         Save output to JSON file.
 
         Args:
             filename: Output filename
-            data: Data to save
+            data: Encoded JSON (see PageSerializer)
+            directory: Target directory (defaults to the output directory)
         """
-        output_path = self.output_dir / filename
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        output_path = (directory or self.output_dir) / filename
+        with self.instrumentation.stage("save_output"):
+            with open(output_path, "wb") as f:
+                f.write(data)
@@ -0,0 +1,364 @@
+"""
+Page graph: Dependency graph of the per-product generation work.
+Responsibility: Scheduling only - every node delegates to an existing agent or logic block.
+
+Nodes and edges are derived from the declarations that already exist:
+- questions             <- QuestionGenerationAgent (needed by the FAQ page)
+- competitor            <- the orchestrator's comparison index (needed by the
+                           comparison page; None compares with Product B)
+- price                 <- parsed product.price (precomputed per batch by the
+                           catalog stream, see logic_blocks.pricing)
+- logic_block.<name>    <- PRODUCT_LOGIC_BLOCKS entries a template requires
+- page.<type>           <- questions for FAQ, competitor for comparison;
+                           lazily, the logic blocks in
+                           TemplateDefinition.required_logic_blocks
+- payload.<type>        <- page.<type> (PageSerializer)
+- write                 <- every payload (the page writer)
+
+Only the nodes the requested page types depend on are run. Nodes in the
+same dependency level are independent and can run concurrently. Lazy
+dependencies are not scheduled: a page receives its logic blocks as a
+LazyLogicBlocks mapping and each block node runs the first time the page
+agent reads it, so blocks a page never reads (e.g. every block the FAQ
+template declares) are never generated. A lazily run block is timed as its
+own logic_block.<name> stage and excluded from the page.<type> stage.
+"""
+
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from logic_blocks.blocks import PRODUCT_LOGIC_BLOCKS, LazyLogicBlocks
+from logic_blocks.pricing import parse_price
+
+# Nodes whose results are passed to a logic block after the product
+BLOCK_INPUT_NODES = {"price": ("price",)}
+
+
+class GraphNode:
+    """One unit of per-product work."""
+
+    __slots__ = ("name", "kind", "deps", "lazy_deps", "func")
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        deps: Sequence[str],
+        func: Callable[[Any, Dict[str, Any]], Any],
+        lazy_deps: Sequence[str] = (),
+    ):
+        """
+        Initialize node.
+
+        Args:
+            name: Unique node name, e.g. "logic_block.benefits"
+            kind: Node kind: questions, competitor, price, logic_block, page,
+                payload or write
+            deps: Names of the nodes whose results this node reads
+            func: Callable (product, results) -> result
+            lazy_deps: Names of nodes this node may resolve on demand
+        """
+        self.name = name
+        self.kind = kind
+        self.deps = tuple(deps)
+        self.lazy_deps = tuple(lazy_deps)
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"GraphNode({self.name!r}, deps={list(self.deps)!r})"
+
+
+class TaskGraph:
+    """
+    Directed acyclic graph of GraphNodes.
+    Nodes must be added after their dependencies, so insertion order is a
+    topological order.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, GraphNode] = {}
+        self._plans: Dict[Tuple[str, ...], List[List[str]]] = {}
+
+    def add(
+        self,
+        name: str,
+        kind: str,
+        deps: Sequence[str],
+        func: Callable[[Any, Dict[str, Any]], Any],
+        lazy_deps: Sequence[str] = (),
+    ) -> None:
+        """
+        Add a node.
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate graph node: {name}")
+        for dep in tuple(deps) + tuple(lazy_deps):
+            if dep not in self.nodes:
+                raise ValueError(f"Graph node {name} depends on unknown node {dep}")
+        self.nodes[name] = GraphNode(name, kind, deps, func, lazy_deps)
+        self._plans = {}
+
+    def plan(self, targets: Iterable[str]) -> List[List[str]]:
+        """
+        Nodes needed for the targets, grouped into dependency levels.
+
+        Every node in a level depends only on nodes in earlier levels, so
+        the nodes of one level can run concurrently.
+
+        Args:
+            targets: Names of the nodes whose results are wanted
+
+        Returns:
+            List of levels, each a list of node names in insertion order
+        """
+        key = tuple(targets)
+        levels = self._plans.get(key)
+        if levels is not None:
+            return levels
+
+        needed = set()
+        pending = list(key)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.nodes[name].deps)
+
+        depth: Dict[str, int] = {}
+        levels = []
+        for name, node in self.nodes.items():
+            if name not in needed:
+                continue
+            level = max((depth[dep] + 1 for dep in node.deps), default=0)
+            depth[name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(name)
+        self._plans[key] = levels
+        return levels
+
+    def run(
+        self,
+        targets: Iterable[str],
+        product: Any,
+        results: Optional[Dict[str, Any]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the nodes needed for the targets.
+
+        Args:
+            targets: Names of the nodes whose results are wanted
+            product: Parsed product model passed to every node
+            results: Results computed earlier; those nodes are not re-run
+            executor: Run each level's nodes concurrently on this executor
+
+        Returns:
+            Dictionary of node name -> result
+        """
+        results = {} if results is None else results
+        nodes = self.nodes
+        for level in self.plan(targets):
+            todo = [name for name in level if name not in results]
+            if executor is not None and len(todo) > 1:
+                futures = [(name, executor.submit(nodes[name].func, product, results)) for name in todo]
+                for name, future in futures:
+                    results[name] = future.result()
+            else:
+                for name in todo:
+                    results[name] = nodes[name].func(product, results)
+        return results
+
+    def resolve(self, name: str, product: Any, results: Dict[str, Any]) -> Any:
+        """
+        Result of one node, running it (and its missing dependencies) on
+        the calling thread if it has not run yet. Used for lazy dependencies.
+
+        Args:
+            name: Node name
+            product: Parsed product model passed to every node
+            results: Results of the current run; updated in place
+
+        Returns:
+            The node's result
+        """
+        if name not in results:
+            self.run((name,), product, results)
+        return results[name]
+
+    def describe(self) -> Dict[str, Dict[str, Any]]:
+        """Graph structure as {node: {"kind": ..., "deps": [...], "lazy_deps": [...]}} for inspection."""
+        return {
+            name: {"kind": node.kind, "deps": list(node.deps), "lazy_deps": list(node.lazy_deps)}
+            for name, node in self.nodes.items()
+        }
+
+    def to_dot(self, targets: Optional[Iterable[str]] = None) -> str:
+        """
+        Render the graph (or the part needed for targets) in Graphviz DOT
+        format. Lazy dependencies are drawn dashed.
+        """
+        if targets is None:
+            names = set(self.nodes)
+        else:
+            names = set()
+            pending = list(targets)
+            while pending:
+                for level in self.plan(pending):
+                    names.update(level)
+                pending = [dep for name in names for dep in self.nodes[name].lazy_deps if dep not in names]
+        lines = ["digraph pages {", "  rankdir=LR;"]
+        for name, node in self.nodes.items():
+            if name in names:
+                lines.append(f'  "{name}" [label="{name}\\n({node.kind})"];')
+                lines.extend(f'  "{dep}" -> "{name}";' for dep in node.deps)
+                lines.extend(f'  "{dep}" -> "{name}" [style=dashed];' for dep in node.lazy_deps if dep in names)
+        lines.append("}")
+        return "\n".join(lines)
+
+
+class PageGraph(TaskGraph):
+    """
+    Per-product generation graph of an OrchestratorAgent.
+    """
+
+    def __init__(self, orchestrator):
+        """
+        Build nodes from the orchestrator's agents and template declarations.
+
+        Args:
+            orchestrator: OrchestratorAgent whose agents the nodes call
+        """
+        super().__init__()
+        self.page_types: List[str] = []
+        stage = orchestrator.instrumentation.stage
+
+        self.add("questions", "questions", (), lambda product, results: orchestrator._generate_questions(product))
+        self.add("competitor", "competitor", (), self._competitor(stage, orchestrator))
+
+        page_agents = {
+            "faq": lambda product, results, blocks: orchestrator.faq_agent.generate(
+                product, results["questions"], blocks, results.get("faq_answers")
+            ),
+            "product": lambda product, results, blocks: orchestrator.product_page_agent.generate(product, blocks),
+            "comparison": lambda product, results, blocks: orchestrator.comparison_agent.generate(
+                product, results["competitor"]
+            ),
+        }
+        page_deps = {"faq": ["questions"], "comparison": ["competitor"]}
+        page_blocks = {
+            page_type: [
+                block_name
+                for block_name in orchestrator.template_engine.get_required_blocks(page_type)
+                if block_name in PRODUCT_LOGIC_BLOCKS
+            ]
+            for page_type in page_agents
+        }
+
+        used_blocks = [
+            block_name
+            for block_name in PRODUCT_LOGIC_BLOCKS
+            if any(block_name in blocks for blocks in page_blocks.values())
+        ]
+        if "price" in used_blocks:
+            self.add("price", "price", (), lambda product, results: parse_price(product.price))
+        for block_name in used_blocks:
+            inputs = BLOCK_INPUT_NODES.get(block_name, ())
+            self.add(
+                "logic_block." + block_name,
+                "logic_block",
+                inputs,
+                self._logic_block(stage, block_name, inputs, orchestrator._generate_logic_block),
+            )
+
+        for page_type, generate in page_agents.items():
+            self.add(
+                "page." + page_type,
+                "page",
+                page_deps.get(page_type, []),
+                self._page(stage, page_type, generate, page_blocks[page_type]),
+                lazy_deps=["logic_block." + block_name for block_name in page_blocks[page_type]],
+            )
+            self.add(
+                "payload." + page_type,
+                "payload",
+                ["page." + page_type],
+                lambda product, results, node="page." + page_type: orchestrator._serialize(results[node]),
+            )
+            self.page_types.append(page_type)
+
+        self.add(
+            "write",
+            "write",
+            ["payload." + page_type for page_type in self.page_types],
+            self._write(orchestrator),
+        )
+
+    @staticmethod
+    def _competitor(stage, orchestrator):
+        def run(product, results):
+            with stage("competitor"):
+                return orchestrator.comparison_competitor(product)
+
+        return run
+
+    @staticmethod
+    def _logic_block(stage, block_name: str, inputs: Tuple[str, ...], generate):
+        stage_name = "logic_block." + block_name
+
+        def run(product, results):
+            with stage(stage_name):
+                return generate(block_name, product, *[results[name] for name in inputs])
+
+        return run
+
+    def _page(self, stage, page_type: str, generate, block_names: List[str]):
+        stage_name = "page." + page_type
+        resolve = self.resolve
+
+        def run(product, results):
+            timer = stage(stage_name)
+
+            def resolve_block(block_name):
+                # Counted by the block's own stage, not the page's
+                timer.pause()
+                try:
+                    return resolve("logic_block." + block_name, product, results)
+                finally:
+                    timer.resume()
+
+            blocks = LazyLogicBlocks(product, block_names, resolve_block)
+            with timer:
+                return generate(product, results, blocks)
+
+        return run
+
+    def _write(self, orchestrator):
+        page_types = self.page_types
+
+        def run(product, results):
+            payloads = {
+                page_type: results["payload." + page_type]
+                for page_type in page_types
+                if "payload." + page_type in results
+            }
+            orchestrator.save_product_pages(product.name, payloads)
+
+        return run
+
+    def page_targets(self, page_types: Optional[Iterable[str]] = None, node_kind: str = "page") -> Tuple[str, ...]:
+        """
+        Target node names for the requested page types.
+
+        Args:
+            page_types: Page types to generate (default: all)
+            node_kind: "page" for page models or "payload" for encoded pages
+
+        Returns:
+            Tuple of node names, e.g. ("page.faq", "page.product")
+        """
+        wanted = self.page_types if page_types is None else [t for t in self.page_types if t in page_types]
+        return tuple(f"{node_kind}.{page_type}" for page_type in wanted)
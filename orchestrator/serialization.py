@@ -0,0 +1,191 @@
+"""
+PageSerializer: Encodes page models straight to UTF-8 JSON bytes.
+Responsibility: Output encoding only - page content is decided by the page agents.
+
+The serializer walks FAQPage, ProductPage and ComparisonPage directly
+instead of building the to_dict() tree first. Pretty mode (indent=2)
+produces exactly what json.dump(page.to_dict(), indent=2,
+ensure_ascii=False) writes; compact mode drops all whitespace.
+Other page types fall back to to_dict() and the json module.
+"""
+
+import json
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Optional
+
+from models import FAQPage, ProductPage, ComparisonPage
+
+
+# Nesting depth of the deepest structure written by the page walkers
+_MAX_DEPTH = 6
+
+
+class PageSerializer:
+    """
+    Serializes page models to JSON bytes.
+
+    Usage:
+        serializer = PageSerializer(indent=2)     # pretty, matches json.dump
+        serializer = PageSerializer(indent=None)  # compact production output
+        data = serializer.serialize(page)
+    """
+
+    def __init__(self, indent: Optional[int] = 2):
+        """
+        Initialize serializer.
+
+        Args:
+            indent: Spaces per nesting level, or None for compact output
+        """
+        self.indent = indent
+        if indent is None:
+            self._newlines = [""] * (_MAX_DEPTH + 1)
+            self._colon = ":"
+            self._separators = (",", ":")
+        else:
+            self._newlines = ["\n" + " " * (indent * level) for level in range(_MAX_DEPTH + 1)]
+            self._colon = ": "
+            self._separators = (",", ": ")
+        self._writers: Dict[type, Callable[[Any, List[str]], None]] = {
+            FAQPage: self._write_faq_page,
+            ProductPage: self._write_product_page,
+            ComparisonPage: self._write_comparison_page,
+        }
+
+    def serialize(self, page: Any) -> bytes:
+        """
+        Encode a page model as UTF-8 JSON.
+
+        Args:
+            page: FAQPage, ProductPage, ComparisonPage or any model with to_dict()
+
+        Returns:
+            Encoded JSON document (no trailing newline, like json.dump)
+        """
+        writer = self._writers.get(type(page))
+        if writer is None:
+            return self._dumps(page.to_dict(), 0).encode("utf-8")
+        out: List[str] = []
+        writer(page, out)
+        return "".join(out).encode("utf-8")
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def _dumps(self, value: Any, level: int) -> str:
+        """Encode an arbitrary value with the json module at a nesting level."""
+        text = json.dumps(value, indent=self.indent, separators=self._separators, ensure_ascii=False)
+        if level and self.indent is not None:
+            text = text.replace("\n", self._newlines[level])
+        return text
+
+    def _value(self, value: Any, level: int) -> str:
+        """Encode a field value; strings and string lists take the fast path."""
+        if type(value) is str:
+            return encode_basestring(value)
+        if value is None:
+            return "null"
+        if type(value) in (list, tuple) and all(type(item) is str for item in value):
+            if not value:
+                return "[]"
+            inner = self._newlines[level + 1]
+            return (
+                "[" + inner
+                + ("," + inner).join(map(encode_basestring, value))
+                + self._newlines[level] + "]"
+            )
+        return self._dumps(value, level)
+
+    # ------------------------------------------------------------------
+    # Page walkers
+    # ------------------------------------------------------------------
+
+    def _write_faq_page(self, page: FAQPage, out: List[str]) -> None:
+        nl1, nl2, nl3 = self._newlines[1:4]
+        colon = self._colon
+        value = self._value
+        out += (
+            "{", nl1, '"page_type"', colon, value(page.page_type, 1),
+            ",", nl1, '"product_name"', colon, value(page.product_name, 1),
+            ",", nl1, '"total_questions"', colon, self._dumps(page.total_questions, 1),
+            ",", nl1, '"faqs"', colon,
+        )
+        if page.faqs:
+            out.append("[")
+            separator = nl2
+            for faq in page.faqs:
+                out += (
+                    separator, "{",
+                    nl3, '"question"', colon, value(faq.question, 3),
+                    ",", nl3, '"answer"', colon, value(faq.answer, 3),
+                    ",", nl3, '"category"', colon, value(faq.category, 3),
+                    nl2, "}",
+                )
+                separator = "," + nl2
+            out += (nl1, "]")
+        else:
+            out.append("[]")
+        out += (self._newlines[0], "}")
+
+    def _write_product_page(self, page: ProductPage, out: List[str]) -> None:
+        nl1, nl2, nl3, nl4 = self._newlines[1:5]
+        colon = self._colon
+        value = self._value
+        out += (
+            "{", nl1, '"page_type"', colon, value(page.page_type, 1),
+            ",", nl1, '"product_name"', colon, value(page.product_name, 1),
+            ",", nl1, '"sections"', colon,
+        )
+        if page.sections:
+            out.append("{")
+            section_separator = nl2
+            for section_name, fields in page.sections.items():
+                out += (section_separator, encode_basestring(section_name), colon)
+                section_separator = "," + nl2
+                if not fields:
+                    out.append("[]")
+                    continue
+                out.append("[")
+                separator = nl3
+                for page_field in fields:
+                    out += (
+                        separator, "{",
+                        nl4, '"label"', colon, value(page_field.label, 4),
+                        ",", nl4, '"value"', colon, value(page_field.value, 4),
+                        ",", nl4, '"data_type"', colon, value(page_field.data_type, 4),
+                        nl3, "}",
+                    )
+                    separator = "," + nl3
+                out += (nl2, "]")
+            out += (nl1, "}")
+        else:
+            out.append("{}")
+        out += (self._newlines[0], "}")
+
+    def _write_comparison_page(self, page: ComparisonPage, out: List[str]) -> None:
+        nl1, nl2, nl3 = self._newlines[1:4]
+        colon = self._colon
+        value = self._value
+        out += (
+            "{", nl1, '"page_type"', colon, value(page.page_type, 1),
+            ",", nl1, '"product_a_name"', colon, value(page.product_a_name, 1),
+            ",", nl1, '"product_b_name"', colon, value(page.product_b_name, 1),
+            ",", nl1, '"comparison_items"', colon,
+        )
+        if page.comparison_items:
+            out.append("[")
+            separator = nl2
+            for item in page.comparison_items:
+                out += (
+                    separator, "{",
+                    nl3, '"attribute"', colon, value(item.attribute, 3),
+                    ",", nl3, '"product_a"', colon, value(item.product_a, 3),
+                    ",", nl3, '"product_b"', colon, value(item.product_b, 3),
+                    nl2, "}",
+                )
+                separator = "," + nl2
+            out += (nl1, "]")
+        else:
+            out.append("[]")
+        out += (self._newlines[0], "}")
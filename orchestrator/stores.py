@@ -0,0 +1,388 @@
+"""
+Page stores: Pack every generated page into a single bundle file.
+Responsibility: Packed output I/O only - pages arrive already encoded.
+
+Bundles:
+- JSON Lines: <output_dir>/pages.jsonl, one {"product_name", "page_type",
+  "page"} object per line, plus a pages.jsonl.idx sidecar of byte offsets
+- SQLite:     <output_dir>/pages.sqlite, table pages keyed by
+  (product_name, page_type)
+
+Stores implement the page writer interface (write/flush/close) and write
+each buffered batch as one sequential append or one transaction. Pages
+are stored single-line, so catalog runs encode them compact. Readers
+fetch one product's pages by key without scanning the bundle. Re-running
+into the same directory appends (JSONL) or replaces rows (SQLite); the
+latest page for a key wins.
+"""
+
+import json
+import os
+import sqlite3
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from orchestrator.archive import ARCHIVE_INDEX_FILENAME, PageArchiveReader
+from orchestrator.dedup import DEDUP_BUNDLE_FILENAME, DedupPageStoreReader
+
+
+JSONL_BUNDLE_FILENAME = "pages.jsonl"
+JSONL_INDEX_SUFFIX = ".idx"
+SQLITE_BUNDLE_FILENAME = "pages.sqlite"
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    product_name TEXT NOT NULL,
+    page_type TEXT NOT NULL,
+    page BLOB NOT NULL,
+    PRIMARY KEY (product_name, page_type)
+) WITHOUT ROWID
+"""
+
+
+class JsonlPageStore:
+    """
+    Appends pages to a JSON Lines bundle with a byte-offset index.
+    """
+
+    # Bundles have a single appender; worker processes hand pages to the parent
+    process_safe = False
+
+    def __init__(self, output_dir: Union[str, Path], buffer_size: int = 1024):
+        """
+        Initialize store. Files are opened on the first write.
+
+        Args:
+            output_dir: Directory holding the bundle
+            buffer_size: Products buffered before a batch is appended
+        """
+        self.path = Path(output_dir) / JSONL_BUNDLE_FILENAME
+        self.index_path = self.path.with_name(self.path.name + JSONL_INDEX_SUFFIX)
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[Tuple[str, Dict[str, bytes]]] = []
+        self._bundle = None
+        self._index = None
+        self._offset = 0
+
+    def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Queue one product's pages for writing.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> single-line encoded JSON page
+        """
+        self._buffer.append((product_name, pages))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all buffered pages and their index entries."""
+        if not self._buffer:
+            return
+        if self._bundle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._bundle = open(self.path, "ab")
+            self._index = open(self.index_path, "a", encoding="utf-8")
+            self._offset = self._bundle.tell()
+
+        buffer, self._buffer = self._buffer, []
+        chunk = bytearray()
+        index_lines = []
+        offset = self._offset
+        for product_name, pages in buffer:
+            name = encode_basestring(product_name)
+            for page_type, data in pages.items():
+                if b"\n" in data:
+                    raise ValueError(f"Page {page_type!r} of {product_name!r} is not single-line JSON")
+                prefix = f'{{"product_name":{name},"page_type":{encode_basestring(page_type)},"page":'.encode("utf-8")
+                start = offset + len(chunk) + len(prefix)
+                chunk += prefix
+                chunk += data
+                chunk += b"}\n"
+                index_lines.append(json.dumps([product_name, page_type, start, len(data)], ensure_ascii=False))
+
+        self._bundle.write(chunk)
+        self._bundle.flush()
+        self._offset = offset + len(chunk)
+        # The index is written after its data, so every entry points at complete bytes
+        self._index.write("\n".join(index_lines) + "\n")
+        self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close the bundle."""
+        self.flush()
+        if self._bundle is not None:
+            self._bundle.close()
+            self._index.close()
+            self._bundle = self._index = None
+
+    def committed_state(self) -> Dict[str, int]:
+        """Sizes of the flushed bundle and index, stored in catalog checkpoints."""
+        if self._bundle is not None:
+            return {"bundle_size": self._offset, "index_size": self._index.tell()}
+        return {
+            "bundle_size": self.path.stat().st_size if self.path.exists() else 0,
+            "index_size": self.index_path.stat().st_size if self.index_path.exists() else 0,
+        }
+
+    def restore(self, state: Optional[Dict[str, int]]) -> None:
+        """
+        Truncate the bundle and index to a checkpoint, dropping lines
+        appended after it (including a torn final line).
+        """
+        if not state or self._bundle is not None:
+            return
+        for path, size in ((self.path, state["bundle_size"]), (self.index_path, state["index_size"])):
+            if path.exists():
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+
+class SqlitePageStore:
+    """
+    Stores pages in a SQLite database, one transaction per buffered batch.
+    """
+
+    # SQLite serializes writers; worker processes hand pages to the parent
+    process_safe = False
+
+    def __init__(self, output_dir: Union[str, Path], buffer_size: int = 1024):
+        """
+        Initialize store. The database is opened on the first write.
+
+        Args:
+            output_dir: Directory holding the database
+            buffer_size: Products buffered before a batch is committed
+        """
+        self.path = Path(output_dir) / SQLITE_BUNDLE_FILENAME
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[Tuple[str, Dict[str, bytes]]] = []
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Queue one product's pages for writing.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> encoded JSON page
+        """
+        self._buffer.append((product_name, pages))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all buffered pages in one transaction."""
+        if not self._buffer:
+            return
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path))
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SQLITE_SCHEMA)
+
+        buffer, self._buffer = self._buffer, []
+        rows = [
+            (product_name, page_type, data)
+            for product_name, pages in buffer
+            for page_type, data in pages.items()
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pages (product_name, page_type, page) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def committed_state(self) -> None:
+        """Rows are upserted per committed transaction, so no resume point is needed."""
+        return None
+
+    def restore(self, state: None) -> None:
+        """Nothing to discard: re-written rows replace their previous version."""
+
+
+class JsonlPageStoreReader:
+    """
+    Random access to a JSON Lines bundle through its offset index.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Load the offset index (the bundle itself is not scanned).
+
+        Args:
+            path: Bundle path (pages.jsonl) or the directory holding it
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / JSONL_BUNDLE_FILENAME
+        self.path = path
+        self._offsets: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        with open(path.with_name(path.name + JSONL_INDEX_SUFFIX), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    product_name, page_type, offset, length = json.loads(line)
+                    self._offsets.setdefault(product_name, {})[page_type] = (offset, length)
+        self._bundle = open(path, "rb")
+
+    def product_names(self) -> Iterator[str]:
+        """Names of all stored products."""
+        return iter(self._offsets)
+
+    def __contains__(self, product_name: str) -> bool:
+        return product_name in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def get_page(self, product_name: str, page_type: str) -> bytes:
+        """
+        Fetch one encoded page.
+
+        Raises:
+            KeyError: If the page is not in the bundle
+        """
+        offset, length = self._offsets[product_name][page_type]
+        self._bundle.seek(offset)
+        return self._bundle.read(length)
+
+    def get_product(self, product_name: str) -> Dict[str, bytes]:
+        """
+        Fetch all encoded pages of a product.
+
+        Returns:
+            Dictionary of page_type -> encoded JSON page
+
+        Raises:
+            KeyError: If the product is not in the bundle
+        """
+        return {page_type: self.get_page(product_name, page_type) for page_type in self._offsets[product_name]}
+
+    def close(self) -> None:
+        self._bundle.close()
+
+    def __enter__(self) -> "JsonlPageStoreReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class SqlitePageStoreReader:
+    """
+    Keyed lookups in a SQLite page bundle.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open the database read-only.
+
+        Args:
+            path: Database path (pages.sqlite) or the directory holding it
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / SQLITE_BUNDLE_FILENAME
+        self.path = path
+        self._connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+    def product_names(self) -> Iterator[str]:
+        """Names of all stored products."""
+        rows = self._connection.execute("SELECT DISTINCT product_name FROM pages ORDER BY product_name")
+        return (row[0] for row in rows)
+
+    def __contains__(self, product_name: str) -> bool:
+        row = self._connection.execute("SELECT 1 FROM pages WHERE product_name = ? LIMIT 1", (product_name,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(DISTINCT product_name) FROM pages").fetchone()[0]
+
+    def get_page(self, product_name: str, page_type: str) -> bytes:
+        """
+        Fetch one encoded page.
+
+        Raises:
+            KeyError: If the page is not in the bundle
+        """
+        row = self._connection.execute(
+            "SELECT page FROM pages WHERE product_name = ? AND page_type = ?",
+            (product_name, page_type),
+        ).fetchone()
+        if row is None:
+            raise KeyError((product_name, page_type))
+        return bytes(row[0])
+
+    def get_product(self, product_name: str) -> Dict[str, bytes]:
+        """
+        Fetch all encoded pages of a product.
+
+        Returns:
+            Dictionary of page_type -> encoded JSON page
+
+        Raises:
+            KeyError: If the product is not in the bundle
+        """
+        rows = self._connection.execute(
+            "SELECT page_type, page FROM pages WHERE product_name = ?",
+            (product_name,),
+        ).fetchall()
+        if not rows:
+            raise KeyError(product_name)
+        return {page_type: bytes(page) for page_type, page in rows}
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqlitePageStoreReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def open_page_store(path: Union[str, Path]):
+    """
+    Open a page bundle for reading.
+
+    Args:
+        path: pages.jsonl, pages.sqlite or pages.dedup.sqlite, or an output
+            directory holding a bundle or a page archive
+
+    Returns:
+        JsonlPageStoreReader, SqlitePageStoreReader, DedupPageStoreReader
+        or PageArchiveReader
+
+    Raises:
+        ValueError: If no supported bundle is found
+    """
+    path = Path(path)
+    if path.is_dir():
+        if (path / ARCHIVE_INDEX_FILENAME).exists():
+            return PageArchiveReader(path)
+        if (path / DEDUP_BUNDLE_FILENAME).exists():
+            return DedupPageStoreReader(path / DEDUP_BUNDLE_FILENAME)
+        if (path / SQLITE_BUNDLE_FILENAME).exists():
+            return SqlitePageStoreReader(path / SQLITE_BUNDLE_FILENAME)
+        if (path / JSONL_BUNDLE_FILENAME).exists():
+            return JsonlPageStoreReader(path / JSONL_BUNDLE_FILENAME)
+        raise ValueError(f"No page bundle found in {path}")
+    if path.name.endswith(".dedup.sqlite"):
+        return DedupPageStoreReader(path)
+    if path.suffix == ".jsonl":
+        return JsonlPageStoreReader(path)
+    if path.suffix in (".sqlite", ".db"):
+        return SqlitePageStoreReader(path)
+    raise ValueError(f"Unsupported page bundle: {path}")
@@ -0,0 +1,339 @@
+"""
+Page writers: Persist encoded pages for catalog runs.
+Responsibility: Output layout and file I/O only - pages arrive already encoded.
+
+Layouts:
+- flat:    <output_dir>/<product-slug>/<page>.json
+- sharded: <output_dir>/<h0h1>/<h2h3>/<product-slug>/<page>.json, where
+           h is the SHA-1 hex digest of the product slug, so no directory
+           grows beyond a few hundred entries even for millions of products
+- jsonl:   <output_dir>/pages.jsonl bundle with an offset index
+- sqlite:  <output_dir>/pages.sqlite bundle
+- archive: <output_dir>/pages.dat + pages.idx memory-mapped archive
+- dedup:   <output_dir>/pages.dedup.sqlite content-addressed bundle
+
+Packed layouts (jsonl, sqlite, archive, dedup) put every page in one
+bundle instead; see orchestrator.stores, orchestrator.archive and
+orchestrator.dedup.
+
+Writes are buffered and flushed in batches. Every file is written to a
+temporary name in its final directory and renamed into place, so readers
+never see partial JSON. A product's files are renamed together after all
+of them have been written.
+"""
+
+import hashlib
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from orchestrator.archive import PageArchiveWriter
+from orchestrator.catalog import product_key
+from orchestrator.dedup import DedupPageStore
+from orchestrator.stores import JsonlPageStore, SqlitePageStore
+
+
+# Output filename for each page type
+PAGE_FILENAMES = {
+    "faq": "faq.json",
+    "product": "product_page.json",
+    "comparison": "comparison_page.json",
+}
+
+# Products buffered before a batch is written to disk
+DEFAULT_WRITE_BUFFER = 64
+
+
+class PageWriter:
+    """
+    Buffered, atomic writer for per-product page files.
+    Subclasses choose the directory for each product (see product_dir).
+    """
+
+    # Separate processes may write disjoint products concurrently
+    process_safe = True
+
+    def __init__(self, output_dir: Union[str, Path], buffer_size: int = DEFAULT_WRITE_BUFFER, fsync: bool = False):
+        """
+        Initialize writer.
+
+        Args:
+            output_dir: Root output directory
+            buffer_size: Products buffered before writing a batch
+            fsync: fsync each file before renaming it into place
+        """
+        self.output_dir = Path(output_dir)
+        self.buffer_size = max(1, buffer_size)
+        self.fsync = fsync
+        self._buffer: List[Tuple[str, Dict[str, bytes]]] = []
+        self._created_dirs: Set[Path] = set()
+        self._tmp_suffix = f".{os.getpid()}.tmp"
+
+    def product_dir(self, product_name: str) -> Path:
+        """
+        Directory holding a product's pages.
+
+        Args:
+            product_name: Product display name
+
+        Returns:
+            Directory path for this writer's layout
+        """
+        raise NotImplementedError
+
+    def page_path(self, product_name: str, page_type: str) -> Path:
+        """Path of one page file for a product."""
+        return self.product_dir(product_name) / PAGE_FILENAMES[page_type]
+
+    def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """
+        Queue one product's pages for writing.
+
+        Args:
+            product_name: Product display name
+            pages: Dictionary of page_type -> encoded JSON page
+        """
+        self._buffer.append((product_name, pages))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered products to disk."""
+        buffer, self._buffer = self._buffer, []
+        for product_name, pages in buffer:
+            self._commit(self.product_dir(product_name), pages)
+
+    def close(self) -> None:
+        """Flush remaining buffered products."""
+        self.flush()
+
+    def committed_state(self) -> Optional[Dict[str, int]]:
+        """
+        Resume point of flushed output, stored in catalog checkpoints.
+        Files are replaced atomically, so directory layouts need none.
+        """
+        return None
+
+    def restore(self, state: Optional[Dict[str, int]]) -> None:
+        """Discard output written after a checkpoint (see committed_state)."""
+
+    def __enter__(self) -> "PageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _commit(self, directory: Path, pages: Dict[str, bytes]) -> None:
+        """Write a product's pages to temp files, then rename them into place."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
+        staged = []
+        for page_type, data in pages.items():
+            path = directory / PAGE_FILENAMES[page_type]
+            tmp_path = path.with_name(path.name + self._tmp_suffix)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            staged.append((tmp_path, path))
+
+        for tmp_path, path in staged:
+            os.replace(tmp_path, path)
+
+
+class DirectoryWriter(PageWriter):
+    """Flat layout: one subdirectory per product under the output directory."""
+
+    def product_dir(self, product_name: str) -> Path:
+        return self.output_dir / product_key(product_name)
+
+
+class ShardedWriter(PageWriter):
+    """
+    Sharded layout: product subdirectories nested under hash-prefix directories.
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        buffer_size: int = DEFAULT_WRITE_BUFFER,
+        fsync: bool = False,
+        depth: int = 2,
+        width: int = 2,
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            output_dir: Root output directory
+            buffer_size: Products buffered before writing a batch
+            fsync: fsync each file before renaming it into place
+            depth: Number of nested shard directories
+            width: Hex digits per shard directory name
+        """
+        super().__init__(output_dir, buffer_size, fsync)
+        self.depth = depth
+        self.width = width
+
+    def product_dir(self, product_name: str) -> Path:
+        key = product_key(product_name)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        shards = [digest[level * self.width:(level + 1) * self.width] for level in range(self.depth)]
+        return self.output_dir.joinpath(*shards, key)
+
+    def flush(self) -> None:
+        """Write all buffered products, grouped by shard directory."""
+        buffer, self._buffer = self._buffer, []
+        batch = [(self.product_dir(product_name), pages) for product_name, pages in buffer]
+        batch.sort(key=lambda entry: entry[0])  # stable: repeated products keep write order
+        for directory, pages in batch:
+            self._commit(directory, pages)
+
+
+class BackgroundWriter:
+    """
+    Runs another writer on a background I/O thread.
+
+    write() only enqueues, so CPU-bound stages never wait on disk unless
+    the queue is full. Errors raised on the I/O thread are re-raised by
+    the next write(), flush() or close(); close() always closes the wrapped
+    writer first.
+    """
+
+    def __init__(self, writer: PageWriter, max_pending: int = 1024):
+        """
+        Initialize writer.
+
+        Args:
+            writer: Writer that performs the actual file I/O
+            max_pending: Products queued before write() blocks
+        """
+        self.writer = writer
+        self._queue: "queue.Queue" = queue.Queue(max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def process_safe(self) -> bool:
+        """Whether the wrapped writer supports concurrent writer processes."""
+        return self.writer.process_safe
+
+    def product_dir(self, product_name: str) -> Path:
+        """Directory holding a product's pages."""
+        return self.writer.product_dir(product_name)
+
+    def page_path(self, product_name: str, page_type: str) -> Path:
+        """Path of one page file for a product."""
+        return self.writer.page_path(product_name, page_type)
+
+    def write(self, product_name: str, pages: Dict[str, bytes]) -> None:
+        """Queue one product's pages for the I/O thread."""
+        self._raise_error()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="page-writer", daemon=True)
+            self._thread.start()
+        self._queue.put((product_name, pages))
+
+    def flush(self) -> None:
+        """Wait until every queued product has been written to disk."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._queue.join()
+        self._raise_error()
+
+    def committed_state(self) -> Optional[Dict[str, int]]:
+        """Resume point of the wrapped writer; call after flush()."""
+        return self.writer.committed_state()
+
+    def restore(self, state: Optional[Dict[str, int]]) -> None:
+        """Discard output written after a checkpoint; call before writing."""
+        self.writer.restore(state)
+
+    def close(self) -> None:
+        """Flush, close the wrapped writer and stop the I/O thread."""
+        if self._thread is None:
+            self.writer.close()
+            return
+        self._queue.put(StopIteration)
+        self._thread.join()
+        self._thread = None
+        self._raise_error()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is StopIteration:
+                    # Even after an error: release the file or database handle
+                    # and commit what the wrapped writer still buffers
+                    self.writer.close()
+                    return
+                if self._error is None:
+                    if task is None:
+                        self.writer.flush()
+                    else:
+                        self.writer.write(*task)
+            except BaseException as error:  # surfaced on the caller's thread
+                if self._error is None:
+                    self._error = error  # the first error is the one re-raised
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+# Writer class for each output layout
+OUTPUT_LAYOUTS = {
+    "flat": DirectoryWriter,
+    "sharded": ShardedWriter,
+    "jsonl": JsonlPageStore,
+    "sqlite": SqlitePageStore,
+    "archive": PageArchiveWriter,
+    "dedup": DedupPageStore,
+}
+
+# Layouts that pack every page into one bundle (pages stored compact)
+PACKED_LAYOUTS = ("jsonl", "sqlite", "archive", "dedup")
+
+
+def make_writer(
+    output_dir: Union[str, Path],
+    layout: str = "flat",
+    buffer_size: int = DEFAULT_WRITE_BUFFER,
+    background: bool = False,
+):
+    """
+    Build a page writer.
+
+    Args:
+        output_dir: Root output directory
+        layout: Output layout name (see OUTPUT_LAYOUTS)
+        buffer_size: Products buffered before writing a batch
+        background: Run file I/O on a background thread
+
+    Returns:
+        Page writer or page store, or BackgroundWriter wrapping one
+
+    Raises:
+        ValueError: If the layout is not supported
+    """
+    if layout not in OUTPUT_LAYOUTS:
+        raise ValueError(f"Unsupported output layout: {layout}")
+    writer = OUTPUT_LAYOUTS[layout](output_dir, buffer_size=buffer_size)
+    if background:
+        return BackgroundWriter(writer)
+    return writer
@@ -0,0 +1,192 @@
+"""
+Tests for the async orchestrator, run against fake async agents and a fake
+FAQ answer backend (no network). The synchronous OrchestratorAgent is the
+reference: the async run must build the same pages from the same products.
+
+Run with:
+    python -m pytest tests
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict, List
+
+from agents.answer_backends import AnswerBackend
+from benchmarks.synthetic import synthetic_catalog
+from orchestrator.async_pipeline import AsyncOrchestratorAgent, AsyncPageSink, AsyncProductAgent
+from orchestrator.pipeline import OrchestratorAgent
+
+
+class FakeEnrichmentService(AsyncProductAgent):
+    """Returns each product unchanged; later products answer sooner, so completions arrive out of order."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.calls = 0
+
+    async def enrich(self, product):
+        self.calls += 1
+        index = int(product.name.rsplit(" ", 1)[1])
+        await asyncio.sleep((self.count - index) * 0.0002)
+        return product
+
+
+class FailingEnrichmentService(AsyncProductAgent):
+    """Fails for one product name, returns the others unchanged."""
+
+    def __init__(self, failing_name: str):
+        self.failing_name = failing_name
+
+    async def enrich(self, product):
+        await asyncio.sleep(0)
+        if product.name == self.failing_name:
+            raise ConnectionError("enrichment service unavailable")
+        return product
+
+
+class FakePageStore(AsyncPageSink):
+    """Keeps every product's pages in memory."""
+
+    def __init__(self):
+        self.pages: Dict[str, Dict[str, bytes]] = {}
+        self.closed = False
+
+    async def write(self, product_name, pages):
+        await asyncio.sleep(0)
+        self.pages[product_name] = pages
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeAnswerBackend(AnswerBackend):
+    """Answers every prompt locally and counts the prompts it was sent."""
+
+    model = "fake"
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+        self.prompts = 0
+
+    def answer_batch(self, prompts, timeout=None):
+        self.calls += 1
+        self.prompts += len(prompts)
+        if self.fail:
+            raise TimeoutError("answer server did not respond")
+        return [f"Fake answer about {prompt.context}." for prompt in prompts]
+
+
+def read_pages(output_dir: str) -> Dict[str, bytes]:
+    """Every output file under a directory, by relative path."""
+    root = Path(output_dir)
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and not path.name.startswith(".")
+    }
+
+
+class AsyncPipelineTest(unittest.TestCase):
+    """AsyncOrchestratorAgent against the synchronous orchestrator."""
+
+    count = 40
+
+    def setUp(self):
+        self.records = list(synthetic_catalog(self.count))
+        self.records.append({"Price": "₹100"})  # Invalid: no product name
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def output_dir(self, name: str) -> str:
+        return str(self.tmp / name)
+
+    def test_pages_match_sync_orchestrator(self):
+        sync_summary = OrchestratorAgent(self.output_dir("sync")).execute_catalog(self.records)
+        store = FakePageStore()
+        orchestrator = AsyncOrchestratorAgent(
+            self.output_dir("async"),
+            enrichment_agents=[FakeEnrichmentService(self.count)],
+            page_sinks=[store],
+        )
+        summary = orchestrator.execute_catalog(self.records)
+
+        self.assertEqual(summary.processed, sync_summary.processed)
+        self.assertEqual(summary.errors, sync_summary.errors)
+        self.assertEqual(read_pages(self.output_dir("async")), read_pages(self.output_dir("sync")))
+        self.assertEqual(len(store.pages), self.count)
+        self.assertTrue(store.closed)
+
+    def test_results_written_in_catalog_order(self):
+        orchestrator = AsyncOrchestratorAgent(
+            self.output_dir("async"),
+            output_layout="jsonl",
+            enrichment_agents=[FakeEnrichmentService(self.count)],
+        )
+        summary = orchestrator.execute_catalog(self.records, window=16)
+
+        with open(Path(self.output_dir("async")) / "pages.jsonl", "r", encoding="utf-8") as f:
+            names = list(dict.fromkeys(json.loads(line)["product_name"] for line in f))
+        self.assertEqual(names, [record["Product Name"] for record in self.records[:self.count]])
+        self.assertEqual(summary.errors, [f"Record {self.count}: Required field missing: product name"])
+
+    def test_enrichment_failure_is_recorded_and_skipped(self):
+        failing_name = self.records[7]["Product Name"]
+        orchestrator = AsyncOrchestratorAgent(
+            self.output_dir("async"),
+            enrichment_agents=[FailingEnrichmentService(failing_name)],
+        )
+        summary = orchestrator.execute_catalog(self.records)
+
+        self.assertEqual(summary.processed, self.count - 1)
+        self.assertEqual(summary.failed, 2)
+        self.assertTrue(summary.errors[0].startswith("Record 7: Enrichment failed: ConnectionError"))
+        written = {path.split("/")[0] for path in read_pages(self.output_dir("async"))}
+        self.assertEqual(len(written), self.count - 1)
+        self.assertFalse(any(path.startswith("synthetic-serum-7-") for path in written))
+
+    def test_incremental_rerun_skips_unchanged_products(self):
+        prompts: List[int] = []
+        for orchestrator_class in (OrchestratorAgent, AsyncOrchestratorAgent):
+            output_dir = self.output_dir(orchestrator_class.__name__)
+            for run in range(2):
+                backend = FakeAnswerBackend()
+                summary = orchestrator_class(output_dir, incremental=True, answer_backend=backend).execute_catalog(
+                    self.records
+                )
+                prompts.append(backend.prompts)
+                if run == 1:
+                    self.assertEqual(summary.processed, 0)
+                    self.assertEqual(summary.skipped, self.count)
+
+        sync_first, sync_rerun, async_first, async_rerun = prompts
+        self.assertGreater(sync_first, 0)
+        self.assertEqual(async_first, sync_first)
+        self.assertEqual((sync_rerun, async_rerun), (0, 0))
+        self.assertEqual(
+            read_pages(self.output_dir("AsyncOrchestratorAgent")),
+            read_pages(self.output_dir("OrchestratorAgent")),
+        )
+
+    def test_failed_answers_are_not_requested_again_per_product(self):
+        backend = FakeAnswerBackend(fail=True)
+        orchestrator = AsyncOrchestratorAgent(self.output_dir("async"), answer_backend=backend)
+        summary = orchestrator.execute_catalog(self.records)
+
+        # One window: its prompts go out in a few batches, never once per product
+        self.assertEqual(summary.processed, self.count)
+        self.assertEqual(backend.calls, summary.answers["backend_calls"])
+        self.assertLess(backend.calls, self.count)
+        # Every FAQ answer fell back to the local answer table
+        OrchestratorAgent(self.output_dir("local")).execute_catalog(self.records)
+        self.assertEqual(read_pages(self.output_dir("async")), read_pages(self.output_dir("local")))
+
+
+if __name__ == "__main__":
+    unittest.main()